@@ -0,0 +1,184 @@
+"""Re-run analysis functions on stored measurements.
+
+Example:
+
+    pqc-analyze /data/pqc --functions iv,van_der_pauw --jobs 8 --output analysis.csv
+"""
+
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+import analysis_pqc
+import numpy as np
+
+from . import __version__
+from .core.analysis import ANALYSIS_CACHE_FILENAME, AnalysisCache, config_digest, file_digest, find_measurement_files
+from .core.formatter import CSVFormatter
+from .core.npz import load_npz
+from .measurements import measurement_factory
+from .measurements.measurement import KEY_ANALYSIS_FUNCTIONS, KEY_META, KEY_SERIES
+from .measurements.mixins import AnalysisError, AnalysisFunction
+
+__all__ = ["analyze_measurement", "main"]
+
+META_COLUMNS = (
+    "sample_name",
+    "contact_name",
+    "measurement_name",
+    "measurement_type",
+    "start_timestamp",
+)
+
+RESULT_COLUMNS = ("function", "result", "state", "message", "values")
+
+CACHE_SAVE_INTERVAL: int = 500  # save cache every n analyzed files
+
+
+def json_default(obj: Any) -> Any:
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    return str(obj)
+
+
+def load_measurement(filename: str) -> dict:
+    """Return measurement data from JSON or NPZ file."""
+    if filename.endswith(".npz"):
+        return load_npz(filename)
+    with open(filename, "rt", encoding="utf-8") as fp:
+        return json.load(fp)
+
+
+def analyze_measurement(data: dict, functions: Optional[List] = None) -> List[Dict[str, Any]]:
+    """Run analysis functions on measurement data, returns result rows.
+
+    Functions default to the configuration stored with the measurement.
+    """
+    meta = data.get(KEY_META, {})
+    series = data.get(KEY_SERIES, {})
+    if functions is None:
+        functions = data.get(KEY_ANALYSIS_FUNCTIONS, [])
+    measurement_type = meta.get("measurement_type")
+    try:
+        analysis_series = getattr(measurement_factory(measurement_type), "analysis_series", {})
+    except KeyError as exc:
+        return [{"function": "", "result": "", "state": "Error", "message": format(exc), "values": "{}"}]
+    kwargs = {key: np.asarray(series.get(name, []), dtype=float) for key, name in analysis_series.items()}
+    if not kwargs or any(len(values) < 2 for values in kwargs.values()):
+        return []
+    rows = []
+    for config in functions:
+        row = {"function": "", "result": "", "state": "Success", "message": "", "values": "{}"}
+        try:
+            f = AnalysisFunction(config)
+            row["function"] = f.type
+            r = f(**kwargs)
+            row["result"] = type(r).__name__
+            row["values"] = json.dumps(r._asdict(), default=json_default)
+            f.verify(r)
+        except AnalysisError as exc:
+            row.update({"state": "Failed", "message": format(exc)})
+        except Exception as exc:
+            row.update({"state": "Error", "message": format(exc)})
+        rows.append(row)
+    return rows
+
+
+def analyze_file(task: Tuple[str, Optional[List], Optional[str]]) -> Tuple[str, Optional[List[dict]]]:
+    """Analyze measurement file (executed in worker processes), returns file
+    digest and result rows or `None` if digest matches the known digest.
+    """
+    filename, functions, known_digest = task
+    digest = file_digest(filename)
+    if digest == known_digest:
+        return digest, None
+    data = load_measurement(filename)
+    meta = data.get(KEY_META, {})
+    info = {"filename": filename}
+    info.update({key: meta.get(key, "") for key in META_COLUMNS})
+    rows = []
+    for row in analyze_measurement(data, functions):
+        rows.append({**info, **row})
+    return digest, rows
+
+
+def write_table(filename: str, rows: List[Dict[str, Any]]) -> None:
+    with open(filename, "wt", newline="") as fp:
+        fmt = CSVFormatter(fp)
+        for column in ("filename",) + META_COLUMNS + RESULT_COLUMNS:
+            fmt.add_column(column)
+        fmt.write_header()
+        for row in rows:
+            fmt.write_row({column: row.get(column, "") for column in fmt.columns})
+
+
+def parse_functions(value: str) -> List[str]:
+    return [name.strip() for name in value.split(",") if name.strip()]
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="pqc-analyze", description="Re-run analysis functions on stored measurements.")
+    parser.add_argument("paths", metavar="<path>", nargs="+", help="output directory or measurement file (JSON or NPZ)")
+    parser.add_argument("--functions", metavar="<names>", type=parse_functions, help="comma separated analysis functions (default: stored configuration)")
+    parser.add_argument("--output", metavar="<filename>", default="analysis.csv", help="result table (default: analysis.csv)")
+    parser.add_argument("--jobs", metavar="<n>", type=int, help="number of worker processes (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="analyze unchanged files again")
+    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+
+    try:
+        filenames = list(find_measurement_files(args.paths))
+    except ValueError as exc:
+        raise SystemExit(exc)
+
+    cache_filename = os.path.join(os.path.dirname(os.path.abspath(args.output)), ANALYSIS_CACHE_FILENAME)
+    cache = AnalysisCache.load(cache_filename)
+    config = config_digest(args.functions, analysis_pqc.__version__)
+
+    results: Dict[str, List[dict]] = {}
+    tasks = []
+    for filename in filenames:
+        rows = None
+        if not args.force:
+            digest = cache.digest(filename)
+            rows = cache.get(filename, digest, config) if digest else None
+        if rows is not None:
+            results[filename] = rows
+        else:
+            # Modified files are hashed by the workers, skipped if content is unchanged
+            known_digest = None if args.force else cache.known_digest(filename, config)
+            tasks.append((filename, args.functions, known_digest))
+
+    skipped = len(results)
+    analyzed = 0
+    jobs = args.jobs or os.cpu_count() or 1
+    chunksize = max(1, min(16, len(tasks) // (4 * jobs)))
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        for task, (digest, rows) in zip(tasks, executor.map(analyze_file, tasks, chunksize=chunksize)):
+            filename = task[0]
+            if rows is None:
+                rows = cache.get(filename, digest, config) or []
+                skipped += 1
+            else:
+                analyzed += 1
+            cache.set(filename, digest, config, rows)
+            results[filename] = rows
+            if analyzed and not analyzed % CACHE_SAVE_INTERVAL:
+                cache.save()
+    cache.save()
+
+    rows = [row for filename in filenames for row in results.get(filename, [])]
+    write_table(args.output, rows)
+
+    failed = sum(1 for row in rows if row.get("state") != "Success")
+    print(f"Analyzed {analyzed} file(s), skipped {skipped} unchanged, {failed} failed result(s) written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""Bookkeeping and caching for analysis of measurements."""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+__all__ = [
+    "ANALYSIS_CACHE_FILENAME",
+    "find_measurement_files",
+    "file_digest",
+    "config_digest",
+    "analysis_key",
+    "AnalysisCache",
+    "AnalysisResultCache",
+]
+
+ANALYSIS_CACHE_FILENAME: str = "analysis_cache.json"
+
+MEASUREMENT_SUFFIXES = (".json", ".npz")
+
+
+def find_measurement_files(paths: Iterable[str], suffixes: Tuple[str, ...] = MEASUREMENT_SUFFIXES) -> Iterator[str]:
+    """Yield measurement files of given paths, directories are walked
+    recursively collecting files with suffixes, files are yielded as given.
+
+    If a measurement was written in multiple formats only the file with the
+    first matching suffix is yielded (JSON before NPZ by default).
+    """
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                measurements: Dict[str, str] = {}
+                for filename in sorted(files):
+                    if filename == ANALYSIS_CACHE_FILENAME:
+                        continue
+                    stem, suffix = os.path.splitext(filename)
+                    if suffix not in suffixes:
+                        continue
+                    other = measurements.get(stem)
+                    if other is None or suffixes.index(suffix) < suffixes.index(os.path.splitext(other)[1]):
+                        measurements[stem] = filename
+                for filename in sorted(measurements.values()):
+                    yield os.path.join(root, filename)
+        elif path.endswith(MEASUREMENT_SUFFIXES):
+            yield path
+        else:
+            raise ValueError(f"not a measurement file: {path}")
+
+
+def file_digest(filename: str, chunk_size: int = 1 << 20) -> str:
+    """Return SHA-256 hex digest of file content."""
+    digest = hashlib.sha256()
+    with open(filename, "rb") as fp:
+        for chunk in iter(lambda: fp.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def config_digest(*items: Any) -> str:
+    """Return SHA-256 hex digest of JSON serializable analysis configuration
+    items (key order independent).
+
+    >>> config_digest([{"type": "iv"}], "0.3.1") == config_digest([{"type": "iv"}], "0.3.1")
+    True
+    """
+    data = json.dumps(items, sort_keys=True, default=str)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def analysis_key(function: str, parameters: Dict[str, Any], arguments: Dict[str, Any]) -> str:
+    """Return content address of an analysis call from function name,
+    parameters and argument series (hashed by dtype, shape and data).
+
+    >>> analysis_key("iv", {}, {"i": [1e-9, 2e-9], "v": [0., 1.]}) == analysis_key("iv", {}, {"v": [0., 1.], "i": [1e-9, 2e-9]})
+    True
+    """
+    digest = hashlib.sha256()
+    digest.update(config_digest(function, parameters).encode("utf-8"))
+    for name in sorted(arguments):
+        values = np.ascontiguousarray(arguments[name])
+        digest.update(name.encode("utf-8"))
+        digest.update(f"{values.dtype.str}{values.shape}".encode("utf-8"))
+        digest.update(values.tobytes())
+    return digest.hexdigest()
+
+
+class AnalysisCache:
+    """Persistent cache of analysis results per measurement file, keyed by
+    file and configuration digests.
+
+    >>> cache = AnalysisCache.load("analysis_cache.json")
+    >>> cache.get(filename, digest, config)
+    >>> cache.set(filename, digest, config, rows)
+    >>> cache.save()
+    """
+
+    def __init__(self, filename: str, entries: Optional[Dict[str, Dict[str, Any]]] = None) -> None:
+        self.filename: str = filename
+        self._lock = threading.RLock()
+        self._entries: Dict[str, Dict[str, Any]] = dict(entries or {})
+
+    @classmethod
+    def load(cls, filename: str) -> "AnalysisCache":
+        entries: Dict[str, Dict[str, Any]] = {}
+        if os.path.exists(filename):
+            with open(filename, "rt", encoding="utf-8") as fp:
+                entries = json.load(fp).get("entries", {})
+        return cls(filename, entries)
+
+    def save(self) -> None:
+        with self._lock:
+            data = {"entries": self._entries}
+            tmp_filename = f"{self.filename}.tmp"
+            with open(tmp_filename, "wt", encoding="utf-8") as fp:
+                json.dump(data, fp, default=str)
+            os.replace(tmp_filename, self.filename)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def digest(self, filename: str) -> Optional[str]:
+        """Return cached file digest if the file was not modified since (same
+        size and modification time), else `None`.
+        """
+        with self._lock:
+            entry = self._entries.get(os.path.abspath(filename))
+        if entry is None:
+            return None
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            return None
+        if [stat.st_size, stat.st_mtime_ns] != entry.get("stat"):
+            return None
+        return entry.get("digest")
+
+    def known_digest(self, filename: str, config: str) -> Optional[str]:
+        """Return last analyzed file digest if configuration digest matches."""
+        with self._lock:
+            entry = self._entries.get(os.path.abspath(filename))
+        if entry is None or entry.get("config") != config:
+            return None
+        return entry.get("digest")
+
+    def get(self, filename: str, digest: str, config: str) -> Optional[List[dict]]:
+        """Return cached result rows if file and configuration digests match."""
+        with self._lock:
+            entry = self._entries.get(os.path.abspath(filename))
+        if entry is None or entry.get("digest") != digest or entry.get("config") != config:
+            return None
+        return entry.get("rows", [])
+
+    def set(self, filename: str, digest: str, config: str, rows: List[dict]) -> None:
+        stat = os.stat(filename)
+        with self._lock:
+            self._entries[os.path.abspath(filename)] = {
+                "stat": [stat.st_size, stat.st_mtime_ns],
+                "digest": digest,
+                "config": config,
+                "rows": list(rows),
+            }
+
+
+class AnalysisResultCache:
+    """Thread safe least recently used cache of analysis results by content
+    address, see `analysis_key`.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self.maxsize: int = maxsize
+        self._lock = threading.RLock()
+        self._results: "OrderedDict[str, Any]" = OrderedDict()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            if key not in self._results:
+                self.misses += 1
+                return None
+            self._results.move_to_end(key)
+            self.hits += 1
+            return self._results[key]
+
+    def set(self, key: str, result: Any) -> None:
+        with self._lock:
+            self._results[key] = result
+            self._results.move_to_end(key)
+            while len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._results.clear()
+            self.hits = 0
+            self.misses = 0
@@ -0,0 +1,153 @@
+"""Coalesce high rate measurement updates for the user interface."""
+
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+__all__ = ["Bounds", "UpdateBuffer"]
+
+
+class Bounds:
+    """Running minimum and maximum of X/Y points, ignoring NaN values.
+
+    >>> bounds = Bounds()
+    >>> bounds.update([1, 3], [-2, 4])
+    >>> bounds.x, bounds.y
+    ((1.0, 3.0), (-2.0, 4.0))
+    """
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.count: int = 0
+        self.x: Optional[Tuple[float, float]] = None
+        self.y: Optional[Tuple[float, float]] = None
+
+    def is_empty(self) -> bool:
+        return self.x is None or self.y is None
+
+    @staticmethod
+    def _merge(limits: Optional[Tuple[float, float]], values: np.ndarray) -> Optional[Tuple[float, float]]:
+        values = values[np.isfinite(values)]
+        if not values.size:
+            return limits
+        minimum, maximum = float(values.min()), float(values.max())
+        if limits is not None:
+            minimum, maximum = min(limits[0], minimum), max(limits[1], maximum)
+        return minimum, maximum
+
+    def update(self, xs, ys) -> None:
+        """Extend bounds by points, `count` advances by number of points."""
+        xs = np.asarray(xs, dtype=float)
+        ys = np.asarray(ys, dtype=float)
+        self.count += len(xs)
+        self.x = self._merge(self.x, xs)
+        self.y = self._merge(self.y, ys)
+
+
+class UpdateBuffer:
+    """Thread safe buffer coalescing readings, state deltas, messages and
+    progress until taken, at most every interval seconds.
+
+    >>> buffer = UpdateBuffer(interval=0.05)
+    >>> buffer.append_readings("hvsrc", [1.0], [2.0])
+    >>> buffer.update_state({"hvsrc_voltage": 1.0})
+    >>> buffer.flush(emit)
+    """
+
+    def __init__(self, interval: float = 0.05) -> None:
+        self.interval: float = interval
+        self._lock = threading.RLock()
+        self._flush_lock = threading.RLock()
+        self._timer: Optional[threading.Timer] = None
+        self._taken: float = 0.
+        self._clear()
+
+    def _clear(self) -> None:
+        self._readings: Dict[str, Tuple[List[np.ndarray], List[np.ndarray]]] = {}
+        self._update: bool = False
+        self._state: Dict[str, Any] = {}
+        self._message: Optional[str] = None
+        self._progress: Optional[Tuple[int, int]] = None
+
+    def append_readings(self, name: str, xs, ys) -> None:
+        with self._lock:
+            chunks = self._readings.setdefault(name, ([], []))
+            chunks[0].append(np.asarray(xs, dtype=float))
+            chunks[1].append(np.asarray(ys, dtype=float))
+
+    def update_readings(self) -> None:
+        with self._lock:
+            self._update = True
+
+    def update_state(self, data: Dict[str, Any]) -> None:
+        with self._lock:
+            self._state.update(data)
+
+    def set_message(self, message: str) -> None:
+        with self._lock:
+            self._message = message
+
+    def set_progress(self, value: int, maximum: int) -> None:
+        with self._lock:
+            self._progress = value, maximum
+
+    def flush(self, emit: Callable[[Dict[str, Any]], None], force: bool = True) -> None:
+        """Pass pending updates to emit if forced or due. If not yet due, a
+        trailing flush is scheduled at the end of the interval so that the
+        last updates of a burst are not held back until the next call.
+        """
+        with self._flush_lock:
+            if force or self.due():
+                # Take and emit while locked to preserve order between threads
+                updates = self.take()
+                if updates:
+                    emit(updates)
+            elif self._timer is None:
+                delay = max(0., self.interval - (time.monotonic() - self._taken))
+                self._timer = threading.Timer(delay, self._trailing_flush, (emit,))
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _trailing_flush(self, emit: Callable[[Dict[str, Any]], None]) -> None:
+        with self._flush_lock:
+            self._timer = None
+            self.flush(emit)
+
+    def cancel(self) -> None:
+        """Cancel a scheduled trailing flush."""
+        with self._flush_lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+    def due(self) -> bool:
+        """Return `True` if interval elapsed since updates were last taken."""
+        return time.monotonic() - self._taken >= self.interval
+
+    def take(self) -> Dict[str, Any]:
+        """Return and clear pending updates, empty dictionary if there are
+        none. Readings are concatenated per name, the latest message and
+        progress win and state deltas are merged.
+        """
+        with self._lock:
+            self._taken = time.monotonic()
+            updates: Dict[str, Any] = {}
+            if self._readings:
+                updates["readings"] = {
+                    name: (np.concatenate(xs), np.concatenate(ys))
+                    for name, (xs, ys) in self._readings.items()
+                }
+            if self._update:
+                updates["update"] = True
+            if self._state:
+                updates["state"] = self._state
+            if self._message is not None:
+                updates["message"] = self._message
+            if self._progress is not None:
+                updates["progress"] = self._progress
+            self._clear()
+            return updates
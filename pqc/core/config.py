@@ -186,12 +186,13 @@ class Sequence:
 class SequenceContact:
     """Sequence contact point."""
 
-    def __init__(self, name: str, contact_id: str, id: Optional[str] = None, enabled: bool = True, description: Optional[str] = None, measurements: Optional[List] = None):
+    def __init__(self, name: str, contact_id: str, id: Optional[str] = None, enabled: bool = True, description: Optional[str] = None, after: Optional[List[str]] = None, measurements: Optional[List] = None):
         self.id: str = id or make_id(name)
         self.name: str = name
         self.contact_id: str = contact_id
         self.enabled: bool = enabled
         self.description: str = description or ""
+        self.after: List[str] = list(map(format, after or []))
         self.measurements: List = list(map(lambda kwargs: SequenceMeasurement(**kwargs), measurements or []))
 
     def __iter__(self) -> Iterable:
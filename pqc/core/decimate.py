@@ -0,0 +1,41 @@
+"""Reduce large series to screen resolution for plotting."""
+
+from typing import Tuple
+
+import numpy as np
+
+__all__ = ["minmax_decimate"]
+
+
+def minmax_decimate(xs, ys, columns: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Return points reduced to the minimum and maximum Y value per X column
+    (e.g. pixel column) in original order, preserving the envelope of the
+    series. Non finite points are dropped, series with no more than two
+    points per column are returned unchanged.
+
+    >>> minmax_decimate([0, 1, 2, 3], [1, 5, 2, 4], columns=1)
+    (array([0., 1.]), array([1., 5.]))
+    """
+    xs = np.asarray(xs, dtype=float)
+    ys = np.asarray(ys, dtype=float)
+    if len(xs) != len(ys):
+        raise ValueError(f"inconsistent series size: {len(xs)} != {len(ys)}")
+    columns = max(1, int(columns))
+    if len(xs) <= 2 * columns:
+        return xs, ys
+    finite = np.isfinite(xs) & np.isfinite(ys)
+    indices = np.flatnonzero(finite)
+    if len(indices) <= 2 * columns:
+        return xs[indices], ys[indices]
+    x, y = xs[indices], ys[indices]
+    minimum, maximum = x.min(), x.max()
+    if maximum > minimum:
+        buckets = np.minimum(((x - minimum) / (maximum - minimum) * columns).astype(np.intp), columns - 1)
+    else:
+        buckets = np.zeros(len(x), dtype=np.intp)
+    # Sort by column then Y, first and last point per column are min and max
+    order = np.lexsort((y, buckets))
+    starts = np.flatnonzero(np.r_[True, np.diff(buckets[order]) != 0])
+    ends = np.r_[starts[1:], len(order)] - 1
+    selected = np.unique(np.concatenate((order[starts], order[ends])))
+    return x[selected], y[selected]
@@ -1,6 +1,6 @@
 import csv
 import os
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 __all__ = ["FormatterError", "Formatter", "CSVFormatter", "PQCFormatter"]
 
@@ -72,6 +72,29 @@ class CSVFormatter(Formatter):
         self._f.write(self.linesep)
         self._has_rows = True
 
+    def write_columns(self, columns: Dict[str, Sequence[Any]]) -> None:
+        """Write rows from columns of equal length, applying column formats.
+
+        All cells are formatted in a single operation, intended for numeric
+        columns (values are not quoted).
+        """
+        names = list(self._fieldnames)
+        size = len(columns[names[0]]) if names else 0
+        if not size:
+            return
+        delimiter = self._writer.writer.dialect.delimiter
+        row_format = delimiter.join(f"{{:{self.format_spec(name)}}}" for name in names) + self.linesep
+        values: List[Any] = []
+        for name in names:
+            column = columns[name]
+            if len(column) != size:
+                raise ValueError(f"inconsistent column size: {name}")
+            values.append(column.tolist() if hasattr(column, "tolist") else list(column))
+        # Interleave columns to rows
+        cells = [value for row in zip(*values) for value in row]
+        self._f.write((row_format * size).format(*cells))
+        self._has_rows = True
+
     def write_line(self, line: str) -> None:
         self._f.write(line)
         self._f.write(os.linesep)
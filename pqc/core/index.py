@@ -0,0 +1,120 @@
+"""Persistent SQLite index of measurement results in an output directory."""
+
+import json
+import os
+import sqlite3
+from typing import Any, Dict, List, Optional
+
+__all__ = ["INDEX_FILENAME", "MeasurementIndex"]
+
+INDEX_FILENAME: str = "index.sqlite"
+
+COLUMNS = (
+    "timestamp",
+    "sample_name",
+    "sample_type",
+    "contact_name",
+    "contact_id",
+    "measurement_name",
+    "measurement_id",
+    "measurement_type",
+    "measurement_state",
+)
+
+
+class MeasurementIndex:
+    """Index of measurement results, stored in a SQLite database.
+
+    >>> with MeasurementIndex("index.sqlite") as index:
+    ...     index.add({"sample_name": "spam", "measurement_type": "iv_ramp"})
+    ...     index.query(sample_name="spam")
+    """
+
+    def __init__(self, filename: str) -> None:
+        self.filename = filename
+        self.connection = sqlite3.connect(filename)
+        self.connection.row_factory = sqlite3.Row
+        self.create_tables()
+
+    @classmethod
+    def from_output_dir(cls, output_dir: str) -> "MeasurementIndex":
+        return cls(os.path.join(output_dir, INDEX_FILENAME))
+
+    def __enter__(self) -> "MeasurementIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def create_tables(self) -> None:
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS measurements ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "timestamp REAL, "
+                "sample_name TEXT, "
+                "sample_type TEXT, "
+                "contact_name TEXT, "
+                "contact_id TEXT, "
+                "measurement_name TEXT, "
+                "measurement_id TEXT, "
+                "measurement_type TEXT, "
+                "measurement_state TEXT, "
+                "files TEXT, "
+                "analysis TEXT)"
+            )
+            for column in ("sample_name", "measurement_type", "measurement_state", "timestamp"):
+                self.connection.execute(f"CREATE INDEX IF NOT EXISTS idx_{column} ON measurements ({column})")
+
+    def add(self, record: Dict[str, Any]) -> int:
+        """Add measurement record, returns row ID."""
+        values = [record.get(column) for column in COLUMNS]
+        values.append(json.dumps(list(record.get("files") or [])))
+        values.append(json.dumps(record.get("analysis") or {}, default=str))
+        names = ", ".join(COLUMNS + ("files", "analysis"))
+        placeholders = ", ".join("?" for _ in values)
+        with self.connection:
+            cursor = self.connection.execute(f"INSERT INTO measurements ({names}) VALUES ({placeholders})", values)
+        return int(cursor.lastrowid or 0)
+
+    def query(self, *, sample_name: Optional[str] = None, measurement_type: Optional[str] = None,
+              measurement_state: Optional[str] = None, contact_name: Optional[str] = None,
+              since: Optional[float] = None, until: Optional[float] = None,
+              limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Return list of measurement records matching all given filters,
+        ordered by timestamp. Names support SQL LIKE wildcards (`%`, `_`).
+        """
+        conditions: List[str] = []
+        values: List[Any] = []
+        for column, value in (
+            ("sample_name", sample_name),
+            ("measurement_type", measurement_type),
+            ("measurement_state", measurement_state),
+            ("contact_name", contact_name),
+        ):
+            if value is not None:
+                conditions.append(f"{column} LIKE ?")
+                values.append(value)
+        if since is not None:
+            conditions.append("timestamp >= ?")
+            values.append(since)
+        if until is not None:
+            conditions.append("timestamp < ?")
+            values.append(until)
+        statement = "SELECT * FROM measurements"
+        if conditions:
+            statement += " WHERE " + " AND ".join(conditions)
+        statement += " ORDER BY timestamp"
+        if limit is not None:
+            statement += " LIMIT ?"
+            values.append(int(limit))
+        records = []
+        for row in self.connection.execute(statement, values):
+            record = dict(row)
+            record["files"] = json.loads(record.get("files") or "[]")
+            record["analysis"] = json.loads(record.get("analysis") or "{}")
+            records.append(record)
+        return records
@@ -0,0 +1,29 @@
+"""Estimate instrument integration times for reading timeouts and polling."""
+
+__all__ = ["ELM_INTEGRATION_RATE", "integration_time", "poll_interval"]
+
+LINE_FREQUENCY: float = 50.0
+"""Power line frequency in Hz."""
+
+ELM_INTEGRATION_RATE: int = 60
+"""Default electrometer integration rate (power line cycles times ten)."""
+
+
+def integration_time(nplc: float, count: int = 1, line_frequency: float = LINE_FREQUENCY) -> float:
+    """Return expected integration time in seconds for a reading of count
+    conversions with nplc power line cycles each.
+
+    >>> integration_time(5.0, count=10)
+    1.0
+    """
+    return abs(nplc) / line_frequency * max(1, count)
+
+
+def poll_interval(duration: float, minimum: float = 0.010, maximum: float = 0.250) -> float:
+    """Return poll interval adapted to expected duration of an operation,
+    polling about four times per duration limited to [minimum, maximum].
+
+    >>> poll_interval(0.1)
+    0.025
+    """
+    return min(maximum, max(minimum, duration / 4.))
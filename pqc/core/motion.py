@@ -0,0 +1,90 @@
+"""Estimate table movement durations and adaptive polling intervals."""
+
+import time
+from typing import Iterator, List, Sequence, Tuple
+
+__all__ = ["move_distance", "move_duration", "poll_intervals", "plan_dodge_move", "Deadline"]
+
+
+def move_distance(start: Sequence[float], stop: Sequence[float]) -> float:
+    """Return longest single axis distance between two positions. Axes move
+    simultaneously, so the longest axis dominates the movement duration.
+
+    >>> move_distance((0, 0, 0), (4.0, -10.0, 0))
+    10.0
+    """
+    return max((abs(b - a) for a, b in zip(start, stop)), default=0.0)
+
+
+def move_duration(distance: float, velocity: float, overhead: float = 0.1) -> float:
+    """Return expected duration in seconds to move distance with velocity
+    (same length units), including a constant overhead for acceleration.
+
+    >>> move_duration(10.0, velocity=5.0)
+    2.1
+    """
+    if velocity <= 0:
+        raise ValueError(f"invalid velocity: {velocity}")
+    return overhead + abs(distance) / velocity
+
+
+def poll_intervals(duration: float, minimum: float = 0.025, maximum: float = 1.0,
+                   factor: float = 1.5) -> Iterator[float]:
+    """Yield poll intervals for an operation of expected duration, starting
+    fast (about ten polls per expected duration) and backing off by factor
+    up to maximum for long running operations.
+
+    >>> intervals = poll_intervals(0.5)
+    >>> [round(next(intervals), 3) for _ in range(3)]
+    [0.05, 0.075, 0.113]
+    """
+    interval = min(maximum, max(minimum, duration / 10.))
+    while True:
+        yield interval
+        interval = min(maximum, interval * factor)
+
+
+def plan_dodge_move(current: Sequence[float], target: Sequence[float],
+                    dodge_height: float) -> List[Tuple[float, float, float]]:
+    """Return absolute waypoints for a short hop between contacts, lowering
+    Z only by dodge height below the lower of both positions (limited to
+    zero) while moving X and Y. Phases without movement are omitted.
+
+    >>> plan_dodge_move((1.0, 1.0, 5.0), (2.0, 1.0, 5.0), 0.5)
+    [(1.0, 1.0, 4.5), (2.0, 1.0, 4.5), (2.0, 1.0, 5.0)]
+    """
+    cx, cy, cz = current
+    tx, ty, tz = target
+    waypoints: List[Tuple[float, float, float]] = []
+    if (cx, cy) != (tx, ty):
+        safe_z = max(0, min(cz, tz) - abs(dodge_height))
+        if cz != safe_z:
+            waypoints.append((cx, cy, safe_z))
+        waypoints.append((tx, ty, safe_z))
+        cz = safe_z
+    if cz != tz:
+        waypoints.append((tx, ty, tz))
+    return waypoints
+
+
+class Deadline:
+    """Global timeout shared by consecutive operations.
+
+    >>> deadline = Deadline(60.0)
+    >>> deadline.expired()
+    False
+    """
+
+    def __init__(self, timeout: float) -> None:
+        self.timeout: float = timeout
+        self._t: float = time.monotonic() + timeout
+
+    def remaining(self) -> float:
+        return max(0.0, self._t - time.monotonic())
+
+    def expired(self) -> bool:
+        return time.monotonic() >= self._t
+
+    def clamp(self, interval: float) -> float:
+        """Return interval limited to remaining time."""
+        return min(interval, self.remaining())
@@ -0,0 +1,82 @@
+"""Binary columnar NPZ data format.
+
+Series are stored as uncompressed typed NumPy arrays in a NPZ (zip) archive,
+additional data (meta, series units, analysis) is stored as UTF-8 encoded
+JSON header in array `__header__`. Uncompressed entries allow memory mapping
+of columns without copying.
+"""
+
+import json
+import mmap
+import struct
+import zipfile
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+__all__ = ["HEADER_KEY", "write_npz", "load_npz"]
+
+HEADER_KEY: str = "__header__"
+
+ZIP_LOCAL_HEADER_SIZE: int = 30
+ZIP_LOCAL_HEADER_FORMAT: str = "<4s5H3I2H"
+
+
+def write_npz(fp, columns: Dict[str, Any], header: Optional[dict] = None, default=None) -> None:
+    """Write columns and JSON header to uncompressed NPZ archive."""
+    arrays = {key: np.asarray(value) for key, value in columns.items()}
+    if HEADER_KEY in arrays:
+        raise KeyError(f"Reserved column name: {HEADER_KEY}")
+    text = json.dumps(header or {}, default=default)
+    arrays[HEADER_KEY] = np.frombuffer(text.encode("utf-8"), dtype=np.uint8)
+    np.savez(fp, **arrays)
+
+
+def _data_offset(fp, info: zipfile.ZipInfo) -> int:
+    """Return offset of entry data within zip file."""
+    fp.seek(info.header_offset)
+    fields = struct.unpack(ZIP_LOCAL_HEADER_FORMAT, fp.read(ZIP_LOCAL_HEADER_SIZE))
+    name_size, extra_size = fields[-2], fields[-1]
+    return info.header_offset + ZIP_LOCAL_HEADER_SIZE + name_size + extra_size
+
+
+def _read_array_header(fp):
+    """Return shape, fortran order and dtype of NPY array at current position."""
+    version = np.lib.format.read_magic(fp)
+    if version == (1, 0):
+        return np.lib.format.read_array_header_1_0(fp)
+    return np.lib.format.read_array_header_2_0(fp)
+
+
+def load_npz(filename: str) -> Dict[str, Any]:
+    """Load NPZ archive written by `write_npz`, returns dictionary with header
+    items and item `series` containing read-only memory mapped columns.
+
+    Compressed entries are read into memory.
+    """
+    series: Dict[str, np.ndarray] = {}
+    header: dict = {}
+    with open(filename, "rb") as fp:
+        buffer = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        with zipfile.ZipFile(fp) as archive:
+            for info in archive.infolist():
+                name = info.filename
+                if name.endswith(".npy"):
+                    name = name[:-4]
+                if info.compress_type == zipfile.ZIP_STORED:
+                    offset = _data_offset(fp, info)
+                    fp.seek(offset)
+                    shape, fortran_order, dtype = _read_array_header(fp)
+                    count = int(np.prod(shape)) if shape else 1
+                    array = np.frombuffer(buffer, dtype=dtype, count=count, offset=fp.tell())
+                    array = array.reshape(shape, order="F" if fortran_order else "C")
+                else:
+                    with archive.open(info) as entry:
+                        array = np.lib.format.read_array(entry, allow_pickle=False)
+                if name == HEADER_KEY:
+                    header = json.loads(array.tobytes().decode("utf-8"))
+                else:
+                    series[name] = array
+    data = dict(header)
+    data["series"] = series
+    return data
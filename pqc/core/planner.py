@@ -0,0 +1,227 @@
+"""Estimate duration of measurement sequences.
+
+Expected durations are calculated from measurement parameters (ramp lengths,
+waiting times, electrometer integration) and refined by a history of measured
+overhead per measurement type and table move.
+"""
+
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from .functions import LinearRange
+from .integration import ELM_INTEGRATION_RATE, integration_time
+
+__all__ = ["TABLE_MOVE_KEY", "plan_measurement", "TimingHistory", "SequencePlanner", "SequenceEstimate"]
+
+TABLE_MOVE_KEY: str = "table_move"
+"""History key for table moves to contacts."""
+
+RAMP_PREFIXES: Tuple[Tuple[str, str], ...] = (
+    ("voltage", "V"),
+    ("bias_voltage", "V"),
+    ("current", "A"),
+)
+
+DEFAULT_POINT_OVERHEAD: float = 0.25  # seconds per ramp point
+DEFAULT_FIXED_OVERHEAD: float = 10.0  # seconds per measurement
+DEFAULT_TABLE_MOVE: float = 20.0  # seconds per table move
+
+ELM_MEASUREMENT_TYPES: Tuple[str, ...] = ("iv_ramp_elm", "iv_ramp_bias_elm", "iv_ramp_bias_elm_multi_step")
+"""Measurement types reading the electrometer once per ramp point."""
+
+DEFAULT_WAITING_TIME: float = 1.0
+DEFAULT_WAITING_TIME_RAMP: float = 0.1
+
+
+def magnitude(value: Any, unit: str, default: float = 0.) -> float:
+    """Return magnitude of quantity (or number) in unit."""
+    if value is None:
+        return default
+    if hasattr(value, "to"):
+        return float(value.to(unit).m)
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def ramp_steps(begin: float, end: float, step: float) -> int:
+    """Return number of steps of a linear ramp."""
+    if not step or begin == end:
+        return 0
+    return len(LinearRange(begin, end, step))
+
+
+def plan_measurement(measurement_type: str, parameters: Dict[str, Any]) -> Tuple[int, float]:
+    """Return number of ramp points and sum of waiting times in seconds
+    resulting from measurement parameters.
+
+    >>> plan_measurement("iv_ramp", {"voltage_start": 0, "voltage_stop": 10, "voltage_step": 1, "waiting_time": 1})
+    (11, 12.0)
+    """
+    points = 0
+    waiting = 0.
+    waiting_time = magnitude(parameters.get("waiting_time"), "s", DEFAULT_WAITING_TIME)
+    for prefix, unit in RAMP_PREFIXES:
+        if f"{prefix}_start" not in parameters or f"{prefix}_stop" not in parameters:
+            continue
+        start = magnitude(parameters.get(f"{prefix}_start"), unit)
+        stop = magnitude(parameters.get(f"{prefix}_stop"), unit)
+        step = magnitude(parameters.get(f"{prefix}_step"), unit)
+        step_before = magnitude(parameters.get(f"{prefix}_step_before"), unit) or step
+        step_after = magnitude(parameters.get(f"{prefix}_step_after"), unit) or step
+        points = ramp_steps(start, stop, step) + 1
+        steps_before = ramp_steps(0, start, step_before)
+        steps_after = ramp_steps(stop, 0, step_after)
+        waiting += points * waiting_time
+        waiting += steps_before * magnitude(parameters.get("waiting_time_before"), "s", DEFAULT_WAITING_TIME_RAMP)
+        waiting += steps_after * magnitude(parameters.get("waiting_time_after"), "s", DEFAULT_WAITING_TIME_RAMP)
+        break
+    else:
+        # Multi step ramps (coarse, fine, coarse)
+        if "v1_stop" in parameters and "v2_stop" in parameters:
+            start = magnitude(parameters.get("voltage_start"), "V")
+            v1 = magnitude(parameters.get("v1_stop"), "V")
+            v2 = magnitude(parameters.get("v2_stop"), "V")
+            stop = magnitude(parameters.get("voltage_stop"), "V")
+            coarse = magnitude(parameters.get("coarse_voltage_step"), "V")
+            fine = magnitude(parameters.get("fine_voltage_step"), "V")
+            points = ramp_steps(start, v1, coarse) + ramp_steps(v1, v2, fine) + ramp_steps(v2, stop, coarse) + 1
+            waiting += points * waiting_time
+    for key in ("waiting_time_start", "waiting_time_end", "bias_waiting_time_start"):
+        waiting += magnitude(parameters.get(key), "s")
+    if measurement_type in ELM_MEASUREMENT_TYPES or "elm_integration_rate" in parameters:
+        nplc = magnitude(parameters.get("elm_integration_rate"), "", ELM_INTEGRATION_RATE) / 10.
+        count = 1
+        if parameters.get("elm_filter_enable"):
+            count = int(magnitude(parameters.get("elm_filter_count"), "", 10))
+        waiting += points * integration_time(nplc, count)
+    return points, waiting
+
+
+class TimingHistory:
+    """Persistent history of measured overhead (duration minus planned
+    waiting times) per key, fitted as `fixed + per_point * points` with
+    exponentially decaying weights so that recent runs dominate.
+
+    Thread safe, can be updated while estimated by another thread.
+    """
+
+    decay: float = 0.9
+
+    def __init__(self, entries: Optional[Dict[str, Dict[str, float]]] = None) -> None:
+        self._lock = threading.RLock()
+        self._entries: Dict[str, Dict[str, float]] = {}
+        for key, entry in (entries or {}).items():
+            self._entries[key] = {name: float(entry.get(name, 0.)) for name in ("n", "sx", "sy", "sxx", "sxy")}
+
+    @classmethod
+    def from_dict(cls, data: Optional[dict]) -> "TimingHistory":
+        return cls(data or {})
+
+    def to_dict(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {key: dict(entry) for key, entry in self._entries.items()}
+
+    def record(self, key: str, duration: float, points: int = 0, waiting: float = 0.) -> None:
+        """Record measured duration in seconds for planned points and
+        waiting time."""
+        x = float(points)
+        y = max(0., duration - waiting)
+        with self._lock:
+            entry = self._entries.setdefault(key, {"n": 0., "sx": 0., "sy": 0., "sxx": 0., "sxy": 0.})
+            for name in entry:
+                entry[name] *= self.decay
+            entry["n"] += 1.
+            entry["sx"] += x
+            entry["sy"] += y
+            entry["sxx"] += x * x
+            entry["sxy"] += x * y
+
+    def overhead(self, key: str, points: int = 0) -> float:
+        """Return expected overhead in seconds for key and number of points."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if not entry or entry["n"] <= 0:
+                if key == TABLE_MOVE_KEY:
+                    return DEFAULT_TABLE_MOVE
+                return DEFAULT_FIXED_OVERHEAD + DEFAULT_POINT_OVERHEAD * points
+            n, sx, sy, sxx, sxy = (entry[name] for name in ("n", "sx", "sy", "sxx", "sxy"))
+        mean_x, mean_y = sx / n, sy / n
+        variance = sxx / n - mean_x ** 2
+        if variance > 1e-6:
+            slope = max(0., (sxy / n - mean_x * mean_y) / variance)
+        else:
+            slope = DEFAULT_POINT_OVERHEAD if points else 0.
+        return max(0., mean_y + slope * (points - mean_x))
+
+
+class SequencePlanner:
+    """Plan expected durations of sequence tree items."""
+
+    def __init__(self, history: Optional[TimingHistory] = None) -> None:
+        self.history: TimingHistory = history or TimingHistory()
+
+    def estimate_measurement(self, measurement_type: str, parameters: Dict[str, Any]) -> float:
+        points, waiting = plan_measurement(measurement_type, parameters)
+        return waiting + self.history.overhead(measurement_type, points)
+
+    def plan(self, item, move_to_contact: bool = False) -> List[Tuple[object, float]]:
+        """Return list of (item, seconds) steps for enabled contact (table
+        moves) and measurement items of a sequence, group, sample, contact or
+        measurement item.
+        """
+        steps: List[Tuple[object, float]] = []
+        item_type = getattr(item, "item_type", None)
+        children = [child for child in item.children() if child.isEnabled()] if hasattr(item, "children") else []
+        if item_type == "contact":
+            if move_to_contact and item.hasPosition():
+                steps.append((item, self.history.overhead(TABLE_MOVE_KEY)))
+            for child in children:
+                steps.extend(self.plan(child, move_to_contact))
+        elif item_type in (None, "group", "sample"):
+            for child in children:
+                steps.extend(self.plan(child, move_to_contact))
+        else:
+            steps.append((item, self.estimate_measurement(item_type, item.parameters)))
+        return steps
+
+
+class SequenceEstimate:
+    """Track remaining duration of planned sequence steps.
+
+    >>> estimate = SequenceEstimate(SequencePlanner().plan(sample_item))
+    >>> estimate.complete(measurement_item)
+    >>> estimate.remaining()
+    """
+
+    def __init__(self, steps: List[Tuple[object, float]]) -> None:
+        self._steps: List[Tuple[object, float]] = list(steps)
+        self._total: float = sum(seconds for _, seconds in self._steps)
+        self._start: float = time.time()
+
+    @property
+    def total(self) -> float:
+        return self._total
+
+    def complete(self, item) -> None:
+        """Mark steps of item as done."""
+        self._steps = [(other, seconds) for other, seconds in self._steps if other is not item]
+
+    def remaining(self) -> float:
+        """Return expected remaining duration in seconds."""
+        return sum(seconds for _, seconds in self._steps)
+
+    def eta(self) -> float:
+        """Return expected timestamp of completion."""
+        return time.time() + self.remaining()
+
+    def asdict(self) -> Dict[str, float]:
+        remaining = self.remaining()
+        return {
+            "start": self._start,
+            "total": self._total,
+            "remaining": remaining,
+            "eta": time.time() + remaining,
+        }
@@ -0,0 +1,84 @@
+"""Run independent probes concurrently with individual deadlines."""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Optional
+
+__all__ = ["ProbeResult", "run_probes"]
+
+
+class ProbeResult:
+    """Outcome of a single probe, `error` is a `TimeoutError` if the probe
+    missed its deadline.
+    """
+
+    __slots__ = ("name", "value", "error", "latency")
+
+    def __init__(self, name: str, value: Any = None, error: Optional[BaseException] = None, latency: float = 0.) -> None:
+        self.name: str = name
+        self.value: Any = value
+        self.error: Optional[BaseException] = error
+        self.latency: float = latency
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.name!r}, value={self.value!r}, error={self.error!r}, latency={self.latency:.3f})"
+
+
+def run_probes(
+    probes: Dict[str, Callable[[], Any]],
+    timeouts: Dict[str, float],
+    callback: Callable[[ProbeResult], None],
+    default_timeout: float = 10.0,
+    max_workers: Optional[int] = None,
+) -> Dict[str, ProbeResult]:
+    """Run probes in a thread pool, `callback` is called (on the calling
+    thread) with each result as soon as it arrives or its deadline expires.
+    Probes missing their deadline are abandoned, their threads are not
+    waited for. Returns results by probe name.
+
+    >>> run_probes({"a": lambda: 42}, {}, print)
+    ProbeResult('a', value=42, error=None, latency=0.000)
+    """
+    results: Dict[str, ProbeResult] = {}
+    if not probes:
+        return results
+    executor = ThreadPoolExecutor(max_workers=max_workers or len(probes), thread_name_prefix="probe")
+    start = time.monotonic()
+    started: Dict[str, float] = {}
+
+    def run(name: str, probe: Callable[[], Any]) -> Any:
+        started[name] = time.monotonic()
+        return probe()
+
+    pending: Dict[Future, str] = {}
+    deadlines: Dict[str, float] = {}
+    try:
+        for name, probe in probes.items():
+            pending[executor.submit(run, name, probe)] = name
+            deadlines[name] = start + timeouts.get(name, default_timeout)
+        while pending:
+            now = time.monotonic()
+            next_deadline = min(deadlines[name] for name in pending.values())
+            done, _ = wait(list(pending), timeout=max(0., next_deadline - now), return_when=FIRST_COMPLETED)
+            now = time.monotonic()
+            for future in done:
+                name = pending.pop(future)
+                latency = now - started.get(name, start)
+                error = future.exception()
+                value = None if error else future.result()
+                results[name] = ProbeResult(name, value, error, latency)
+                callback(results[name])
+            for future, name in list(pending.items()):
+                if now >= deadlines[name]:
+                    del pending[future]
+                    future.cancel()
+                    error = TimeoutError(f"{name}: no response within {deadlines[name] - start:.1f} s")
+                    results[name] = ProbeResult(name, None, error, now - started.get(name, start))
+                    callback(results[name])
+    finally:
+        executor.shutdown(wait=False)
+    return results
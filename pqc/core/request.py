@@ -1,7 +1,26 @@
+import heapq
+import itertools
 import threading
-from typing import Any, Callable, Optional
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
 
-__all__ = ["RequestTimeout", "Request"]
+__all__ = [
+    "PRIORITY_CRITICAL",
+    "PRIORITY_NORMAL",
+    "PRIORITY_MONITORING",
+    "RequestTimeout",
+    "Request",
+    "RequestQueue",
+]
+
+PRIORITY_CRITICAL: int = 0
+"""Requests of running measurements."""
+
+PRIORITY_NORMAL: int = 1
+"""User triggered requests."""
+
+PRIORITY_MONITORING: int = 2
+"""Periodic monitoring requests."""
 
 
 class RequestTimeout(Exception):
@@ -13,8 +32,11 @@ class Request:
 
     timeout: float = 4.0
 
-    def __init__(self, target: Callable) -> None:
+    def __init__(self, target: Callable, priority: int = PRIORITY_NORMAL, key: Optional[Hashable] = None) -> None:
         self._target: Callable = target
+        self.priority: int = priority
+        self.key: Optional[Hashable] = key
+        self.created: float = time.monotonic()
         self._ready: threading.Event = threading.Event()
         self._result: Optional[Any] = None
         self._exc: Optional[Exception] = None
@@ -36,3 +58,119 @@ class Request:
                 raise self._exc
             return self._result
         raise RequestTimeout(f"Request timeout: {self._target}")
+
+
+class RequestQueue:
+    """Thread safe priority queue of requests, lower priority values are
+    served first, equal priorities in order of arrival.
+
+    Requests with a key are coalesced with a pending request of the same
+    key: the pending request takes the latest target and the higher
+    priority, the pending request is returned to all callers.
+
+    >>> queue = RequestQueue()
+    >>> a = queue.put(Request(read_pc_data, PRIORITY_MONITORING, key="pc_data"))
+    >>> b = queue.put(Request(read_pc_data, PRIORITY_CRITICAL, key="pc_data"))
+    >>> a is b
+    True
+    """
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._heap: List[Tuple[int, int, Request]] = []
+        self._pending: Dict[Hashable, Request] = {}
+        self._entries: Dict[int, Tuple[int, int, Request]] = {}
+        self._counter = itertools.count()
+        self._depth: int = 0
+        self._metrics: Dict[str, Any] = {}
+        self.reset_metrics()
+
+    def __len__(self) -> int:
+        with self._condition:
+            return self._depth
+
+    def reset_metrics(self) -> None:
+        with self._condition:
+            self._metrics = {
+                "enqueued": 0,
+                "coalesced": 0,
+                "served": 0,
+                "max_depth": 0,
+                "latency": {},
+            }
+
+    def _push(self, request: Request) -> None:
+        entry = (request.priority, next(self._counter), request)
+        self._entries[id(request)] = entry
+        heapq.heappush(self._heap, entry)
+
+    def put(self, request: Request) -> Request:
+        """Enqueue request, returns the pending request it was coalesced
+        with or the request itself."""
+        with self._condition:
+            self._metrics["enqueued"] += 1
+            pending = self._pending.get(request.key) if request.key is not None else None
+            if pending is not None:
+                self._metrics["coalesced"] += 1
+                pending._target = request._target
+                if request.priority < pending.priority:
+                    # Entry with lower priority is skipped when popped
+                    pending.priority = request.priority
+                    self._push(pending)
+                return pending
+            if request.key is not None:
+                self._pending[request.key] = request
+            self._push(request)
+            self._depth += 1
+            self._metrics["max_depth"] = max(self._metrics["max_depth"], self._depth)
+            self._condition.notify()
+            return request
+
+    def get(self, timeout: Optional[float] = None) -> Optional[Request]:
+        """Return next request or `None` if timeout elapsed."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while True:
+                while self._heap:
+                    entry = heapq.heappop(self._heap)
+                    request = entry[2]
+                    if self._entries.get(id(request)) is not entry:
+                        continue  # superseded by coalesced entry
+                    del self._entries[id(request)]
+                    if request.key is not None:
+                        self._pending.pop(request.key, None)
+                    self._depth -= 1
+                    self._record(request)
+                    return request
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return None
+                self._condition.wait(remaining)
+
+    def _record(self, request: Request) -> None:
+        wait = time.monotonic() - request.created
+        self._metrics["served"] += 1
+        latency = self._metrics["latency"].setdefault(request.priority, {"count": 0, "total": 0., "max": 0.})
+        latency["count"] += 1
+        latency["total"] += wait
+        latency["max"] = max(latency["max"], wait)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Return queue depth, counters and queue latency in seconds by
+        priority (mean and maximum)."""
+        with self._condition:
+            latency = {
+                priority: {
+                    "count": entry["count"],
+                    "mean": entry["total"] / entry["count"],
+                    "max": entry["max"],
+                } for priority, entry in sorted(self._metrics["latency"].items())
+            }
+            return {
+                "depth": self._depth,
+                "enqueued": self._metrics["enqueued"],
+                "coalesced": self._metrics["coalesced"],
+                "served": self._metrics["served"],
+                "max_depth": self._metrics["max_depth"],
+                "latency": latency,
+            }
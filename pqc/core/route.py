@@ -0,0 +1,125 @@
+"""Optimize visiting order of table positions to minimize travel."""
+
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from .motion import move_distance
+
+__all__ = ["travel_distance", "route_length", "nearest_neighbour_route", "two_opt_route", "optimize_route"]
+
+Point = Sequence[float]
+Precedence = Iterable[Tuple[int, int]]
+
+
+def travel_distance(a: Point, b: Point) -> float:
+    """Return table travel between X/Y of two positions. X and Y axes move
+    simultaneously, so travel is determined by the longer axis distance.
+
+    >>> travel_distance((0, 0, 1), (3, -4, 2))
+    4
+    """
+    return move_distance(a[:2], b[:2])
+
+
+def route_length(points: Sequence[Point], route: Optional[Sequence[int]] = None,
+                 start: Optional[Point] = None) -> float:
+    """Return total travel visiting points in route order (default is list
+    order), optionally starting from position start.
+    """
+    if route is None:
+        route = range(len(points))
+    path = [points[index] for index in route]
+    if start is not None and path:
+        path.insert(0, start)
+    return sum(travel_distance(a, b) for a, b in zip(path, path[1:]))
+
+
+def _predecessors(count: int, precedence: Precedence) -> Dict[int, Set[int]]:
+    predecessors: Dict[int, Set[int]] = {index: set() for index in range(count)}
+    for before, after in precedence:
+        if not (0 <= before < count and 0 <= after < count):
+            raise IndexError(f"precedence index out of range: {(before, after)}")
+        predecessors[after].add(before)
+    return predecessors
+
+
+def _is_valid(route: Sequence[int], predecessors: Dict[int, Set[int]]) -> bool:
+    ranks = {index: rank for rank, index in enumerate(route)}
+    return all(ranks[before] < ranks[after] for after, befores in predecessors.items() for before in befores)
+
+
+def nearest_neighbour_route(points: Sequence[Point], start: Optional[Point] = None,
+                            precedence: Precedence = ()) -> List[int]:
+    """Return route visiting always the nearest point next whose
+    predecessors (pairs of `(before, after)` indices) were already visited.
+
+    Raises `ValueError` for cyclic precedence constraints.
+    """
+    predecessors = _predecessors(len(points), precedence)
+    remaining = list(range(len(points)))
+    route: List[int] = []
+    current = start
+    while remaining:
+        visited = set(route)
+        candidates = [index for index in remaining if predecessors[index] <= visited]
+        if not candidates:
+            raise ValueError("cyclic precedence constraints")
+        if current is None:
+            index = candidates[0]
+        else:
+            index = min(candidates, key=lambda index: travel_distance(current, points[index]))
+        route.append(index)
+        remaining.remove(index)
+        current = points[index]
+    return route
+
+
+def two_opt_route(points: Sequence[Point], route: Sequence[int], start: Optional[Point] = None,
+                  precedence: Precedence = (), max_iterations: int = 100) -> List[int]:
+    """Return route refined by 2-opt segment reversals (open path) that
+    shorten the travel without violating precedence constraints.
+    """
+    predecessors = _predecessors(len(points), precedence)
+    route = list(route)
+    count = len(route)
+
+    def distance(a: Optional[Point], b: Optional[Point]) -> float:
+        if a is None or b is None:
+            return 0.
+        return travel_distance(a, b)
+
+    for _ in range(max_iterations):
+        improved = False
+        for i in range(count - 1):
+            prev = start if i == 0 else points[route[i - 1]]
+            for j in range(i + 1, count):
+                succ = points[route[j + 1]] if j + 1 < count else None
+                a, b = points[route[i]], points[route[j]]
+                delta = distance(prev, b) + distance(a, succ) - distance(prev, a) - distance(b, succ)
+                if delta < -1e-9:
+                    candidate = route[:i] + route[i:j + 1][::-1] + route[j + 1:]
+                    if _is_valid(candidate, predecessors):
+                        route = candidate
+                        improved = True
+                        prev = start if i == 0 else points[route[i - 1]]
+        if not improved:
+            break
+    return route
+
+
+def optimize_route(points: Sequence[Point], start: Optional[Point] = None,
+                   precedence: Precedence = ()) -> List[int]:
+    """Return visiting order of points minimizing table travel using a
+    nearest neighbour route refined by 2-opt, never longer than the original
+    order if that satisfies all precedence constraints.
+
+    >>> optimize_route([(0, 0), (10, 0), (1, 0)], start=(0, 0))
+    [0, 2, 1]
+    """
+    precedence = list(precedence)
+    route = nearest_neighbour_route(points, start, precedence)
+    route = two_opt_route(points, route, start, precedence)
+    original = list(range(len(points)))
+    if _is_valid(original, _predecessors(len(points), precedence)):
+        if route_length(points, original, start) <= route_length(points, route, start):
+            return original
+    return route
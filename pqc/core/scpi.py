@@ -0,0 +1,91 @@
+import logging
+from typing import Callable, Iterable, List
+
+__all__ = ["group_commands", "batch_commands", "write_batch"]
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_command(command: str) -> str:
+    """Return command with absolute header path, required when concatenating
+    commands with semicolons (relative headers would be resolved against the
+    path of the preceding command).
+
+    >>> normalize_command("TRIG:IMM")
+    ':TRIG:IMM'
+    """
+    command = command.strip()
+    if not command or command.startswith((":", "*")):
+        return command
+    return f":{command}"
+
+
+def group_commands(commands: Iterable[str], max_length: int = 240) -> List[List[str]]:
+    """Return commands grouped to as few groups as possible, each group not
+    exceeding max_length characters if concatenated with semicolons (unless
+    a single command is longer).
+
+    >>> group_commands([":A 1", ":B 2", ":C 3"], max_length=9)
+    [[':A 1', ':B 2'], [':C 3']]
+    """
+    groups: List[List[str]] = []
+    group: List[str] = []
+    length = 0
+    for command in commands:
+        command = normalize_command(command)
+        if not command:
+            continue
+        if group and length + len(command) + 1 > max_length:
+            groups.append(group)
+            group, length = [], 0
+        length = length + len(command) + 1 if group else len(command)
+        group.append(command)
+    if group:
+        groups.append(group)
+    return groups
+
+
+def batch_commands(commands: Iterable[str], max_length: int = 240) -> List[str]:
+    """Return commands concatenated with semicolons to as few messages as
+    possible, not exceeding max_length characters (unless a single command
+    is longer).
+
+    >>> batch_commands(["*CLS", ":SENS:NPLC 1", "TRIG:SOUR BUS"])
+    ['*CLS;:SENS:NPLC 1;:TRIG:SOUR BUS']
+    """
+    return [";".join(group) for group in group_commands(commands, max_length)]
+
+
+def write_batch(resource, commands: Iterable[str], check_error: Callable[[], None],
+                name: str = "device", max_length: int = 240) -> None:
+    """Write commands concatenated to batches, waiting for operation complete
+    and testing for errors (`check_error` raising `RuntimeError`) once per
+    batch.
+
+    If a batch fails, its commands are repeated one by one to identify the
+    failing command, commands of preceding batches are not repeated. Raises
+    `RuntimeError` for any failed write.
+    """
+    groups = group_commands(commands, max_length)
+    logger.info("%s batch write: %d commands", name, sum(len(group) for group in groups))
+    for group in groups:
+        batch = ";".join(group)
+        try:
+            resource.write(batch)
+            resource.query("*OPC?")
+        except Exception as exc:
+            raise RuntimeError(f"Failed to write batch to {name}: {batch!r}, {exc}") from exc
+        try:
+            check_error()
+        except RuntimeError as exc:
+            logger.warning("%s batch write failed (%s), repeating commands one by one...", name, exc)
+        else:
+            continue
+        resource.write("*CLS")
+        for command in group:
+            try:
+                resource.write(command)
+                resource.query("*OPC?")
+                check_error()
+            except Exception as exc:
+                raise RuntimeError(f"Failed to write to {name}: {command!r}, {exc}") from exc
@@ -0,0 +1,83 @@
+"""Columnar series storage module."""
+
+from collections.abc import Mapping
+from typing import Dict, Iterator, List
+
+import numpy as np
+
+__all__ = ["SeriesStore"]
+
+
+class SeriesStore(Mapping):
+    """Columnar series storage using preallocated float64 arrays.
+
+    Columns are growing geometrically if the number of rows exceeds the
+    reserved capacity. Items are read-only array views of the filled rows.
+
+    >>> series = SeriesStore()
+    >>> series.register("voltage")
+    >>> series.register("current")
+    >>> series.append({"voltage": 1.0, "current": 2e-9})
+    >>> series["voltage"]
+    array([1.])
+    """
+
+    minimum_capacity: int = 64
+
+    def __init__(self) -> None:
+        self._columns: Dict[str, np.ndarray] = {}
+        self._keys: List[str] = []
+        self._capacity: int = 0
+        self._size: int = 0
+
+    @property
+    def size(self) -> int:
+        """Number of rows."""
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        """Number of rows allocated."""
+        return self._capacity
+
+    def register(self, key: str) -> None:
+        if key in self._columns:
+            raise KeyError(f"Series already exists: {key}")
+        if self._size:
+            raise KeyError(f"Series already contains data, unable to register: {key}")
+        self._columns[key] = np.empty(self._capacity, dtype=np.float64)
+        self._keys.append(key)
+
+    def reserve(self, capacity: int) -> None:
+        """Reserve capacity for rows, does not shrink columns."""
+        if capacity > self._capacity:
+            for key, column in self._columns.items():
+                array = np.empty(capacity, dtype=np.float64)
+                array[:self._size] = column[:self._size]
+                self._columns[key] = array
+            self._capacity = capacity
+
+    def append(self, values: dict) -> None:
+        """Append row of values, keys must match registered series keys."""
+        if len(values) != len(self._keys):
+            raise KeyError("Inconsistent series keys")
+        if self._size >= self._capacity:
+            self.reserve(max(self.minimum_capacity, self._capacity * 2))
+        index = self._size
+        try:
+            for key in self._keys:
+                self._columns[key][index] = values[key]
+        except KeyError as exc:
+            raise KeyError("Inconsistent series keys") from exc
+        self._size += 1
+
+    def __getitem__(self, key: str) -> np.ndarray:
+        view = self._columns[key][:self._size]
+        view.flags.writeable = False
+        return view
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
@@ -0,0 +1,183 @@
+"""Pool of instrument sessions shared by measurements and recovery code."""
+
+import contextlib
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, Type
+
+__all__ = ["Session", "SessionPool"]
+
+logger = logging.getLogger(__name__)
+
+
+class Session:
+    """Session of a resource (context manager returning a handle when
+    entered), opened on demand and reused by leases.
+    """
+
+    def __init__(self, name: str, resource, health_check: Optional[Callable[[Any], Any]] = None) -> None:
+        self.name: str = name
+        self.resource = resource
+        self.health_check: Optional[Callable[[Any], Any]] = health_check
+        self.lock = threading.RLock()
+        self.handle: Any = None
+        self.is_open: bool = False
+        self.broken: bool = False
+        self.depth: int = 0
+        self.last_used: float = 0.
+        self.opened: int = 0
+        self.leases: int = 0
+
+    def open(self) -> Any:
+        logger.debug("open session: %s", self.name)
+        self.handle = self.resource.__enter__()
+        self.is_open = True
+        self.broken = False
+        self.opened += 1
+        self.last_used = time.monotonic()
+        return self.handle
+
+    def close(self) -> None:
+        if not self.is_open:
+            return
+        logger.debug("close session: %s", self.name)
+        self.is_open = False
+        self.handle = None
+        try:
+            self.resource.__exit__(None, None, None)
+        except Exception as exc:
+            logger.warning("failed to close session %s: %s", self.name, exc)
+
+    def idle(self) -> float:
+        """Return seconds since session was last used."""
+        return time.monotonic() - self.last_used
+
+
+class SessionPool:
+    """Keeps sessions of registered resources open while persistent (e.g. for
+    the duration of a sequence) and hands out leases.
+
+    Leases of a session are serialized (reentrant for the same thread). A
+    session is reopened if a lease raised one of `errors`, if it was idle
+    longer than `idle_timeout` or if its health check fails after being idle
+    longer than `health_interval`. Outside of `persistent` sessions are
+    closed when the last lease is returned.
+
+    >>> pool = SessionPool(errors=(OSError,))
+    >>> pool.add("hvsrc", hvsrc_resource, health_check=lambda res: res.query("*IDN?"))
+    >>> with pool.persistent():
+    ...     with pool.lease("hvsrc") as res:
+    ...         res.query("*IDN?")
+    """
+
+    def __init__(
+        self,
+        idle_timeout: float = 300.0,
+        health_interval: float = 30.0,
+        errors: Tuple[Type[BaseException], ...] = (OSError,),
+    ) -> None:
+        self.idle_timeout: float = idle_timeout
+        self.health_interval: float = health_interval
+        self.errors: Tuple[Type[BaseException], ...] = errors
+        self._lock = threading.RLock()
+        self._sessions: Dict[str, Session] = {}
+        self._persistent: int = 0
+
+    def add(self, name: str, resource, health_check: Optional[Callable[[Any], Any]] = None) -> None:
+        with self._lock:
+            self._sessions[name] = Session(name, resource, health_check)
+
+    def session(self, name: str) -> Session:
+        with self._lock:
+            session = self._sessions.get(name)
+        if session is None:
+            raise KeyError(f"No such session: {name}")
+        return session
+
+    def is_persistent(self) -> bool:
+        with self._lock:
+            return self._persistent > 0
+
+    @contextlib.contextmanager
+    def persistent(self) -> Iterator["SessionPool"]:
+        """Keep sessions open until context is left (nestable)."""
+        with self._lock:
+            self._persistent += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._persistent -= 1
+                closing = not self._persistent
+            if closing:
+                self.close()
+
+    def _prepare(self, session: Session) -> Any:
+        """Return open handle of session, reconnecting stale, broken or
+        unhealthy sessions."""
+        if session.is_open and session.depth == 0:
+            idle = session.idle()
+            if session.broken or idle > self.idle_timeout:
+                session.close()
+            elif session.health_check is not None and idle > self.health_interval:
+                try:
+                    session.health_check(session.handle)
+                except self.errors as exc:
+                    logger.warning("session %s failed health check, reconnecting: %s", session.name, exc)
+                    session.close()
+        if not session.is_open:
+            return session.open()
+        return session.handle
+
+    @contextlib.contextmanager
+    def lease(self, name: str, timeout: Optional[float] = None) -> Iterator[Any]:
+        """Lease open session handle of resource, waits for other leases to
+        be returned. Raises `TimeoutError` if the session is still leased by
+        another thread after timeout seconds.
+        """
+        session = self.session(name)
+        self.close_idle()
+        if not session.lock.acquire(timeout=-1 if timeout is None else timeout):
+            raise TimeoutError(f"Session {name} busy, not returned within {timeout:.1f} s")
+        try:
+            handle = self._prepare(session)
+            session.depth += 1
+            session.leases += 1
+            try:
+                yield handle
+            except self.errors:
+                session.broken = True
+                raise
+            finally:
+                session.depth -= 1
+                session.last_used = time.monotonic()
+                if not session.depth and (session.broken or not self.is_persistent()):
+                    session.close()
+        finally:
+            session.lock.release()
+
+    def _close_sessions(self, idle_timeout: float) -> None:
+        with self._lock:
+            sessions = list(self._sessions.values())
+        for session in sessions:
+            # Leased sessions are skipped, closed when returned if no longer persistent
+            if session.lock.acquire(blocking=False):
+                try:
+                    if session.is_open and not session.depth and session.idle() >= idle_timeout:
+                        session.close()
+                finally:
+                    session.lock.release()
+
+    def close_idle(self) -> None:
+        """Close sessions not leased for longer than idle timeout."""
+        self._close_sessions(self.idle_timeout)
+
+    def close(self) -> None:
+        """Close all sessions not currently leased."""
+        self._close_sessions(0.)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Return number of opened sessions and leases per resource."""
+        with self._lock:
+            return {name: {"opened": session.opened, "leases": session.leases} for name, session in self._sessions.items()}
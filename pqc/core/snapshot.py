@@ -0,0 +1,61 @@
+"""Latest value snapshots with age for readers on other threads."""
+
+import time
+from typing import Any, Optional
+
+__all__ = ["Snapshot", "SnapshotSlot"]
+
+
+class Snapshot:
+    """Immutable value with wall clock and monotonic acquisition time.
+
+    >>> snapshot = Snapshot(42)
+    >>> snapshot.age() < 1.0
+    True
+    """
+
+    __slots__ = ("value", "timestamp", "monotonic")
+
+    def __init__(self, value: Any, timestamp: Optional[float] = None, monotonic: Optional[float] = None) -> None:
+        self.value: Any = value
+        self.timestamp: float = time.time() if timestamp is None else timestamp
+        self.monotonic: float = time.monotonic() if monotonic is None else monotonic
+
+    def age(self) -> float:
+        """Return seconds elapsed since value was acquired."""
+        return max(0., time.monotonic() - self.monotonic)
+
+
+class SnapshotSlot:
+    """Holds the latest published snapshot. Publishing replaces a single
+    reference, readers never block on the publishing thread.
+
+    >>> slot = SnapshotSlot()
+    >>> slot.publish(42)
+    >>> slot.get(max_age=5.0).value
+    42
+    """
+
+    def __init__(self) -> None:
+        self._snapshot: Optional[Snapshot] = None
+
+    def publish(self, value: Any) -> Snapshot:
+        """Publish value as latest snapshot, returns the snapshot."""
+        snapshot = Snapshot(value)
+        self._snapshot = snapshot
+        return snapshot
+
+    def latest(self) -> Optional[Snapshot]:
+        """Return latest snapshot regardless of age or `None`."""
+        return self._snapshot
+
+    def get(self, max_age: float) -> Optional[Snapshot]:
+        """Return latest snapshot if not older than `max_age` seconds, else
+        `None`."""
+        snapshot = self._snapshot
+        if snapshot is None or snapshot.age() > max_age:
+            return None
+        return snapshot
+
+    def clear(self) -> None:
+        self._snapshot = None
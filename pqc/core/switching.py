@@ -0,0 +1,106 @@
+"""Switching matrix relay state tracking and delta switching."""
+
+import logging
+from typing import FrozenSet, Iterable, List, Optional, Tuple
+
+__all__ = ["channel_delta", "SwitchError", "SwitchController"]
+
+logger = logging.getLogger(__name__)
+
+
+def channel_delta(closed: Iterable[str], channels: Iterable[str]) -> Tuple[List[str], List[str]]:
+    """Return channels to open and to close for switching from closed
+    channels to channels.
+
+    >>> channel_delta(["1A01", "1B02"], ["1B02", "1C03"])
+    (['1A01'], ['1C03'])
+    """
+    closed, channels = set(closed), set(channels)
+    return sorted(closed - channels), sorted(channels - closed)
+
+
+class SwitchError(RuntimeError):
+    ...
+
+
+class SwitchController:
+    """Tracks known closed channels of a switching matrix channel interface
+    providing `open(channels=None)`, `close(channels)` and `getclose()`.
+
+    The known state is invalidated (`None`) on any error, forcing a full
+    open and verification on the next switch.
+    """
+
+    def __init__(self, channel) -> None:
+        self.channel = channel
+        self.state: Optional[FrozenSet[str]] = None
+        self.operations: int = 0
+
+    def _read(self) -> FrozenSet[str]:
+        self.operations += 1
+        self.state = frozenset(self.channel.getclose())
+        return self.state
+
+    def invalidate(self) -> None:
+        self.state = None
+
+    def closed_channels(self) -> List[str]:
+        try:
+            return sorted(self._read())
+        except Exception:
+            self.invalidate()
+            raise
+
+    def open_all(self) -> None:
+        try:
+            self.operations += 1
+            self.channel.open()
+        except Exception:
+            self.invalidate()
+            raise
+        self.state = frozenset()
+
+    def safe_close(self, channels: List[str]) -> None:
+        """Close channels, requires all channels to be open (verified by
+        read back before and after)."""
+        try:
+            closed_channels = self._read()
+            if closed_channels:
+                raise SwitchError("Some matrix channels are still closed, " \
+                    f"please verify the situation and open closed channels. Closed channels: {sorted(closed_channels)}")
+            if channels:
+                self.operations += 1
+                self.channel.close(list(channels))
+                if self._read() != frozenset(channels):
+                    raise SwitchError("Matrix mismatch in closed channels")
+        except Exception:
+            self.invalidate()
+            raise
+
+    def switch(self, channels: List[str]) -> None:
+        """Switch from known state to channels opening and closing only
+        changed channels, verified by a single read back. Falls back to open
+        all channels and `safe_close` if state is unknown or inconsistent.
+        """
+        target = frozenset(channels)
+        if self.state is None:
+            logger.info("Matrix state unknown, open all channels.")
+            self.open_all()
+            self.safe_close(channels)
+            return
+        to_open, to_close = channel_delta(self.state, target)
+        try:
+            if to_open:
+                self.operations += 1
+                self.channel.open(to_open)
+            if to_close:
+                self.operations += 1
+                self.channel.close(to_close)
+            closed_channels = self._read()
+        except Exception:
+            self.invalidate()
+            raise
+        if closed_channels != target:
+            logger.warning("Matrix state mismatch (closed: %s), open all channels.", sorted(closed_channels))
+            self.open_all()
+            self.safe_close(channels)
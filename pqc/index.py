@@ -0,0 +1,82 @@
+"""Query the measurement index of an output directory.
+
+Example:
+
+    pqc-index /data/pqc --sample "HPK_VPX%" --type iv_ramp --state Failed --since 2024-03-01
+"""
+
+import argparse
+import json
+import os
+import sys
+from datetime import datetime
+from typing import List, Optional
+
+from . import __version__
+from .core.index import INDEX_FILENAME, MeasurementIndex
+
+__all__ = ["main"]
+
+
+def parse_timestamp(value: str) -> float:
+    """Return timestamp from ISO formatted date or date time."""
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"invalid ISO date: {value!r}") from exc
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="pqc-index", description="Query the measurement index of an output directory.")
+    parser.add_argument("output_dir", metavar="<output_dir>", help="measurement output directory")
+    parser.add_argument("--sample", metavar="<name>", help="sample name (supports %% wildcard)")
+    parser.add_argument("--contact", metavar="<name>", help="contact name (supports %% wildcard)")
+    parser.add_argument("--type", metavar="<type>", help="measurement type, e.g. iv_ramp")
+    parser.add_argument("--state", metavar="<state>", help="measurement state, e.g. Success")
+    parser.add_argument("--since", metavar="<date>", type=parse_timestamp, help="start date (ISO format)")
+    parser.add_argument("--until", metavar="<date>", type=parse_timestamp, help="end date (ISO format)")
+    parser.add_argument("--limit", metavar="<n>", type=int, help="limit number of results")
+    parser.add_argument("--json", action="store_true", help="write results as JSON")
+    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+
+    filename = os.path.join(args.output_dir, INDEX_FILENAME)
+    if not os.path.exists(filename):
+        raise SystemExit(f"No such index: {filename}")
+
+    with MeasurementIndex(filename) as index:
+        records = index.query(
+            sample_name=args.sample,
+            contact_name=args.contact,
+            measurement_type=args.type,
+            measurement_state=args.state,
+            since=args.since,
+            until=args.until,
+            limit=args.limit,
+        )
+
+    if args.json:
+        json.dump(records, sys.stdout, indent=2)
+        sys.stdout.write(os.linesep)
+        return
+
+    for record in records:
+        timestamp = datetime.fromtimestamp(record.get("timestamp") or 0).isoformat(timespec="seconds")
+        files = ", ".join(record.get("files") or [])
+        print("\t".join([
+            timestamp,
+            record.get("sample_name") or "",
+            record.get("contact_name") or "",
+            record.get("measurement_name") or "",
+            record.get("measurement_type") or "",
+            record.get("measurement_state") or "",
+            files,
+        ]))
+
+
+if __name__ == "__main__":
+    main()
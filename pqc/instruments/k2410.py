@@ -1,4 +1,4 @@
-from typing import Tuple
+from typing import List, Tuple
 
 from comet.driver.keithley import K2410
 
@@ -207,3 +207,42 @@ class K2410Instrument(SMUInstrument):
         self.context.resource.write(":SENS:FUNC:ON 'VOLT'")
         self.context.resource.query("*OPC?")
         return self.context.read()[0]
+
+    # Buffered sweep
+
+    def sweep_voltage_list(self, voltages: List[float], delay: float) -> List[float]:
+        # Note: the source returns to the bias level after the sweep, so the
+        # bias level is set to the last list value once in list mode (the
+        # level is applied immediately in fixed mode only) before triggering.
+        resource = self.context.resource
+        values = ",".join(format(voltage, ".3E") for voltage in voltages)
+        self.context.format.elements = ["CURRENT"]
+        for message in (
+            ":SENS:FUNC:CONC ON",
+            ":SENS:FUNC:ON 'CURR'",
+            f":SOUR:LIST:VOLT {values}",
+            f":SOUR:DEL {delay:.3E}",
+            f":TRIG:COUN {len(voltages):d}",
+            ":SOUR:VOLT:MODE LIST",
+            f":SOUR:VOLT:LEV {voltages[-1]:.3E}",
+        ):
+            resource.write(message)
+            resource.query("*OPC?")
+        try:
+            resource.write("*CLS")
+            resource.write(":INIT")
+            resource.write("*OPC")
+            self.wait_sweep(
+                lambda: bool(int(resource.query("*ESR?")) & 0x1),
+                timeout=self.sweep_timeout(len(voltages), delay)
+            )
+            result = resource.query(":FETC?")
+        finally:
+            for message in (
+                ":SOUR:VOLT:MODE FIX",
+                ":TRIG:COUN 1",
+                ":SOUR:DEL:AUTO ON",
+            ):
+                resource.write(message)
+                resource.query("*OPC?")
+        return [float(value) for value in result.split(",")]
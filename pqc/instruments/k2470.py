@@ -1,4 +1,4 @@
-from typing import Tuple
+from typing import List, Tuple
 
 from comet.driver import Driver
 
@@ -223,3 +223,27 @@ class K2470Instrument(SMUInstrument):
 
     def read_voltage(self) -> float:
         return float(self.context.resource.query(":MEAS:VOLT?"))
+
+    # Buffered sweep
+
+    def sweep_voltage_list(self, voltages: List[float], delay: float) -> List[float]:
+        resource = self.context.resource
+        values = ",".join(format(voltage, ".3E") for voltage in voltages)
+        for message in (
+            ':SENS:FUNC "CURR"',
+            f":SOUR:LIST:VOLT {values}",
+            f':SOUR:SWE:VOLT:LIST 1, {delay:.3E}, 1, OFF, "defbuffer1"',
+            ':TRAC:CLE "defbuffer1"',
+        ):
+            resource.write(message)
+            resource.query("*OPC?")
+        # Source level remains at last list value after the sweep.
+        resource.write("*CLS")
+        resource.write(":INIT")
+        resource.write("*OPC")
+        self.wait_sweep(
+            lambda: bool(int(resource.query("*ESR?")) & 0x1),
+            timeout=self.sweep_timeout(len(voltages), delay)
+        )
+        result = resource.query(f':TRAC:DATA? 1, {len(voltages):d}, "defbuffer1", READ')
+        return [float(value) for value in result.split(",")]
@@ -1,8 +1,9 @@
-from typing import Tuple
+from typing import List, Tuple
 
 from comet.driver.keithley import K2657A
 
 from .smu import SMUInstrument
+from .tsp import RAMP_SCRIPT, TSPScriptEngine
 
 __all__ = ["K2657AInstrument"]
 
@@ -11,6 +12,7 @@ class K2657AInstrument(SMUInstrument):
 
     def __init__(self, context) -> None:
         super().__init__(K2657A(context))
+        self.script_engine = TSPScriptEngine(self.context.resource)
 
     def reset(self) -> None:
         self.context.reset()
@@ -194,3 +196,27 @@ class K2657AInstrument(SMUInstrument):
 
     def read_voltage(self) -> float:
         return self.context.measure.v()
+
+    # Buffered sweep
+
+    SWEEP_LIST_MAXIMUM: int = 500
+
+    def sweep_voltage_list(self, voltages: List[float], delay: float) -> List[float]:
+        """Run voltage list on the instrument using a TSP ramp script, settling
+        delay and compliance check are executed by the instrument. Stops on
+        compliance, returning readings of completed points only.
+        """
+        self.script_engine.load(RAMP_SCRIPT)
+        resource = self.context.resource
+        timeout = resource.timeout
+        try:
+            # Timeout of resource is in milliseconds
+            resource.timeout = max(timeout, self.sweep_timeout(len(voltages), delay) * 1e3)
+            self.script_engine.call("pqcRampClear")
+            self.script_engine.send_list("pqcRampAppend", voltages)
+            count = int(float(self.script_engine.call("pqcRampRun", delay)))
+        finally:
+            resource.timeout = timeout
+        if not count:
+            return []
+        return self.script_engine.read_buffer("smua.nvbuffer1", 1, count)
@@ -1,6 +1,8 @@
+import time
 from abc import abstractmethod
-from typing import Tuple
+from typing import Callable, List, Tuple
 
+from ..core.timer import Timer
 from .instrument import Instrument
 
 __all__ = ["SMUInstrument"]
@@ -229,3 +231,40 @@ class SMUInstrument(Instrument):
     @abstractmethod
     def read_voltage(self) -> float:
         ...
+
+    # Buffered sweep
+
+    SWEEP_LIST_MAXIMUM: int = 100
+    SWEEP_CHUNK_DURATION: float = 5.0
+    SWEEP_POINT_TIMEOUT: float = 1.0
+    SWEEP_TIMEOUT: float = 60.0
+
+    @abstractmethod
+    def sweep_voltage_list(self, voltages: List[float], delay: float) -> List[float]:
+        """Run instrument side voltage list sweep with source delay applied
+        before every point, returns list of current readings fetched from the
+        instrument buffer in one transfer. Instruments checking compliance on
+        their own may stop early and return fewer readings.
+        """
+        ...
+
+    def sweep_list_size(self, delay: float) -> int:
+        """Return number of points per buffered sweep, limited by the list
+        maximum of the instrument and by `SWEEP_CHUNK_DURATION` to keep
+        latency of stop requests and compliance checks short.
+        """
+        if delay > 0:
+            return max(1, min(self.SWEEP_LIST_MAXIMUM, int(self.SWEEP_CHUNK_DURATION / delay)))
+        return max(1, self.SWEEP_LIST_MAXIMUM)
+
+    def sweep_timeout(self, count: int, delay: float) -> float:
+        """Return timeout in seconds for a buffered sweep of count points."""
+        return count * (delay + self.SWEEP_POINT_TIMEOUT) + self.SWEEP_TIMEOUT
+
+    def wait_sweep(self, predicate: Callable[[], bool], timeout: float, interval: float = 0.050) -> None:
+        """Poll predicate until buffered sweep completed or timeout exceeded."""
+        t = Timer()
+        while not predicate():
+            if t.delta() > timeout:
+                raise TimeoutError(f"Buffered sweep timeout, exceeded {timeout:G} s")
+            time.sleep(interval)
@@ -0,0 +1,101 @@
+"""Minimal TSP script engine for Keithley 2600 series instruments."""
+
+from typing import List, Set
+
+__all__ = ["TSPScript", "TSPScriptEngine", "RAMP_SCRIPT"]
+
+
+class TSPScript:
+    """Named Lua script to be loaded onto a TSP instrument."""
+
+    def __init__(self, name: str, source: str) -> None:
+        self.name = name
+        self.source = source
+
+    def lines(self) -> List[str]:
+        return [line.rstrip() for line in self.source.strip().splitlines() if line.strip()]
+
+
+class TSPScriptEngine:
+    """Load named scripts once and call script functions on a TSP instrument.
+
+    Scripts are loaded into volatile memory of the instrument, the engine keeps
+    track of loaded scripts so that each script is transferred only once per
+    engine instance.
+    """
+
+    def __init__(self, resource) -> None:
+        self.resource = resource
+        self.loaded: Set[str] = set()
+
+    def load(self, script: TSPScript) -> None:
+        """Load and execute script (defining its functions) if not yet loaded."""
+        if script.name in self.loaded:
+            return
+        self.resource.write(f"loadscript {script.name}")
+        for line in script.lines():
+            self.resource.write(line)
+        self.resource.write("endscript")
+        self.resource.write(f"{script.name}()")
+        self.resource.query("print(1)")  # wait for script to be executed
+        self.loaded.add(script.name)
+
+    def call(self, function: str, *args) -> str:
+        """Call a script function and return its printed result."""
+        arguments = ", ".join(format_argument(arg) for arg in args)
+        return self.resource.query(f"print({function}({arguments}))")
+
+    def send_list(self, function: str, values: List, chunk_size: int = 32) -> None:
+        """Pass values to a script function in bounded size writes, calling
+        the function with a table of at most chunk_size values per write."""
+        values = list(values)
+        for offset in range(0, len(values), chunk_size):
+            self.resource.write(f"{function}({format_argument(values[offset:offset + chunk_size])})")
+
+    def read_buffer(self, buffer: str, start: int, count: int, chunk_size: int = 1000) -> List[float]:
+        """Return readings from instrument buffer, transferred in chunks."""
+        readings: List[float] = []
+        end = start + count - 1
+        for offset in range(start, end + 1, chunk_size):
+            last = min(offset + chunk_size - 1, end)
+            result = self.resource.query(f"printbuffer({offset:d}, {last:d}, {buffer}.readings)")
+            readings.extend(float(value) for value in result.split(","))
+        return readings
+
+
+def format_argument(value) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (list, tuple)):
+        return "{" + ", ".join(format_argument(item) for item in value) + "}"
+    if isinstance(value, int):
+        return format(value, "d")
+    if isinstance(value, float):
+        return format(value, ".6E")
+    return str(value)
+
+
+RAMP_SCRIPT = TSPScript("pqcRamp", """
+pqcRampVoltages = {}
+function pqcRampClear()
+    pqcRampVoltages = {}
+end
+function pqcRampAppend(voltages)
+    for index, voltage in ipairs(voltages) do
+        table.insert(pqcRampVoltages, voltage)
+    end
+end
+function pqcRampRun(delay_time)
+    smua.nvbuffer1.clear()
+    smua.nvbuffer1.appendmode = 1
+    for index, voltage in ipairs(pqcRampVoltages) do
+        smua.source.levelv = voltage
+        delay(delay_time)
+        smua.measure.i(smua.nvbuffer1)
+        if smua.source.compliance then
+            break
+        end
+    end
+    return smua.nvbuffer1.n
+end
+""")
@@ -22,6 +22,8 @@ class CVRampMeasurement(MatrixMeasurement, HVSourceMixin, LCRMixin, EnvironmentM
 
     type = "cv_ramp"
 
+    analysis_series = {"c": "capacitance", "v": "voltage_hvsrc"}
+
     required_instruments = ["hvsrc", "lcr"]
 
     def __init__(self, *args, **kwargs):
@@ -110,6 +112,7 @@ class CVRampMeasurement(MatrixMeasurement, HVSourceMixin, LCRMixin, EnvironmentM
         self.set_series_unit("temperature_box", "degC")
         self.set_series_unit("temperature_chuck", "degC")
         self.set_series_unit("humidity_box", "%")
+        self.set_series_unit("environment_age", "s")
 
         # Series
         self.register_series("timestamp")
@@ -121,6 +124,7 @@ class CVRampMeasurement(MatrixMeasurement, HVSourceMixin, LCRMixin, EnvironmentM
         self.register_series("temperature_box")
         self.register_series("temperature_chuck")
         self.register_series("humidity_box")
+        self.register_series("environment_age")
 
         # Initialize HV Source
 
@@ -182,6 +186,7 @@ class CVRampMeasurement(MatrixMeasurement, HVSourceMixin, LCRMixin, EnvironmentM
 
         ramp = LinearRange(hvsrc_voltage_level, bias_voltage_stop, bias_voltage_step)
         est = Estimate(len(ramp))
+        self.reserve_series(len(ramp) + 2)  # ramp includes begin and end
         self.process.set_progress(*est.progress)
 
         t0 = time.time()
@@ -245,7 +250,8 @@ class CVRampMeasurement(MatrixMeasurement, HVSourceMixin, LCRMixin, EnvironmentM
                     resistance=lcr_sec,
                     temperature_box=self.environment_temperature_box,
                     temperature_chuck=self.environment_temperature_chuck,
-                    humidity_box=self.environment_humidity_box
+                    humidity_box=self.environment_humidity_box,
+                    environment_age=self.environment_age
                 )
 
                 # Compliance tripped?
@@ -267,8 +273,8 @@ class CVRampMeasurement(MatrixMeasurement, HVSourceMixin, LCRMixin, EnvironmentM
     def analyze(self, **kwargs):
         self.process.set_progress(0, 1)
 
-        v = np.array(self.get_series("voltage_hvsrc"))
-        c = np.array(self.get_series("capacitance"))
+        v = np.asarray(self.get_series(self.analysis_series["v"]))
+        c = np.asarray(self.get_series(self.analysis_series["c"]))
         self.analysis_cv(c, v)
 
         self.process.set_progress(1, 1)
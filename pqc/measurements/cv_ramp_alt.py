@@ -22,6 +22,8 @@ class CVRampAltMeasurement(MatrixMeasurement, LCRMixin, EnvironmentMixin, Analys
 
     type = "cv_ramp_alt"
 
+    analysis_series = {"c": "capacitance", "v": "voltage_lcr"}
+
     required_instruments = ["lcr"]
 
     def __init__(self, *args, **kwargs):
@@ -101,6 +103,7 @@ class CVRampAltMeasurement(MatrixMeasurement, LCRMixin, EnvironmentMixin, Analys
         self.set_series_unit("temperature_box", "degC")
         self.set_series_unit("temperature_chuck", "degC")
         self.set_series_unit("humidity_box", "%")
+        self.set_series_unit("environment_age", "s")
 
         # Series
         self.register_series("timestamp")
@@ -112,6 +115,7 @@ class CVRampAltMeasurement(MatrixMeasurement, LCRMixin, EnvironmentMixin, Analys
         self.register_series("temperature_box")
         self.register_series("temperature_chuck")
         self.register_series("humidity_box")
+        self.register_series("environment_age")
 
         # Initialize LCR
 
@@ -163,6 +167,7 @@ class CVRampAltMeasurement(MatrixMeasurement, LCRMixin, EnvironmentMixin, Analys
 
         ramp = LinearRange(lcr_voltage_level, bias_voltage_stop, bias_voltage_step)
         est = Estimate(len(ramp))
+        self.reserve_series(len(ramp) + 2)  # ramp includes begin and end
         self.process.set_progress(*est.progress)
 
         t0 = time.time()
@@ -226,7 +231,8 @@ class CVRampAltMeasurement(MatrixMeasurement, LCRMixin, EnvironmentMixin, Analys
                     resistance=lcr_sec,
                     temperature_box=self.environment_temperature_box,
                     temperature_chuck=self.environment_temperature_chuck,
-                    humidity_box=self.environment_humidity_box
+                    humidity_box=self.environment_humidity_box,
+                    environment_age=self.environment_age
                 )
 
                 if self.process.stop_requested:
@@ -240,8 +246,8 @@ class CVRampAltMeasurement(MatrixMeasurement, LCRMixin, EnvironmentMixin, Analys
     def analyze(self, **kwargs):
         self.process.set_progress(0, 1)
 
-        v = np.array(self.get_series("voltage_lcr"))
-        c = np.array(self.get_series("capacitance"))
+        v = np.asarray(self.get_series(self.analysis_series["v"]))
+        c = np.asarray(self.get_series(self.analysis_series["c"]))
         self.analysis_cv(c, v)
 
         self.process.set_progress(1, 1)
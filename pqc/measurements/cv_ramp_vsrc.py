@@ -22,6 +22,8 @@ class CVRampHVMeasurement(MatrixMeasurement, VSourceMixin, LCRMixin, Environment
 
     type = "cv_ramp_vsrc"
 
+    analysis_series = {"c": "capacitance", "v": "voltage_vsrc"}
+
     required_instruments = ["vsrc", "lcr"]
 
     def __init__(self, *args, **kwargs):
@@ -111,6 +113,7 @@ class CVRampHVMeasurement(MatrixMeasurement, VSourceMixin, LCRMixin, Environment
         self.set_series_unit("temperature_box", "degC")
         self.set_series_unit("temperature_chuck", "degC")
         self.set_series_unit("humidity_box", "%")
+        self.set_series_unit("environment_age", "s")
 
         # Series
         self.register_series("timestamp")
@@ -122,6 +125,7 @@ class CVRampHVMeasurement(MatrixMeasurement, VSourceMixin, LCRMixin, Environment
         self.register_series("temperature_box")
         self.register_series("temperature_chuck")
         self.register_series("humidity_box")
+        self.register_series("environment_age")
 
         # Initialize V Source
 
@@ -187,6 +191,7 @@ class CVRampHVMeasurement(MatrixMeasurement, VSourceMixin, LCRMixin, Environment
 
         ramp = LinearRange(vsrc_voltage_level, bias_voltage_stop, bias_voltage_step)
         est = Estimate(len(ramp))
+        self.reserve_series(len(ramp) + 2)  # ramp includes begin and end
         self.process.set_progress(*est.progress)
 
         t0 = time.time()
@@ -251,7 +256,8 @@ class CVRampHVMeasurement(MatrixMeasurement, VSourceMixin, LCRMixin, Environment
                     resistance=lcr_sec,
                     temperature_box=self.environment_temperature_box,
                     temperature_chuck=self.environment_temperature_chuck,
-                    humidity_box=self.environment_humidity_box
+                    humidity_box=self.environment_humidity_box,
+                    environment_age=self.environment_age
                 )
 
                 # Compliance tripped?
@@ -273,8 +279,8 @@ class CVRampHVMeasurement(MatrixMeasurement, VSourceMixin, LCRMixin, Environment
     def analyze(self, **kwargs):
         self.process.set_progress(0, 1)
 
-        v = np.array(self.get_series("voltage_vsrc"))
-        c = np.array(self.get_series("capacitance"))
+        v = np.asarray(self.get_series(self.analysis_series["v"]))
+        c = np.asarray(self.get_series(self.analysis_series["c"]))
         self.analysis_cv(c, v)
 
         self.process.set_progress(1, 1)
@@ -30,6 +30,8 @@ class IVRampMeasurement(MatrixMeasurement, HVSourceMixin, EnvironmentMixin, Anal
 
     type = "iv_ramp"
 
+    analysis_series = {"i": "current_hvsrc", "v": "voltage"}
+
     required_instruments = ["hvsrc"]
 
     def __init__(self, *args, **kwargs):
@@ -46,6 +48,7 @@ class IVRampMeasurement(MatrixMeasurement, HVSourceMixin, EnvironmentMixin, Anal
         self.register_parameter("waiting_time_end", comet.ureg("0 s"), unit="s")
         self.register_parameter("hvsrc_current_compliance", unit="A", required=True)
         self.register_parameter("hvsrc_accept_compliance", False, type=bool)
+        self.register_parameter("hvsrc_buffered_sweep", False, type=bool)
         self.register_vsource()
         self.register_environment()
         self.register_analysis()
@@ -66,6 +69,7 @@ class IVRampMeasurement(MatrixMeasurement, HVSourceMixin, EnvironmentMixin, Anal
         waiting_time_end = self.get_parameter("waiting_time_end")
         hvsrc_current_compliance = self.get_parameter("hvsrc_current_compliance")
         hvsrc_accept_compliance = self.get_parameter("hvsrc_accept_compliance")
+        hvsrc_buffered_sweep = self.get_parameter("hvsrc_buffered_sweep")
 
         # Extend meta data
         self.set_meta("voltage_start", f"{voltage_start:G} V")
@@ -80,6 +84,7 @@ class IVRampMeasurement(MatrixMeasurement, HVSourceMixin, EnvironmentMixin, Anal
         self.set_meta("waiting_time_end", f"{waiting_time_end:G} s")
         self.set_meta("hvsrc_current_compliance", f"{hvsrc_current_compliance:G} A")
         self.set_meta("hvsrc_accept_compliance", hvsrc_accept_compliance)
+        self.set_meta("hvsrc_buffered_sweep", hvsrc_buffered_sweep)
 
         self.hvsrc_update_meta()
         self.environment_update_meta()
@@ -91,6 +96,7 @@ class IVRampMeasurement(MatrixMeasurement, HVSourceMixin, EnvironmentMixin, Anal
         self.set_series_unit("temperature_box", "degC")
         self.set_series_unit("temperature_chuck", "degC")
         self.set_series_unit("humidity_box", "%")
+        self.set_series_unit("environment_age", "s")
 
         # Series
         self.register_series("timestamp")
@@ -99,6 +105,7 @@ class IVRampMeasurement(MatrixMeasurement, HVSourceMixin, EnvironmentMixin, Anal
         self.register_series("temperature_box")
         self.register_series("temperature_chuck")
         self.register_series("humidity_box")
+        self.register_series("environment_age")
 
         self.process.update_state({
             "hvsrc_voltage": self.hvsrc_get_voltage_level(hvsrc),
@@ -158,6 +165,7 @@ class IVRampMeasurement(MatrixMeasurement, HVSourceMixin, EnvironmentMixin, Anal
         voltage_step = self.get_parameter("voltage_step")
         waiting_time = self.get_parameter("waiting_time")
         hvsrc_accept_compliance = self.get_parameter("hvsrc_accept_compliance")
+        hvsrc_buffered_sweep = self.get_parameter("hvsrc_buffered_sweep")
 
         if self.process.stop_requested:
             return
@@ -168,9 +176,14 @@ class IVRampMeasurement(MatrixMeasurement, HVSourceMixin, EnvironmentMixin, Anal
 
         ramp = LinearRange(voltage, voltage_stop, voltage_step)
         est = Estimate(len(ramp))
+        self.reserve_series(len(ramp) + 2)  # ramp includes begin and end
         self.process.set_progress(*est.progress)
 
         logger.info("HV Source ramp to end voltage: from %E V to %E V with step %E V", voltage, ramp.end, ramp.step)
+        if hvsrc_buffered_sweep:
+            self.measure_buffered_sweep(hvsrc, ramp, est, t0)
+            self.process.set_progress(0, 0)
+            return
         for voltage in ramp:
             self.hvsrc_set_voltage_level(hvsrc, voltage)
 
@@ -196,7 +209,8 @@ class IVRampMeasurement(MatrixMeasurement, HVSourceMixin, EnvironmentMixin, Anal
                 current_hvsrc=reading_current,
                 temperature_box=self.environment_temperature_box,
                 temperature_chuck=self.environment_temperature_chuck,
-                humidity_box=self.environment_humidity_box
+                humidity_box=self.environment_humidity_box,
+                environment_age=self.environment_age
             )
             est.advance()
             self.process.set_message("{} | HV Source {}".format(format_estimate(est), format_metric(voltage, "V")))
@@ -215,11 +229,72 @@ class IVRampMeasurement(MatrixMeasurement, HVSourceMixin, EnvironmentMixin, Anal
 
         self.process.set_progress(0, 0)
 
+    def measure_buffered_sweep(self, hvsrc, ramp, est, t0):
+        """Run ramp as instrument side list sweeps of limited size and
+        duration, checking compliance and stop requests between consecutive
+        sweeps.
+
+        Timestamps of points within a sweep are interpolated.
+        """
+        waiting_time = self.get_parameter("waiting_time")
+        hvsrc_accept_compliance = self.get_parameter("hvsrc_accept_compliance")
+
+        voltages = list(ramp)
+        size = hvsrc.sweep_list_size(waiting_time)
+
+        for offset in range(0, len(voltages), size):
+            chunk = voltages[offset:offset + size]
+
+            t_begin = time.time() - t0
+            readings = self.hvsrc_sweep_voltage_list(hvsrc, chunk, waiting_time)
+            t_end = time.time() - t0
+
+            # Sweep might stop early on compliance
+            chunk = chunk[:len(readings)]
+
+            self.environment_update()
+
+            for index, (voltage, reading_current) in enumerate(zip(chunk, readings)):
+                td = t_begin + (t_end - t_begin) * (index + 1) / len(chunk)
+                # Append series data
+                self.append_series(
+                    timestamp=td,
+                    voltage=voltage,
+                    current_hvsrc=reading_current,
+                    temperature_box=self.environment_temperature_box,
+                    temperature_chuck=self.environment_temperature_chuck,
+                    humidity_box=self.environment_humidity_box,
+                    environment_age=self.environment_age
+                )
+                est.advance()
+
+            if chunk:
+                voltages_chunk = np.asarray(chunk, dtype=float)
+                self.process.append_readings("hvsrc", np.abs(voltages_chunk) if ramp.step < 0 else voltages_chunk, readings[:len(chunk)])
+                self.process.update_readings()
+                self.process.update_state({
+                    "hvsrc_voltage": chunk[-1],
+                    "hvsrc_current": readings[-1],
+                })
+                self.process.set_message("{} | HV Source {}".format(format_estimate(est), format_metric(chunk[-1], "V")))
+                self.process.set_progress(*est.progress)
+
+            # Compliance tripped?
+            if hvsrc_accept_compliance:
+                if self.hvsrc_compliance_tripped(hvsrc):
+                    logger.info("HV Source compliance tripped, gracefully stopping measurement.")
+                    break
+            else:
+                self.hvsrc_check_compliance(hvsrc)
+
+            if self.process.stop_requested:
+                break
+
     def analyze(self, **kwargs):
         self.process.set_progress(0, 1)
 
-        i = np.array(self.get_series("current_hvsrc"))
-        v = np.array(self.get_series("voltage"))
+        i = np.asarray(self.get_series(self.analysis_series["i"]))
+        v = np.asarray(self.get_series(self.analysis_series["v"]))
         self.analysis_iv(i, v)
 
         self.process.set_progress(1, 1)
@@ -30,6 +30,8 @@ class IVRamp4WireMeasurement(MatrixMeasurement, VSourceMixin, EnvironmentMixin,
 
     type = "iv_ramp_4_wire"
 
+    analysis_series = {"i": "current", "v": "voltage_vsrc"}
+
     required_instruments = ["vsrc"]
 
     def __init__(self, *args, **kwargs):
@@ -94,6 +96,7 @@ class IVRamp4WireMeasurement(MatrixMeasurement, VSourceMixin, EnvironmentMixin,
         self.set_series_unit("temperature_box", "degC")
         self.set_series_unit("temperature_chuck", "degC")
         self.set_series_unit("humidity_box", "%")
+        self.set_series_unit("environment_age", "s")
 
         # Series
         self.register_series("timestamp")
@@ -102,6 +105,7 @@ class IVRamp4WireMeasurement(MatrixMeasurement, VSourceMixin, EnvironmentMixin,
         self.register_series("temperature_box")
         self.register_series("temperature_chuck")
         self.register_series("humidity_box")
+        self.register_series("environment_age")
 
         self.process.update_state({
             "vsrc_voltage": self.vsrc_get_voltage_level(vsrc),
@@ -172,6 +176,7 @@ class IVRamp4WireMeasurement(MatrixMeasurement, VSourceMixin, EnvironmentMixin,
 
         ramp = LinearRange(current, current_stop, current_step)
         est = Estimate(len(ramp))
+        self.reserve_series(len(ramp) + 2)  # ramp includes begin and end
         self.process.set_progress(*est.progress)
 
         t0 = time.time()
@@ -205,7 +210,8 @@ class IVRamp4WireMeasurement(MatrixMeasurement, VSourceMixin, EnvironmentMixin,
                 voltage_vsrc=vsrc_reading,
                 temperature_box=self.environment_temperature_box,
                 temperature_chuck=self.environment_temperature_chuck,
-                humidity_box=self.environment_humidity_box
+                humidity_box=self.environment_humidity_box,
+                environment_age=self.environment_age
             )
 
             # Compliance tripped?
@@ -222,8 +228,8 @@ class IVRamp4WireMeasurement(MatrixMeasurement, VSourceMixin, EnvironmentMixin,
     def analyze(self, **kwargs):
         self.process.set_progress(0, 1)
 
-        i = np.array(self.get_series("current"))
-        v = np.array(self.get_series("voltage_vsrc"))
+        i = np.asarray(self.get_series(self.analysis_series["i"]))
+        v = np.asarray(self.get_series(self.analysis_series["v"]))
         self.analysis_iv(i, v)
 
         self.process.set_progress(1, 1)
@@ -30,6 +30,8 @@ class IVRamp4WireBiasMeasurement(MatrixMeasurement, HVSourceMixin, VSourceMixin,
 
     type = "iv_ramp_4_wire_bias"
 
+    analysis_series = {"i": "current", "v": "voltage_vsrc"}
+
     required_instruments = ["hvsrc", "vsrc"]
 
     def __init__(self, *args, **kwargs):
@@ -112,6 +114,7 @@ class IVRamp4WireBiasMeasurement(MatrixMeasurement, HVSourceMixin, VSourceMixin,
         self.set_series_unit("temperature_box", "degC")
         self.set_series_unit("temperature_chuck", "degC")
         self.set_series_unit("humidity_box", "%")
+        self.set_series_unit("environment_age", "s")
 
         # Series
         self.register_series("timestamp")
@@ -121,6 +124,7 @@ class IVRamp4WireBiasMeasurement(MatrixMeasurement, HVSourceMixin, VSourceMixin,
         self.register_series("temperature_box")
         self.register_series("temperature_chuck")
         self.register_series("humidity_box")
+        self.register_series("environment_age")
 
         # Initialize HV Source
 
@@ -232,6 +236,7 @@ class IVRamp4WireBiasMeasurement(MatrixMeasurement, HVSourceMixin, VSourceMixin,
 
         ramp = LinearRange(current, current_stop, current_step)
         est = Estimate(len(ramp))
+        self.reserve_series(len(ramp) + 2)  # ramp includes begin and end
         self.process.set_progress(*est.progress)
 
         t0 = time.time()
@@ -266,7 +271,8 @@ class IVRamp4WireBiasMeasurement(MatrixMeasurement, HVSourceMixin, VSourceMixin,
                 bias_voltage=bias_voltage,
                 temperature_box=self.environment_temperature_box,
                 temperature_chuck=self.environment_temperature_chuck,
-                humidity_box=self.environment_humidity_box
+                humidity_box=self.environment_humidity_box,
+                environment_age=self.environment_age
             )
 
             # Compliance tripped?
@@ -283,8 +289,8 @@ class IVRamp4WireBiasMeasurement(MatrixMeasurement, HVSourceMixin, VSourceMixin,
     def analyze(self, **kwargs):
         self.process.set_progress(0, 1)
 
-        i = np.array(self.get_series("current"))
-        v = np.array(self.get_series("voltage_vsrc"))
+        i = np.asarray(self.get_series(self.analysis_series["i"]))
+        v = np.asarray(self.get_series(self.analysis_series["v"]))
         self.analysis_iv(i, v)
 
         self.process.set_progress(1, 1)
@@ -7,6 +7,7 @@ import numpy as np
 from ..core.benchmark import Benchmark
 from ..core.estimate import Estimate
 from ..core.functions import LinearRange
+from ..core.integration import ELM_INTEGRATION_RATE
 from ..utils import format_metric
 from .matrix import MatrixMeasurement
 from .measurement import format_estimate
@@ -36,6 +37,8 @@ class IVRampElmMeasurement(MatrixMeasurement, HVSourceMixin, ElectrometerMixin,
 
     type = "iv_ramp_elm"
 
+    analysis_series = {"i": "current_elm", "v": "voltage"}
+
     required_instruments = ["hvsrc", "elm"]
 
     def __init__(self, *args, **kwargs):
@@ -56,7 +59,7 @@ class IVRampElmMeasurement(MatrixMeasurement, HVSourceMixin, ElectrometerMixin,
         self.register_parameter("elm_filter_count", 10, type=int)
         self.register_parameter("elm_filter_type", "repeat")
         self.register_parameter("elm_zero_correction", False, type=bool)
-        self.register_parameter("elm_integration_rate", 60, type=int)
+        self.register_parameter("elm_integration_rate", ELM_INTEGRATION_RATE, type=int)
         self.register_parameter("elm_current_range", comet.ureg("20 pA"), unit="A")
         self.register_parameter("elm_current_autorange_enable", False, type=bool)
         self.register_parameter("elm_current_autorange_minimum", comet.ureg("20 pA"), unit="A")
@@ -128,6 +131,7 @@ class IVRampElmMeasurement(MatrixMeasurement, HVSourceMixin, ElectrometerMixin,
         self.set_series_unit("temperature_box", "degC")
         self.set_series_unit("temperature_chuck", "degC")
         self.set_series_unit("humidity_box", "%")
+        self.set_series_unit("environment_age", "s")
 
         # Series
         self.register_series("timestamp")
@@ -137,6 +141,7 @@ class IVRampElmMeasurement(MatrixMeasurement, HVSourceMixin, ElectrometerMixin,
         self.register_series("temperature_box")
         self.register_series("temperature_chuck")
         self.register_series("humidity_box")
+        self.register_series("environment_age")
 
         self.hvsrc_reset(hvsrc)
         self.hvsrc_setup(hvsrc)
@@ -164,23 +169,26 @@ class IVRampElmMeasurement(MatrixMeasurement, HVSourceMixin, ElectrometerMixin,
         self.process.set_progress(2, 5)
 
         self.elm_safe_write(elm, "*RST")
-        self.elm_safe_write(elm, "*CLS")
+
+        messages = ["*CLS"]
 
         # Filter
-        self.elm_safe_write(elm, f":SENS:CURR:AVER:COUN {elm_filter_count:d}")
+        messages.append(f":SENS:CURR:AVER:COUN {elm_filter_count:d}")
 
         if elm_filter_type == "repeat":
-            self.elm_safe_write(elm, ":SENS:CURR:AVER:TCON REP")
+            messages.append(":SENS:CURR:AVER:TCON REP")
         elif elm_filter_type == "repeat":
-            self.elm_safe_write(elm, ":SENS:CURR:AVER:TCON MOV")
+            messages.append(":SENS:CURR:AVER:TCON MOV")
 
         if elm_filter_enable:
-            self.elm_safe_write(elm, ":SENS:CURR:AVER:STATE ON")
+            messages.append(":SENS:CURR:AVER:STATE ON")
         else:
-            self.elm_safe_write(elm, ":SENS:CURR:AVER:STATE OFF")
+            messages.append(":SENS:CURR:AVER:STATE OFF")
 
         nplc = elm_integration_rate / 10.
-        self.elm_safe_write(elm, f":SENS:CURR:NPLC {nplc:02f}")
+        messages.append(f":SENS:CURR:NPLC {nplc:02f}")
+
+        self.elm_safe_write_batch(elm, messages)
 
         self.elm_set_zero_check(elm, True)
         assert self.elm_get_zero_check(elm) is True, "failed to enable zero check"
@@ -188,13 +196,14 @@ class IVRampElmMeasurement(MatrixMeasurement, HVSourceMixin, ElectrometerMixin,
         self.elm_safe_write(elm, ":SENS:FUNC 'CURR'") # note the quotes!
         assert elm.resource.query(":SENS:FUNC?") == '"CURR:DC"\n', "failed to set sense function to current"
 
-        self.elm_safe_write(elm, f":SENS:CURR:RANG {elm_current_range:E}")
+        messages = [f":SENS:CURR:RANG {elm_current_range:E}"]
         if elm_zero_correction:
-            self.elm_safe_write(elm, ":SYST:ZCOR ON") # perform zero correction
+            messages.append(":SYST:ZCOR ON") # perform zero correction
         # Auto range
-        self.elm_safe_write(elm, f":SENS:CURR:RANG:AUTO {elm_current_autorange_enable:d}")
-        self.elm_safe_write(elm, f":SENS:CURR:RANG:AUTO:LLIM {elm_current_autorange_minimum:E}")
-        self.elm_safe_write(elm, f":SENS:CURR:RANG:AUTO:ULIM {elm_current_autorange_maximum:E}")
+        messages.append(f":SENS:CURR:RANG:AUTO {elm_current_autorange_enable:d}")
+        messages.append(f":SENS:CURR:RANG:AUTO:LLIM {elm_current_autorange_minimum:E}")
+        messages.append(f":SENS:CURR:RANG:AUTO:ULIM {elm_current_autorange_maximum:E}")
+        self.elm_safe_write_batch(elm, messages)
 
         self.elm_set_zero_check(elm, False)
         assert self.elm_get_zero_check(elm) is False, "failed to disable zero check"
@@ -241,6 +250,7 @@ class IVRampElmMeasurement(MatrixMeasurement, HVSourceMixin, ElectrometerMixin,
 
         ramp = LinearRange(voltage, voltage_stop, voltage_step)
         est = Estimate(len(ramp))
+        self.reserve_series(len(ramp) + 2)  # ramp includes begin and end
         self.process.set_progress(*est.progress)
 
         t0 = time.time()
@@ -296,7 +306,8 @@ class IVRampElmMeasurement(MatrixMeasurement, HVSourceMixin, ElectrometerMixin,
                     current_elm=elm_reading,
                     temperature_box=self.environment_temperature_box,
                     temperature_chuck=self.environment_temperature_chuck,
-                    humidity_box=self.environment_humidity_box
+                    humidity_box=self.environment_humidity_box,
+                    environment_age=self.environment_age
                 )
 
                 # Compliance tripped?
@@ -320,8 +331,8 @@ class IVRampElmMeasurement(MatrixMeasurement, HVSourceMixin, ElectrometerMixin,
     def analyze(self, **kwargs):
         self.process.set_progress(0, 1)
 
-        i = np.array(self.get_series("current_elm"))
-        v = np.array(self.get_series("voltage"))
+        i = np.asarray(self.get_series(self.analysis_series["i"]))
+        v = np.asarray(self.get_series(self.analysis_series["v"]))
         self.analysis_iv(i, v)
 
         self.process.set_progress(1, 1)
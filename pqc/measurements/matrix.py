@@ -16,6 +16,11 @@ class MatrixMeasurement(Measurement):
         super().__init__(*args, **kwargs)
         self.register_parameter("matrix_enable", True, type=bool)
         self.register_parameter("matrix_channels", [], type=list)
+        # Set by strategy if the next measurement follows on the same contact
+        self.keep_matrix_closed: bool = False
+
+    def is_delta_switching(self) -> bool:
+        return bool(self.process.config.get("matrix_delta_switching"))
 
     def before_initialize(self, **kwargs):
         """Setup matrix switch."""
@@ -25,14 +30,45 @@ class MatrixMeasurement(Measurement):
             matrix_channels = self.get_parameter("matrix_channels")
             logger.info("Matrix close channels: %s", matrix_channels)
             try:
-                self.process.station.matrix.safe_close_channels(matrix_channels)
+                if self.is_delta_switching():
+                    self.process.station.matrix.switch_channels(matrix_channels)
+                else:
+                    self.process.station.matrix.safe_close_channels(matrix_channels)
             except Exception as exc:
                 raise RuntimeError(f"Failed to close matrix channels {matrix_channels}, {exc.args}") from exc
+        elif self.is_delta_switching():
+            try:
+                self.process.station.matrix.release_channels()
+            except Exception as exc:
+                raise RuntimeError(f"Matrix failed to open channels, {exc.args}") from exc
+
+    def run(self, station) -> None:
+        """Run measurement, with delta switching all channels are opened and
+        the known matrix state is discarded if the measurement failed, so
+        that the next measurement closes its channels using `safe_close`.
+        """
+        try:
+            super().run(station)
+        except Exception:
+            if self.get_parameter("matrix_enable") and self.is_delta_switching():
+                self.reset_matrix(station)
+            raise
+
+    def reset_matrix(self, station) -> None:
+        logger.info("Matrix open all channels after failed measurement.")
+        try:
+            station.matrix.open_all_channels()
+        except Exception as exc:
+            logger.error("Matrix failed to open channels: %s", exc)
+        finally:
+            station.matrix.invalidate()
 
     def after_finalize(self, **kwargs):
         """Reset marix switch to a save state."""
         matrix_enable = self.get_parameter("matrix_enable")
-        if matrix_enable:
+        if matrix_enable and self.keep_matrix_closed and self.is_delta_switching():
+            logger.info("Matrix keep channels closed for next measurement.")
+        elif matrix_enable:
             try:
                 self.process.station.matrix.open_all_channels()
             except Exception as exc:
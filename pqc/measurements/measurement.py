@@ -1,7 +1,9 @@
 import contextlib
+import io
 import json
 import logging
 import math
+import os
 import time
 from datetime import timedelta
 from typing import Callable, List, Optional
@@ -10,6 +12,9 @@ import comet
 import numpy as np
 
 from ..core.formatter import PQCFormatter
+from ..core.npz import write_npz
+from ..core.series import SeriesStore
+from ..core.timer import Timer
 
 __all__ = ["Measurement"]
 
@@ -19,12 +24,15 @@ KEY_META = "meta"
 KEY_SERIES = "series"
 KEY_SERIES_UNITS = "series_units"
 KEY_ANALYSIS = "analysis"
+KEY_ANALYSIS_FUNCTIONS = "analysis_functions"
 
 
 class NumpyEncoder(json.JSONEncoder):
     def default(self, obj):
         if isinstance(obj, np.ndarray):
             return obj.tolist()
+        if isinstance(obj, SeriesStore):
+            return dict(obj)
         return super().default(obj)
 
 
@@ -61,38 +69,132 @@ def annotate_step(name):
 
 
 def serialize_json(data: dict, fp) -> None:
-    """Serialize data dictionary to JSON."""
-    json.dump(data, fp, indent=2, cls=NumpyEncoder)
+    """Serialize data dictionary to JSON, series are written as compact
+    arrays (one line per series).
+    """
+    indent = " " * 2
+    items = []
+    for key, value in data.items():
+        if key == KEY_SERIES:
+            columns = [
+                f"{indent * 2}{json.dumps(name)}: {json.dumps(np.asarray(column).tolist())}"
+                for name, column in value.items()
+            ]
+            if columns:
+                value = "{\n" + ",\n".join(columns) + f"\n{indent}}}"
+            else:
+                value = "{}"
+        else:
+            value = json.dumps(value, indent=2, cls=NumpyEncoder).replace("\n", f"\n{indent}")
+        items.append(f"{indent}{json.dumps(key)}: {value}")
+    fp.write("{\n" + ",\n".join(items) + "\n}")
 
 
-def serialize_txt(data: dict, fp) -> None:
-    """Serialize data dictionary to plain text."""
+def serialize_npz(data: dict, fp) -> None:
+    """Serialize data dictionary to binary NPZ, series as typed columns and
+    all other items as JSON header.
+    """
+    header = {key: value for key, value in data.items() if key != KEY_SERIES}
+    write_npz(fp, data.get(KEY_SERIES, {}), header, default=NumpyEncoder().default)
+
+
+def write_txt_header(fmt: PQCFormatter, data: dict) -> None:
+    """Write meta data and series header to plain text formatter."""
     meta = data.get("meta", {})
     series_units = data.get("series_units", {})
     series = data.get("series", {})
-    fmt = PQCFormatter(fp)
     # Write meta data
     for key, value in meta.items():
         if key == "measurement_tags":
             value = ", ".join([tag for tag in value if tag])
         fmt.write_meta(key, value)
     # Create columns
-    columns = list(series.keys())
-    for key in columns:
+    for key in series.keys():
         fmt.add_column(key, "E", unit=series_units.get(key))
     # Write header
     fmt.write_header()
+
+
+def serialize_txt(data: dict, fp) -> None:
+    """Serialize data dictionary to plain text."""
+    series = data.get("series", {})
+    fmt = PQCFormatter(fp)
+    write_txt_header(fmt, data)
     # Write series
-    if columns:
-        size = len(series.get(columns[0]))
-        for i in range(size):
-            row = {}
-            for key in columns:
-                row[key] = series.get(key)[i]
-            fmt.write_row(row)
+    fmt.write_columns(series)
     fmt.flush()
 
 
+def format_txt_header(data: dict) -> str:
+    """Return plain text meta data and series header."""
+    fp = io.StringIO()
+    write_txt_header(PQCFormatter(fp), data)
+    return fp.getvalue()
+
+
+class TxtSeriesWriter:
+    """Stream measurement data to a plain text file while measuring.
+
+    Meta data and header are written with the first row (or on close if no
+    rows were appended), rows are appended as they arrive and synced to disk
+    at least every sync_interval seconds. If meta data or series changed
+    after the first row, the file is rewritten on close (temporary file
+    replacing the streamed file). The resulting file is identical to
+    `serialize_txt` output.
+
+    >>> with TxtSeriesWriter("data.txt") as writer:
+    ...     writer.write_row(data, {"voltage": 1.0})
+    ...     writer.close(data)
+    """
+
+    def __init__(self, filename: str, sync_interval: float = 5.0) -> None:
+        self.filename: str = filename
+        self.sync_interval: float = sync_interval
+        self.fp = open(filename, "w", newline="")
+        self._fmt: Optional[PQCFormatter] = None
+        self._header: str = ""
+        self._timer: Timer = Timer()
+
+    def __enter__(self) -> "TxtSeriesWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.fp.close()
+
+    def _prepare(self, data: dict) -> PQCFormatter:
+        if self._fmt is None:
+            self._fmt = PQCFormatter(self.fp)
+            write_txt_header(self._fmt, data)
+            self._header = format_txt_header(data)
+        return self._fmt
+
+    def write_row(self, data: dict, row: dict) -> None:
+        fmt = self._prepare(data)
+        fmt.write_row(dict(row))
+        if self._timer.delta() >= self.sync_interval:
+            self.sync()
+
+    def sync(self) -> None:
+        """Flush buffers and sync file to disk."""
+        self.fp.flush()
+        os.fsync(self.fp.fileno())
+        self._timer.reset()
+
+    def close(self, data: dict) -> None:
+        """Finalize output, writing header if no rows were appended and
+        rewriting the file if the header changed since the first row."""
+        self._prepare(data)
+        self.sync()
+        self.fp.close()
+        if format_txt_header(data) != self._header:
+            logger.info("Meta data changed while streaming, rewriting %s", self.filename)
+            filename = f"{self.filename}.tmp"
+            with open(filename, "w", newline="") as fp:
+                serialize_txt(data, fp)
+                os.fsync(fp.fileno())
+            os.replace(filename, self.filename)
+
+
 class ParameterType:
 
     def __init__(self, key, default, values, unit, type, required):
@@ -112,6 +214,7 @@ class Measurement:
     required_instruments: list = []
 
     def __init__(self, process, measurement_parameters, measurement_default_parameters, timestamp: float) -> None:
+        super().__init__()  # initialize mixins
         self.process = process
         self.measurement_parameters: dict = measurement_parameters
         self.measurement_default_parameters: dict = measurement_default_parameters
@@ -120,8 +223,10 @@ class Measurement:
         self._data: dict = {}
         self._data[KEY_META] = {}
         self._data[KEY_SERIES_UNITS] = {}
-        self._data[KEY_SERIES] = {}
+        self._data[KEY_SERIES] = SeriesStore()
         self._data[KEY_ANALYSIS] = {}
+        self.series_writers: list = []
+        self.finalized_callbacks: List[Callable] = []
 
     @property
     def data(self):
@@ -177,23 +282,23 @@ class Measurement:
         self.data.get(KEY_SERIES_UNITS)[key] = value
 
     def register_series(self, key):
-        series = self.data.get(KEY_SERIES)
-        if key in series:
-            raise KeyError(f"Series already exists: {key}")
-        series[key] = []
+        self.data.get(KEY_SERIES).register(key)
+
+    def reserve_series(self, count):
+        """Reserve series storage for count rows, e.g. from ramp length."""
+        self.data.get(KEY_SERIES).reserve(count)
 
     def get_series(self, key):
-        return self.data.get(KEY_SERIES).get(key, [])
+        """Return read-only array view of series."""
+        return self.data.get(KEY_SERIES).get(key, np.empty(0))
 
     def set_analysis(self, key, value):
         self.data.get(KEY_ANALYSIS)[key] = value
 
     def append_series(self, **kwargs):
-        series = self.data.get(KEY_SERIES)
-        if sorted(series.keys()) != sorted(kwargs.keys()):
-            raise KeyError("Inconsistent series keys")
-        for key, value in kwargs.items():
-            series.get(key).append(value)
+        self.data.get(KEY_SERIES).append(kwargs)
+        for writer in self.series_writers:
+            writer.write_row(self.data, kwargs)
 
     def wait(self, seconds, interval=1.0):
         logger.info("Waiting %s s...", seconds)
@@ -275,13 +380,15 @@ class Measurement:
             kwargs = {}
             for key in type(self).required_instruments:
                 cls = station.create_instrument(key)
-                resource = station.resources.get(key)
-                kwargs.update({key: cls(es.enter_context(resource))})
+                kwargs.update({key: cls(es.enter_context(station.lease(key)))})
             try:
                 self._initialize(**kwargs)
                 self._measure(**kwargs)
             finally:
                 try:
                     self._finalize(**kwargs)
+                    # Instruments are in a safe state (only if finalize succeeded)
+                    for callback in self.finalized_callbacks:
+                        callback()
                 finally:
                     self._analyze(**kwargs)
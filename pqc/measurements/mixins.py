@@ -1,16 +1,24 @@
+import functools
+import json
 import logging
 import math
+import threading
 import time
+from typing import Callable, Dict, List, Optional
 
 import analysis_pqc
 import comet
+import numpy as np
 
+from ..core.analysis import AnalysisResultCache, analysis_key
 from ..core.filters import std_mean_filter
+from ..core.integration import LINE_FREQUENCY, integration_time, poll_interval
+from ..core.scpi import write_batch
 from ..core.timer import Timer
 from ..instruments.k2657a import K2657AInstrument
 from ..settings import settings
 from ..utils import format_metric
-from .measurement import ComplianceError, InstrumentError
+from .measurement import KEY_ANALYSIS_FUNCTIONS, ComplianceError, InstrumentError
 
 __all__ = [
     "HVSourceMixin",
@@ -18,7 +26,9 @@ __all__ = [
     "ElectrometerMixin",
     "LCRMixin",
     "EnvironmentMixin",
-    "AnalysisMixin"
+    "AnalysisMixin",
+    "AnalysisRegistry",
+    "analysis_registry",
 ]
 
 logger = logging.getLogger(__name__)
@@ -192,6 +202,15 @@ class HVSourceMixin(Mixin):
         logger.info("HV Source current reading: %s", format_metric(current, "A"))
         return current
 
+    def hvsrc_sweep_voltage_list(self, hvsrc, voltages, delay):
+        """Run buffered voltage sweep, returns list of current readings."""
+        logger.info("HV Source buffered sweep: from %s to %s (%d points)", format_metric(voltages[0], "V"), format_metric(voltages[-1], "V"), len(voltages))
+        currents = hvsrc.sweep_voltage_list(voltages, delay)
+        self.hvsrc_check_error(hvsrc)
+        if len(currents) != len(voltages) and not self.hvsrc_compliance_tripped(hvsrc):
+            raise InstrumentError(f"HV Source buffered sweep returned {len(currents)} of {len(voltages)} readings")
+        return currents
+
 
 class VSourceMixin(Mixin):
 
@@ -366,11 +385,41 @@ class VSourceMixin(Mixin):
 
 class ElectrometerMixin(Mixin):
 
+    def __init__(self) -> None:
+        super().__init__()
+        self.elm_line_frequency: Optional[float] = None
+        self.elm_read_configured: bool = False
+
     def register_elm(self):
         self.register_parameter("elm_read_timeout", comet.ureg("60 s"), unit="s")
+        self.register_parameter("elm_read_mode", "poll", values=("poll", "read"))
 
     def elm_update_meta(self):
         """Update meta data parameters."""
+        elm_read_mode = self.get_parameter("elm_read_mode")
+
+        self.set_meta("elm_read_mode", elm_read_mode)
+
+    def elm_get_line_frequency(self, elm):
+        """Return power line frequency in Hz detected by the electrometer,
+        read once per measurement (defaults to 50 Hz if not available)."""
+        if self.elm_line_frequency is None:
+            try:
+                self.elm_line_frequency = float(elm.resource.query(":SYST:LFR?"))
+            except Exception as exc:
+                logger.warning("Failed to read ELM line frequency, assuming %s Hz: %s", LINE_FREQUENCY, exc)
+                self.elm_line_frequency = LINE_FREQUENCY
+            else:
+                logger.info("ELM line frequency: %s Hz", self.elm_line_frequency)
+        return self.elm_line_frequency
+
+    def elm_integration_time(self, line_frequency=LINE_FREQUENCY):
+        """Return expected electrometer integration time in seconds."""
+        nplc = self.get_parameter("elm_integration_rate") / 10.
+        count = 1
+        if self.get_parameter("elm_filter_enable"):
+            count = self.get_parameter("elm_filter_count")
+        return integration_time(nplc, count, line_frequency)
 
     def elm_check_error(self, elm):
         try:
@@ -399,8 +448,63 @@ class ElectrometerMixin(Mixin):
             raise RuntimeError(f"Failed to read operation complete from ELM for message: {message!r}, {exc}") from exc
         self.elm_check_error(elm)
 
-    def elm_read(self, elm, timeout=60.0, interval=0.25):
-        """Perform electrometer reading with timeout."""
+    def elm_safe_write_batch(self, elm, messages):
+        """Write batch of messages concatenated to as few writes as possible,
+        wait once for operation complete and test for errors (see
+        `write_batch`).
+        """
+        write_batch(elm.resource, messages, lambda: self.elm_check_error(elm), name="ELM")
+
+    def elm_read(self, elm, timeout=60.0, interval=None):
+        """Perform electrometer reading with timeout.
+
+        In read mode a single blocking :READ? is issued, the resource timeout
+        being extended to cover the expected integration time. In poll mode
+        the event status register is polled with an interval derived from the
+        expected integration time (unless interval is given).
+        """
+        duration = self.elm_integration_time(self.elm_get_line_frequency(elm))
+        timeout = max(timeout, duration * 2 + 1.0)
+        if self.get_parameter("elm_read_mode") == "read":
+            return self.elm_read_blocking(elm, timeout)
+        if interval is None:
+            interval = poll_interval(duration)
+        return self.elm_read_poll(elm, timeout, interval, duration)
+
+    def elm_setup_read(self, elm):
+        """Configure trigger model for blocking reads, once per measurement.
+
+        A :READ? aborts, initiates a single arm and trigger cycle and
+        fetches the latest reading, the reading buffer is not used.
+        """
+        if not self.elm_read_configured:
+            self.elm_safe_write_batch(elm, [
+                ":INIT:CONT OFF",
+                ":ARM:SOUR IMM",
+                ":ARM:COUN 1",
+                ":TRIG:SOUR IMM",
+                ":TRIG:COUN 1",
+                ":TRAC:FEED:CONT NEV",
+            ])
+            self.elm_read_configured = True
+
+    def elm_read_blocking(self, elm, timeout):
+        """Perform blocking electrometer reading."""
+        self.elm_setup_read(elm)
+        logger.info("Read ELM measurement...")
+        resource_timeout = elm.resource.timeout
+        try:
+            # Timeout of resource is in milliseconds
+            elm.resource.timeout = timeout * 1e3
+            result = elm.resource.query(":READ?")
+        except Exception as exc:
+            raise RuntimeError(f"Failed to read ELM reading within {timeout:G} s: {exc}") from exc
+        finally:
+            elm.resource.timeout = resource_timeout
+        return float(result.split(",")[0])
+
+    def elm_read_poll(self, elm, timeout, interval, duration=0.):
+        """Perform electrometer reading polling event status register."""
         # Request operation complete
         elm.resource.write("*CLS")
         elm.resource.write("*OPC")
@@ -409,6 +513,8 @@ class ElectrometerMixin(Mixin):
         elm.resource.write(":INIT")
         t = Timer()
         interval = min(timeout, interval)
+        # Skip polling while integrating
+        time.sleep(min(timeout, duration))
         logger.info("Poll ELM event status register...")
         while t.delta() < timeout:
             # Read event status
@@ -484,6 +590,13 @@ class LCRMixin(Mixin):
         device.resource.query("*OPC?")
         self.lcr_check_error(device)
 
+    def lcr_safe_write_batch(self, device, messages):
+        """Write batch of messages concatenated to as few writes as possible,
+        wait once for operation complete and test for error (see
+        `write_batch`).
+        """
+        write_batch(device.resource, messages, lambda: self.lcr_check_error(device), name="LCR")
+
     def lcr_reset(self, lcr):
         lcr.reset()
         lcr.clear()
@@ -500,17 +613,19 @@ class LCRMixin(Mixin):
         lcr_open_correction_mode = self.get_parameter("lcr_open_correction_mode")
         lcr_open_correction_channel = self.get_parameter("lcr_open_correction_channel")
 
-        self.lcr_safe_write(lcr, f":AMPL:ALC {lcr_auto_level_control:d}")
-        self.lcr_safe_write(lcr, f":VOLT {lcr_amplitude:E}V")
-        self.lcr_safe_write(lcr, f":FREQ {lcr_frequency:.0f}HZ")
-        self.lcr_safe_write(lcr, ":FUNC:IMP:RANG:AUTO ON")
-        self.lcr_safe_write(lcr, ":FUNC:IMP:TYPE CPRP")
         integration = {"short": "SHOR", "medium": "MED", "long": "LONG"}[lcr_integration_time]
-        self.lcr_safe_write(lcr, f":APER {integration},{lcr_averaging_rate:d}")
-        self.lcr_safe_write(lcr, ":INIT:CONT OFF")
-        self.lcr_safe_write(lcr, ":TRIG:SOUR BUS")
         method = {"single": "SING", "multi": "MULT"}[lcr_open_correction_mode]
-        self.lcr_safe_write(lcr, ":CORR:METH SING")
+        self.lcr_safe_write_batch(lcr, [
+            f":AMPL:ALC {lcr_auto_level_control:d}",
+            f":VOLT {lcr_amplitude:E}V",
+            f":FREQ {lcr_frequency:.0f}HZ",
+            ":FUNC:IMP:RANG:AUTO ON",
+            ":FUNC:IMP:TYPE CPRP",
+            f":APER {integration},{lcr_averaging_rate:d}",
+            ":INIT:CONT OFF",
+            ":TRIG:SOUR BUS",
+            ":CORR:METH SING",
+        ])
         #self.lcr_safe_write(lcr, f":CORR:USE:CHAN {lcr_open_correction_channel:d}")
 
     def lcr_acquire_reading(self, lcr):
@@ -572,18 +687,26 @@ class EnvironmentMixin(Mixin):
         self.environment_temperature_box = float("nan")
         self.environment_temperature_chuck = float("nan")
         self.environment_humidity_box = float("nan")
+        self.environment_age = float("nan")
 
     def environment_update(self):
         self.environment_clear()
         if self.process.config.get("use_environ"):
-            with self.process.station.environ_worker as environ_worker:
-                pc_data = environ_worker.pc_data()
+            # Use snapshot of monitoring if fresh enough, no worker lock required
+            max_age = self.process.config.get("environ_max_age")
+            snapshot = self.process.station.environ_worker.pc_data_snapshot(max_age)
+            pc_data = snapshot.value
             self.environment_temperature_box = pc_data.box_temperature
-            logger.info("Box temperature: %.2f degC", self.environment_temperature_box)
             self.environment_temperature_chuck = pc_data.chuck_temperature
-            logger.info("Chuck temperature: %.2f degC", self.environment_temperature_chuck)
             self.environment_humidity_box = pc_data.box_humidity
-            logger.info("Box humidity: %.2f %%rH", self.environment_humidity_box)
+            self.environment_age = snapshot.age()
+            logger.debug(
+                "Environment: box %.2f degC, chuck %.2f degC, box %.2f %%rH (%.1f s old)",
+                self.environment_temperature_box,
+                self.environment_temperature_chuck,
+                self.environment_humidity_box,
+                self.environment_age,
+            )
         self.process.update_state({
             "env_chuck_temperature": self.environment_temperature_chuck,
             "env_box_temperature": self.environment_temperature_box,
@@ -596,6 +719,18 @@ class AnalysisError(Exception):
     ...
 
 
+@functools.lru_cache(maxsize=None)
+def resolve_analysis_function(type: str) -> Callable:
+    """Return analysis function by type name (memoized).
+
+    Raises `KeyError` if no such analysis function exists.
+    """
+    f = analysis_pqc.__dict__.get(f"{AnalysisFunction.prefix}{type}")
+    if not callable(f):
+        raise KeyError(f"No such analysis function: {type}")
+    return f
+
+
 class AnalysisFunction:
 
     prefix = "analyse_"
@@ -609,14 +744,21 @@ class AnalysisFunction:
         self.type = config.get("type")
         self.parameters = config.get("parameters", {})
         self.limits = config.get("limits", {})
+        self.function = resolve_analysis_function(self.type)
+
+    def asdict(self) -> dict:
+        return {"type": self.type, "parameters": self.parameters, "limits": self.limits}
 
     def __call__(self, **kwargs):
-        f = analysis_pqc.__dict__.get(f"{self.prefix}{self.type}")
-        if not callable(f):
-            raise KeyError(f"No such analysis function: {self.type}")
+        key = analysis_key(self.type, self.parameters, kwargs)
+        r = analysis_results.get(key)
+        if r is not None:
+            logger.info("Using cached result of analysis function %r.", self.type)
+            return r
         logger.info("Running analysis function %r...", self.type)
-        r = f(**kwargs)
+        r = self.function(**kwargs)
         logger.info("Running analysis function %r... done.", self.type)
+        analysis_results.set(key, r)
         return r
 
     def verify(self, result):
@@ -637,17 +779,50 @@ class AnalysisFunction:
                 logger.warning("No such limit: %s for %s", key, self.type)
 
 
+class AnalysisRegistry:
+    """Analysis functions resolved once per configuration.
+
+    >>> functions = analysis_registry.validate(["iv", {"type": "cv"}])
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._functions: Dict[str, AnalysisFunction] = {}
+
+    def get(self, config) -> AnalysisFunction:
+        """Return analysis function for configuration, raises `KeyError` on
+        missing or unknown analysis function type."""
+        key = json.dumps(config, sort_keys=True, default=str)
+        with self._lock:
+            f = self._functions.get(key)
+            if f is None:
+                f = AnalysisFunction(config)
+                self._functions[key] = f
+            return f
+
+    def validate(self, configs) -> List[AnalysisFunction]:
+        """Return analysis functions for list of configurations."""
+        return [self.get(config) for config in configs or []]
+
+
+analysis_registry = AnalysisRegistry()
+"""Shared registry of resolved analysis functions."""
+
+analysis_results = AnalysisResultCache()
+"""Shared cache of analysis results by content address."""
+
+
 class AnalysisMixin(Mixin):
 
+    analysis_series: Dict[str, str] = {}
+    """Analysis function arguments mapped to series names, e.g. `{"i": "current", "v": "voltage"}`."""
+
     def register_analysis(self):
         self.register_parameter("analysis_functions", [], type=list)
 
     def analysis_functions(self):
         """Return analysis functions."""
-        functions = []
-        for config in self.get_parameter("analysis_functions"):
-            functions.append(AnalysisFunction(config))
-        return functions
+        return analysis_registry.validate(self.get_parameter("analysis_functions"))
 
     def analysis_iv(self, i, v):
         if len(i) > 1 and len(v) > 1:
@@ -659,7 +834,10 @@ class AnalysisMixin(Mixin):
 
     def analysis_all(self, **kwargs):
         results = []
-        for f in self.analysis_functions():
+        functions = self.analysis_functions()
+        # Store configuration for offline re-analysis (pqc-analyze)
+        self.data[KEY_ANALYSIS_FUNCTIONS] = [f.asdict() for f in functions]
+        for f in functions:
             r = f(**kwargs)
             logger.info(r)
             results.append((f, r))
@@ -667,8 +845,8 @@ class AnalysisMixin(Mixin):
             self.set_analysis(key, values)
             self.process.append_analysis(key, values)
             if "x_fit" in r._asdict():
-                for x, y in [(x, r.a * x + r.b) for x in r.x_fit]:
-                    self.process.append_reading("xfit", x, y)
+                x_fit = np.asarray(r.x_fit, dtype=float)
+                self.process.append_readings("xfit", x_fit, r.a * x_fit + r.b)
                 self.process.update_readings()
         for f, r in results:
             f.verify(r)
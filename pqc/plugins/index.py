@@ -0,0 +1,25 @@
+import logging
+import os
+
+from ..core.index import MeasurementIndex
+
+__all__ = ["IndexPlugin"]
+
+logger = logging.getLogger(__name__)
+
+
+class IndexPlugin:
+    """Add finished measurements to the output directory index."""
+
+    def __init__(self, window) -> None:
+        self.window = window
+
+    def on_measurement_finished(self, data: dict) -> None:
+        output_path = self.window.dashboard.outputDir()
+        if output_path and os.path.exists(output_path):
+            try:
+                with MeasurementIndex.from_output_dir(output_path) as index:
+                    index.add(data)
+            except Exception as exc:
+                logger.exception(exc)
+                logger.error("Failed to update output directory index: %s", output_path)
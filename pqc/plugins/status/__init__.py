@@ -1,5 +1,5 @@
 import threading
-from typing import Optional
+from typing import Dict, Optional
 
 from PyQt5 import QtCore, QtWidgets
 
@@ -89,6 +89,12 @@ class StatusWidget(QtWidgets.QWidget):
         self.envModelLineEdit = QtWidgets.QLineEdit()
         self.envModelLineEdit.setReadOnly(True)
 
+        self.latencyLineEdits: Dict[str, QtWidgets.QLineEdit] = {}
+        for name in ("matrix", "hvsrc", "vsrc", "lcr", "elm", "table", "env"):
+            lineEdit = QtWidgets.QLineEdit()
+            lineEdit.setReadOnly(True)
+            self.latencyLineEdits[name] = lineEdit
+
         self.reloadButton = QtWidgets.QPushButton()
         self.reloadButton.setText("&Reload")
         self.reloadButton.clicked.connect(self.reloadClicked.emit)
@@ -99,30 +105,35 @@ class StatusWidget(QtWidgets.QWidget):
         matrixGroupBoxLayout = QtWidgets.QFormLayout(matrixGroupBox)
         matrixGroupBoxLayout.addRow("Model", self.matrixModelLineEdit)
         matrixGroupBoxLayout.addRow("Closed channels", self.matrixChannelsLineEdit)
+        matrixGroupBoxLayout.addRow("Response", self.latencyLineEdits["matrix"])
 
         hvSourceGroupBox = QtWidgets.QGroupBox()
         hvSourceGroupBox.setTitle("HVSource")
 
         hvSourceGroupBoxLayout = QtWidgets.QFormLayout(hvSourceGroupBox)
         hvSourceGroupBoxLayout.addRow("Model", self.hvSourceModelLineEdit)
+        hvSourceGroupBoxLayout.addRow("Response", self.latencyLineEdits["hvsrc"])
 
         vSourceGroupBox = QtWidgets.QGroupBox()
         vSourceGroupBox.setTitle("VSource")
 
         vSourceGroupBoxLayout = QtWidgets.QFormLayout(vSourceGroupBox)
         vSourceGroupBoxLayout.addRow("Model", self.vSourceModelLineEdit)
+        vSourceGroupBoxLayout.addRow("Response", self.latencyLineEdits["vsrc"])
 
         lcrGroupBox = QtWidgets.QGroupBox()
         lcrGroupBox.setTitle("LCRMeter")
 
         lcrGroupBoxLayout = QtWidgets.QFormLayout(lcrGroupBox)
         lcrGroupBoxLayout.addRow("Model", self.lcrModelLineEdit)
+        lcrGroupBoxLayout.addRow("Response", self.latencyLineEdits["lcr"])
 
         elmGroupBox = QtWidgets.QGroupBox()
         elmGroupBox.setTitle("Electrometer")
 
         elmGroupBoxLayout = QtWidgets.QFormLayout(elmGroupBox)
         elmGroupBoxLayout.addRow("Model", self.elmModelLineEdit)
+        elmGroupBoxLayout.addRow("Response", self.latencyLineEdits["elm"])
 
         tableGroupBox = QtWidgets.QGroupBox()
         tableGroupBox.setTitle("Table")
@@ -130,12 +141,14 @@ class StatusWidget(QtWidgets.QWidget):
         tableGroupBoxLayout = QtWidgets.QFormLayout(tableGroupBox)
         tableGroupBoxLayout.addRow("Model", self.tableModelLineEdit)
         tableGroupBoxLayout.addRow("State", self.tableStateLineEdit)
+        tableGroupBoxLayout.addRow("Response", self.latencyLineEdits["table"])
 
         environGroupBox = QtWidgets.QGroupBox()
         environGroupBox.setTitle("Environment Box")
 
         environGroupBoxLayout = QtWidgets.QFormLayout(environGroupBox)
         environGroupBoxLayout.addRow("Model", self.envModelLineEdit)
+        environGroupBoxLayout.addRow("Response", self.latencyLineEdits["env"])
 
         layout = QtWidgets.QVBoxLayout(self)
         layout.addWidget(matrixGroupBox)
@@ -158,6 +171,8 @@ class StatusWidget(QtWidgets.QWidget):
         self.tableModelLineEdit.clear()
         self.tableStateLineEdit.clear()
         self.envModelLineEdit.clear()
+        for lineEdit in self.latencyLineEdits.values():
+            lineEdit.clear()
 
     def updateStatus(self, data: dict):
         default = "n/a"
@@ -170,6 +185,14 @@ class StatusWidget(QtWidgets.QWidget):
         self.tableModelLineEdit.setText(data.get("table_model", default))
         self.tableStateLineEdit.setText(data.get("table_state", default))
         self.envModelLineEdit.setText(data.get("env_model", default))
+        for name, lineEdit in self.latencyLineEdits.items():
+            latency = data.get(f"{name}_latency")
+            if data.get(f"{name}_timeout"):
+                lineEdit.setText("timeout")
+            elif latency is None:
+                lineEdit.setText(default)
+            else:
+                lineEdit.setText(f"{latency:.3f} s")
 
     def setLocked(self, state: bool) -> None:
         self.reloadButton.setEnabled(not state)
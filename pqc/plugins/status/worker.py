@@ -1,14 +1,37 @@
 import logging
+from typing import Callable, Dict
 
 from PyQt5 import QtCore
 
 from comet.resource import ResourceError
 
+from ...core.probe import ProbeResult, run_probes
+
 __all__ = ["StatusWorker"]
 
+logger = logging.getLogger(__name__)
+
 
 class StatusWorker(QtCore.QObject):
-    """Reload instruments status."""
+    """Reload instruments status, instruments are probed concurrently and
+    each result is emitted as soon as it arrives.
+    """
+
+    labels: Dict[str, str] = {
+        "matrix": "Matrix",
+        "hvsrc": "HVSource",
+        "vsrc": "VSource",
+        "lcr": "LCRMeter",
+        "elm": "Electrometer",
+        "table": "Table",
+        "env": "Environment Box",
+    }
+
+    default_timeout: float = 10.0
+    lease_timeout: float = 5.0
+    timeouts: Dict[str, float] = {
+        "table": 12.0,
+    }
 
     messageChanged = QtCore.pyqtSignal(str)
     progressChanged = QtCore.pyqtSignal(int, int)
@@ -21,6 +44,7 @@ class StatusWorker(QtCore.QObject):
         self.station = station
         self.config: dict = {}
         self.data: dict = {}
+        self.completed: int = 0
 
     def updateMessage(self, message: str) -> None:
         self.messageChanged.emit(message)
@@ -28,126 +52,139 @@ class StatusWorker(QtCore.QObject):
     def updateProgress(self, value: float, maximum: float) -> None:
         self.progressChanged.emit(value, maximum)
 
-    def read_matrix(self):
-        self.data.update({"matrix_model": ""})
-        self.data.update({"matrix_channels": ""})
+    def read_matrix(self) -> dict:
+        data = {"matrix_model": "", "matrix_channels": ""}
         try:
-            model = self.station.matrix.identify()
-            self.data.update({"matrix_model": model})
-            channels = self.station.matrix.closed_channels()
-            self.data.update({"matrix_channels": ",".join(channels)})
+            # Nested leases of matrix role reuse this lease
+            with self.station.lease("matrix", self.lease_timeout):
+                model = self.station.matrix.identify()
+                data.update({"matrix_model": model})
+                channels = self.station.matrix.closed_channels()
+                data.update({"matrix_channels": ",".join(channels)})
+        except TimeoutError:
+            raise
         except (ResourceError, OSError):
             ...
-        self.dataChanged.emit(self.data.copy())
+        return data
 
-    def read_hvsrc(self):
-        self.data.update({"hvsrc_model": ""})
+    def read_hvsrc(self) -> dict:
+        data = {"hvsrc_model": ""}
         try:
-            with self.station.hvsrc_resource as hvsrc_res:
+            with self.station.lease("hvsrc", self.lease_timeout) as hvsrc_res:
                 model = hvsrc_res.query("*IDN?")
-                self.data.update({"hvsrc_model": model})
+                data.update({"hvsrc_model": model})
+        except TimeoutError:
+            raise
         except (ResourceError, OSError):
             ...
-        self.dataChanged.emit(self.data.copy())
+        return data
 
-    def read_vsrc(self):
-        self.data.update({"vsrc_model": ""})
+    def read_vsrc(self) -> dict:
+        data = {"vsrc_model": ""}
         try:
-            with self.station.vsrc_resource as vsrc_res:
+            with self.station.lease("vsrc", self.lease_timeout) as vsrc_res:
                 model = vsrc_res.query("*IDN?")
-                self.data.update({"vsrc_model": model})
+                data.update({"vsrc_model": model})
+        except TimeoutError:
+            raise
         except (ResourceError, OSError):
             ...
-        self.dataChanged.emit(self.data.copy())
+        return data
 
-    def read_lcr(self):
-        self.data.update({"lcr_model": ""})
+    def read_lcr(self) -> dict:
+        data = {"lcr_model": ""}
         try:
-            with self.station.lcr_resource as lcr_res:
+            with self.station.lease("lcr", self.lease_timeout) as lcr_res:
                 model = lcr_res.query("*IDN?")
-                self.data.update({"lcr_model": model})
+                data.update({"lcr_model": model})
+        except TimeoutError:
+            raise
         except (ResourceError, OSError):
             ...
-        self.dataChanged.emit(self.data.copy())
+        return data
 
-    def read_elm(self):
-        self.data.update({"elm_model": ""})
+    def read_elm(self) -> dict:
+        data = {"elm_model": ""}
         try:
-            with self.station.elm_resource as elm_res:
+            with self.station.lease("elm", self.lease_timeout) as elm_res:
                 model = elm_res.query("*IDN?")
-                self.data.update({"elm_model": model})
+                data.update({"elm_model": model})
+        except TimeoutError:
+            raise
         except (ResourceError, OSError):
             ...
-        self.dataChanged.emit(self.data.copy())
+        return data
 
-    def read_table(self):
-        self.data.update({"table_model": ""})
-        self.data.update({"table_state": ""})
+    def read_table(self) -> dict:
+        data = {"table_model": "", "table_state": ""}
         if self.config.get("use_table", False):
             try:
                 table_worker = self.station.table_worker
                 model = table_worker.get_identification().get(timeout=5.0)
                 caldone = table_worker.is_calibrated().get(timeout=5.0)
-                self.data.update({"table_model": model})
+                data.update({"table_model": model})
                 if caldone:
                     state = "CALIBRATED"
                 else:
                     state = "NOT CALIBRATED"
-                self.data.update({"table_state": state})
+                data.update({"table_state": state})
             except (ResourceError, OSError):
                 ...
-        self.dataChanged.emit(self.data.copy())
+        return data
 
-    def read_environ(self):
-        self.data.update({"env_model": ""})
-        self.data.update({"env_pc_data": None})
+    def read_environ(self) -> dict:
+        data = {"env_model": "", "env_pc_data": None}
         if self.config.get("use_environ", False):
             try:
                 with self.station.environ_worker as environ_worker:
                     model = environ_worker.identification()
-                    self.data.update({"env_model": model})
+                    data.update({"env_model": model})
                     pc_data = environ_worker.pc_data()
-                    self.data.update({"env_pc_data": pc_data})
+                    data.update({"env_pc_data": pc_data})
             except (ResourceError, OSError):
                 ...
+        return data
+
+    def probes(self) -> Dict[str, Callable[[], dict]]:
+        return {
+            "matrix": self.read_matrix,
+            "hvsrc": self.read_hvsrc,
+            "vsrc": self.read_vsrc,
+            "lcr": self.read_lcr,
+            "elm": self.read_elm,
+            "table": self.read_table,
+            "env": self.read_environ,
+        }
+
+    def handle_result(self, result: ProbeResult) -> None:
+        if isinstance(result.error, TimeoutError):
+            logger.warning("%s", result.error)
+            self.data.update({f"{result.name}_timeout": True})
+        elif result.error is not None:
+            logger.error("%s: %s", result.name, result.error, exc_info=result.error)
+            self.failed.emit(result.error)
+        else:
+            self.data.update(result.value)
+        self.data.update({f"{result.name}_latency": result.latency})
+        logger.info("Status of %s: %.3f s", self.labels.get(result.name, result.name), result.latency)
+        self.completed += 1
+        self.updateMessage(f"Read {self.labels.get(result.name, result.name)} ({result.latency:.2f} s)")
+        self.updateProgress(self.completed, len(self.labels))
         self.dataChanged.emit(self.data.copy())
 
     def __call__(self) -> None:
         try:
             self.data.clear()
+            self.completed = 0
 
-            self.updateMessage("Reading Matrix...")
-            self.updateProgress(0, 7)
-            self.read_matrix()
-
-            self.updateMessage("Reading HVSource...")
-            self.updateProgress(1, 7)
-            self.read_hvsrc()
-
-            self.updateMessage("Read VSource...")
-            self.updateProgress(2, 7)
-            self.read_vsrc()
-
-            self.updateMessage("Read LCRMeter...")
-            self.updateProgress(3, 7)
-            self.read_lcr()
-
-            self.updateMessage("Read Electrometer...")
-            self.updateProgress(4, 7)
-            self.read_elm()
-
-            self.updateMessage("Read Table...")
-            self.updateProgress(5, 7)
-            self.read_table()
-
-            self.updateMessage("Read Environment Box...")
-            self.updateProgress(6, 7)
-            self.read_environ()
+            self.updateMessage("Reading instruments...")
+            self.updateProgress(0, len(self.labels))
+            run_probes(self.probes(), self.timeouts, self.handle_result, self.default_timeout)
 
             self.updateMessage("")
-            self.updateProgress(7, 7)
+            self.updateProgress(len(self.labels), len(self.labels))
         except Exception as exc:
-            logging.exception(exc)
+            logger.exception(exc)
             self.failed.emit(exc)
         finally:
             self.finished.emit()
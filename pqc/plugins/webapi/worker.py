@@ -93,6 +93,18 @@ class WebAPIWorker(comet.Process):
                 }
             })
 
+        @app.route("/sequence")
+        def sequence():
+            return jsonify({
+                "sequence": self._sequence_estimate()
+            })
+
+        @app.route("/workers")
+        def workers():
+            return jsonify({
+                "workers": self._worker_metrics()
+            })
+
         self.server = WSGIServer(app, host=self.host, port=self.port)
         self.server.run()
         self.server = None
@@ -116,6 +128,32 @@ class WebAPIWorker(comet.Process):
             "z": metric(z, "mm")
         }
 
+    def _sequence_estimate(self):
+        estimate = self.station.state.get("sequence_estimate")
+        if not estimate:
+            return {"running": False, "total": None, "remaining": None, "eta": None}
+        return {
+            "running": True,
+            "total": metric(estimate.get("total"), "s"),
+            "remaining": metric(estimate.get("remaining"), "s"),
+            "eta": estimate.get("eta"),
+        }
+
+    def _worker_metrics(self):
+        metrics = {}
+        environ_worker = self.station.environ_worker
+        if environ_worker:
+            data = environ_worker.metrics()
+            data["latency"] = {
+                str(priority): {
+                    "count": latency.get("count"),
+                    "mean": metric(latency.get("mean"), "s"),
+                    "max": metric(latency.get("max"), "s"),
+                } for priority, latency in data.get("latency", {}).items()
+            }
+            metrics[environ_worker.name] = data
+        return metrics
+
     def _contact_quality(self):
         contact_quality = self.station.state.get("contact_quality", {})
         cp = contact_quality.get("cp")
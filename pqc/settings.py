@@ -177,6 +177,54 @@ class Settings(SettingsMixin):
     def table_contact_delay(self, value: float) -> None:
         self.settings["table_contact_delay"] = float(value)
 
+    @property
+    def table_pipelined_moves(self) -> bool:
+        return bool(self.settings.get("table_pipelined_moves", False))
+
+    @table_pipelined_moves.setter
+    def table_pipelined_moves(self, value: bool) -> None:
+        self.settings["table_pipelined_moves"] = bool(value)
+
+    @property
+    def table_dodge_moves(self) -> bool:
+        return bool(self.settings.get("table_dodge_moves", False))
+
+    @table_dodge_moves.setter
+    def table_dodge_moves(self, value: bool) -> None:
+        self.settings["table_dodge_moves"] = bool(value)
+
+    @property
+    def table_dodge_distance(self) -> float:
+        return abs(safe_float(self.settings.get("table_dodge_distance"), 10.0))
+
+    @table_dodge_distance.setter
+    def table_dodge_distance(self, value: float) -> None:
+        self.settings["table_dodge_distance"] = float(value)
+
+    @property
+    def matrix_delta_switching(self) -> bool:
+        return bool(self.settings.get("matrix_delta_switching", False))
+
+    @matrix_delta_switching.setter
+    def matrix_delta_switching(self, value: bool) -> None:
+        self.settings["matrix_delta_switching"] = bool(value)
+
+    @property
+    def environ_max_age(self) -> float:
+        return abs(safe_float(self.settings.get("environ_max_age"), 5.0))
+
+    @environ_max_age.setter
+    def environ_max_age(self, value: float) -> None:
+        self.settings["environ_max_age"] = float(value)
+
+    @property
+    def timing_history(self) -> dict:
+        return dict(self.settings.get("timing_history") or {})
+
+    @timing_history.setter
+    def timing_history(self, value: dict) -> None:
+        self.settings["timing_history"] = dict(value)
+
     @property
     def operators(self):
         return list(self.settings.get("operators") or [])
@@ -304,6 +352,22 @@ class Settings(SettingsMixin):
     def export_txt(self, value: bool) -> None:
         self.settings["export_txt"] = bool(value)
 
+    @property
+    def export_npz(self) -> bool:
+        return bool(self.settings.get("export_npz", False))
+
+    @export_npz.setter
+    def export_npz(self, value: bool) -> None:
+        self.settings["export_npz"] = bool(value)
+
+    @property
+    def export_sync_interval(self) -> float:
+        return abs(safe_float(self.settings.get("export_sync_interval"), 5.0))
+
+    @export_sync_interval.setter
+    def export_sync_interval(self, value: float) -> None:
+        self.settings["export_sync_interval"] = float(value)
+
     @property
     def png_analysis(self) -> bool:
         return bool(self.settings.get("png_analysis", False))
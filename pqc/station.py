@@ -1,11 +1,15 @@
 import logging
 import time
+from typing import Optional
 
 import comet
+from comet.resource import ResourceError
 from comet.driver.keithley import K707B
 from comet.driver.corvus import Venus1
 from comet.driver.keithley import K6517B
 
+from .core.sessions import SessionPool
+from .core.switching import SwitchController
 from .instruments.e4980a import E4980A
 from .settings import settings
 from .workers.table import AlternateTableWorker
@@ -16,8 +20,14 @@ __all__ = ["Station"]
 logger = logging.getLogger(__name__)
 
 
+def identify_resource(resource) -> str:
+    return resource.query("*IDN?")
+
+
 class Station(comet.ResourceMixin):
 
+    session_keys = ("matrix", "hvsrc", "vsrc", "lcr", "elm")
+
     def __init__(self) -> None:
         self.state: dict = {}
 
@@ -78,7 +88,12 @@ class Station(comet.ResourceMixin):
 
         self.resources.load_settings()
 
-        self.matrix = MatrixRole(self.matrix_resource)
+        # Instrument sessions kept open for the duration of a sequence
+        self.sessions = SessionPool(errors=(ResourceError, OSError))
+        for key in self.session_keys:
+            self.sessions.add(key, self.resources.get(key), health_check=identify_resource)
+
+        self.matrix = MatrixRole(self.matrix_resource, self.sessions)
         self.lcr = LCRMeterRole(self.lcr_resource)
         self.table = TableRole(self.table_resource)
 
@@ -93,7 +108,13 @@ class Station(comet.ResourceMixin):
             "lcr": E4980A,
         }.get(key)
 
+    def lease(self, key: str, timeout: Optional[float] = None):
+        """Return context manager leasing the session of instrument resource,
+        see `SessionPool.lease`."""
+        return self.sessions.lease(key, timeout)
+
     def shutdown(self) -> None:
+        self.sessions.close()
         self.environ_worker.stop()
         self.table_worker.stop()
         self.environ_worker.join()
@@ -107,33 +128,43 @@ class Station(comet.ResourceMixin):
 
 class MatrixRole:  # TODO
 
-    def __init__(self, resource):
+    def __init__(self, resource, sessions):
         self.resource = resource
+        self.sessions = sessions
         self.driver = K707B(resource)
+        self.controller = SwitchController(self.driver.channel)
 
     def identify(self) -> str:
-        with self.resource:
+        with self.sessions.lease("matrix"):
             return self.driver.identification
 
     def open_all_channels(self) -> None:
-        with self.resource:
-            self.driver.channel.open() # open all
+        with self.sessions.lease("matrix"):
+            self.controller.open_all()
 
     def closed_channels(self) -> list:
-        with self.resource:
-            return self.driver.channel.getclose()
+        with self.sessions.lease("matrix"):
+            return self.controller.closed_channels()
 
     def safe_close_channels(self, channels: list) -> None:
-        with self.resource:
-            closed_channels = self.driver.channel.getclose()
-            if closed_channels:
-                raise RuntimeError("Some matrix channels are still closed, " \
-                    f"please verify the situation and open closed channels. Closed channels: {closed_channels}")
-            if channels:
-                self.driver.channel.close(channels)
-                closed_channels = self.driver.channel.getclose()
-                if sorted(closed_channels) != sorted(channels):
-                    raise RuntimeError("Matrix mismatch in closed channels")
+        with self.sessions.lease("matrix"):
+            self.controller.safe_close(channels)
+
+    def switch_channels(self, channels: list) -> None:
+        """Switch from previously closed channels to channels, opening and
+        closing only changed channels."""
+        with self.sessions.lease("matrix"):
+            self.controller.switch(channels)
+
+    def release_channels(self) -> None:
+        """Open all channels unless known to be open."""
+        if self.controller.state != frozenset():
+            self.open_all_channels()
+
+    def invalidate(self) -> None:
+        """Forget known channel state, the next switch opens all channels and
+        verifies them before closing."""
+        self.controller.invalidate()
 
 
 class LCRMeterRole:
@@ -1,9 +1,12 @@
+import contextlib
 import logging
+import math
 import os
 import time
 import traceback
 import uuid
 from datetime import datetime
+from typing import List, Optional, Tuple
 
 import pyvisa
 from comet import safe_filename, make_iso
@@ -11,12 +14,25 @@ from comet.resource import ResourceError
 import analysis_pqc
 
 from . import __version__
+from .core.planner import TABLE_MOVE_KEY, plan_measurement
+from .core.route import optimize_route, route_length
+from .core.timer import Timer
 from .measurements import measurement_factory
-from .measurements.measurement import ComplianceError, serialize_json, serialize_txt
+from .measurements.measurement import ComplianceError, TxtSeriesWriter, serialize_json, serialize_npz
 from .measurements.mixins import AnalysisError
-from .view.sequence import GroupTreeItem, SampleTreeItem
-
-__all__ = ["SequenceStrategy", "GroupStrategy", "SampleStrategy", "ContactStrategy", "MeasurementStrategy"]
+from .utils import format_metric
+from .view.sequence import ContactTreeItem, GroupTreeItem, SampleTreeItem
+
+__all__ = [
+    "order_contact_items",
+    "order_sample_items",
+    "estimate_route_travel",
+    "SequenceStrategy",
+    "GroupStrategy",
+    "SampleStrategy",
+    "ContactStrategy",
+    "MeasurementStrategy",
+]
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +42,113 @@ def timestamp_iso(timestamp: float) -> str:
     return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%dT%H:%M:%S")
 
 
+def log_export_rate(filename: str, elapsed: float) -> None:
+    """Log size and write rate of exported file."""
+    size = os.path.getsize(filename)
+    rate = size / elapsed if elapsed > 0 else 0.
+    logger.info("Exported %s: %d bytes in %.3f s (%s)", filename, size, elapsed, format_metric(rate, "B/s"))
+
+
+def valid_position(position) -> Optional[tuple]:
+    """Return position as tuple or None if not valid."""
+    if position is None:
+        return None
+    position = tuple(position)
+    if any(math.isnan(value) for value in position):
+        return None
+    return position
+
+
+def item_anchor(item) -> Optional[tuple]:
+    """Return mean position of all enabled contacts of a sample or group item
+    or None if any enabled contact has no position assigned.
+    """
+    if isinstance(item, ContactTreeItem):
+        return valid_position(item.position) if item.hasPosition() else None
+    positions = []
+    for child in item.children():
+        if child.isEnabled():
+            position = item_anchor(child)
+            if position is None:
+                return None
+            positions.append(position)
+    if not positions:
+        return None
+    return tuple(sum(values) / len(positions) for values in zip(*positions))
+
+
+def order_contact_items(contact_items: list, start=None) -> list:
+    """Return contact items ordered for minimal table travel, contacts are
+    visited after all contacts listed in their `after` property. Order is
+    kept if any contact has no position assigned or if `after` properties
+    are cyclic.
+    """
+    positions = [item_anchor(item) for item in contact_items]
+    if None in positions:
+        return list(contact_items)
+    indices = {item.id: index for index, item in enumerate(contact_items)}
+    precedence = []
+    for index, item in enumerate(contact_items):
+        for contact_id in getattr(item, "after", []):
+            if contact_id in indices:
+                precedence.append((indices[contact_id], index))
+    try:
+        route = optimize_route(positions, valid_position(start), precedence)
+    except ValueError as exc:
+        logger.warning("Failed to optimize contact order, keeping configured order: %s", exc)
+        return list(contact_items)
+    return [contact_items[index] for index in route]
+
+
+def order_sample_items(sample_items: list, start=None) -> list:
+    """Return enabled sample and group items ordered for minimal table travel
+    between their mean contact positions, followed by disabled items. Order
+    is kept if any enabled item has no position.
+    """
+    enabled_items = [item for item in sample_items if item.isEnabled()]
+    disabled_items = [item for item in sample_items if not item.isEnabled()]
+    positions = [item_anchor(item) for item in enabled_items]
+    if None in positions:
+        return list(sample_items)
+    route = optimize_route(positions, valid_position(start))
+    return [enabled_items[index] for index in route] + disabled_items
+
+
+def route_positions(item, optimize: bool, start=None) -> List[tuple]:
+    """Return list of contact positions visited for sequence, group or sample
+    item in execution order.
+    """
+    positions: List[tuple] = []
+    children = [child for child in item.children() if child.isEnabled()]
+    if isinstance(item, SampleTreeItem):
+        if optimize:
+            children = order_contact_items(children, start)
+        for child in children:
+            position = item_anchor(child)
+            if position is not None:
+                positions.append(position)
+    else:
+        if optimize:
+            children = order_sample_items(children, start)
+        for child in children:
+            positions.extend(route_positions(child, optimize, positions[-1] if positions else start))
+    return positions
+
+
+def estimate_route_travel(item, start=None) -> Tuple[float, float]:
+    """Return estimated table travel in millimeters for sequence, group or
+    sample item in configured and in optimized contact order.
+    """
+    start = valid_position(start)
+    original = route_positions(item, False, start)
+    optimized = route_positions(item, True, start)
+    return route_length(original, start=start), route_length(optimized, start=start)
+
+
+def is_route_optimized(config: dict) -> bool:
+    return bool(config.get("optimize_route") and config.get("move_to_contact"))
+
+
 class LogFileWriter:
     """Context manager for log files."""
 
@@ -142,7 +265,10 @@ class SequenceStrategy:
                                 sample_name = contact_item.sample.name()
                                 contact_name = contact_item.name()
                             #    raise RuntimeError(f"No contact position assigned for {sample_name} -> {contact_name}")
-        for sample_item in sequence_item.children():
+        sample_items = sequence_item.children()
+        if is_route_optimized(self.context.config):
+            sample_items = order_sample_items(sample_items, self.context.config.get("table_position"))
+        for sample_item in sample_items:
             if self.context.stop_requested:
                 break
             if not sample_item.isEnabled():
@@ -174,7 +300,10 @@ class GroupStrategy:
         self.context.set_message("Process group...")
         self.context.set_item_state(group_item, group_item.ProcessingState)
         results = []
-        for child in group_item.children():
+        children = group_item.children()
+        if is_route_optimized(self.context.config):
+            children = order_sample_items(children, self.context.config.get("table_position"))
+        for child in children:
             if self.context.stop_requested:
                 break
             if not child.isEnabled():
@@ -217,15 +346,17 @@ class SampleStrategy:
                     contact_name = contact_item.name()
                 #    raise RuntimeError(f"No contact position assigned for {sample_name} -> {contact_name}")
         results = []
-        for contact_item in sample_item.children():
+        contact_items = [item for item in sample_item.children() if item.isEnabled()]
+        if is_route_optimized(self.context.config):
+            contact_items = order_contact_items(contact_items, self.context.config.get("table_position"))
+        for index, contact_item in enumerate(contact_items):
             if self.context.stop_requested:
                 break
-            if not contact_item.isEnabled():
-                continue
             if self.context.stop_requested:
                 self.context.set_item_state(contact_item, contact_item.StoppedState)
                 break
-            result = ContactStrategy(self.context)(contact_item)
+            next_contact_item = contact_items[index + 1] if index + 1 < len(contact_items) else None
+            result = ContactStrategy(self.context)(contact_item, next_contact_item)
             if result != sample_item.SuccessState:
                 results.append(result)
         state = sample_item.ErrorState
@@ -250,10 +381,12 @@ class ContactStrategy:
 
     def __init__(self, context) -> None:
         self.context = context
+        self.next_contact_item = None
 
-    def __call__(self, contact_item) -> object:
+    def __call__(self, contact_item, next_contact_item=None) -> object:
         retry_contact_count = self.context.config.get("retry_contact_count", 0)
         retry_measurement_count = self.context.config.get("retry_measurement_count", 0)
+        self.next_contact_item = next_contact_item
         # Queue of measurements for the retry loops.
         measurement_items = [item for item in contact_item.children() if item.isEnabled()]
         # Auto retry table contact
@@ -288,13 +421,46 @@ class ContactStrategy:
                 z = self.context.add_retry_overdrive(z)
                 x, y = self.context.add_retry_offset(x, y)
             # Move table to position
-            self.context.safe_move_table((x, y, z))
+            t = Timer()
+            self.context.safe_move_table((x, y, z), sample_item=contact_item.sample)
+            self.context.record_timing(TABLE_MOVE_KEY, t.delta())
             self.context.apply_contact_delay()
+        self.context.complete_step(contact_item)
+
+    def create_prepare_move(self):
+        """Return callback pre-positioning the table to the next contact or
+        None if pipelined table moves do not apply.
+
+        Not applicable with measurement retries, as those are performed
+        without moving the table, nor with contact retries, as those move
+        the table back to the current contact. The outcome of the analysis
+        is not known yet when the callback is executed.
+        """
+        next_contact_item = self.next_contact_item
+        if next_contact_item is None or not next_contact_item.hasPosition():
+            return None
+        if not self.context.config.get("table_pipelined_moves"):
+            return None
+        if not self.context.config.get("move_to_contact"):
+            return None
+        if self.context.config.get("retry_measurement_count", 0):
+            return None
+        if self.context.config.get("retry_contact_count", 0):
+            return None
+        position = next_contact_item.position
+
+        def prepare_move():
+            if not self.context.stop_requested:
+                self.context.prepare_move_table(position)
+
+        return prepare_move
 
     def process_measurement_sequence(self, measurement_items) -> list:
         """Returns a list of failed measurement items."""
         prev_measurement_item = None
         failed_measurements: list = []
+        enabled_items = [item for item in measurement_items if item.isEnabled()]
+        last_measurement_item = enabled_items[-1] if enabled_items else None
         for measurement_item in measurement_items:
             if self.context.stop_requested:
                 break
@@ -305,8 +471,14 @@ class ContactStrategy:
                 break
             if prev_measurement_item:
                 self.context.hide_measurement_item(prev_measurement_item)
+            on_finalized = None
+            keep_matrix_closed = False
+            if measurement_item is last_measurement_item:
+                on_finalized = self.create_prepare_move()
+            else:
+                keep_matrix_closed = bool(self.context.config.get("matrix_delta_switching"))
             try:
-                MeasurementStrategy(self.context)(measurement_item)
+                MeasurementStrategy(self.context)(measurement_item, on_finalized, keep_matrix_closed)
             except Exception as exc:
                 logger.error("%s: %s", measurement_item.name(), exc)
                 logger.exception(exc)
@@ -316,6 +488,9 @@ class ContactStrategy:
             prev_measurement_item = measurement_item
         if prev_measurement_item:
             self.context.hide_measurement_item(prev_measurement_item)
+        if self.context.config.get("matrix_delta_switching"):
+            # Channels might be left closed if stopped or failed
+            self.context.release_matrix()
         return failed_measurements
 
 
@@ -325,7 +500,7 @@ class MeasurementStrategy:
     def __init__(self, context) -> None:
         self.context = context
 
-    def __call__(self, measurement_item) -> None:
+    def __call__(self, measurement_item, on_finalized=None, keep_matrix_closed=False) -> None:
         self.context.set_message("Process measurement...")
         self.context.reset_measurement_item(measurement_item)
         self.context.set_item_state(measurement_item, measurement_item.ActiveState)
@@ -369,13 +544,25 @@ class MeasurementStrategy:
         }
         for key, value in meta.items():
             measurement.set_meta(key, value)
+        if on_finalized is not None:
+            measurement.finalized_callbacks.append(on_finalized)
+        measurement.keep_matrix_closed = keep_matrix_closed
 
         write_logfiles = self.context.config.get("write_logfiles")
         log_filename = self.create_filename(measurement_item, suffix=".log") if write_logfiles else None
         plot_filename = self.create_filename(measurement_item, suffix=".png")
 
-        with LogFileWriter(log_filename):
+        with LogFileWriter(log_filename), contextlib.ExitStack() as stack:
+            txt_writer = None
+            txt_filename = self.create_filename(measurement_item, suffix=".txt")
+            if self.context.config.get("serialize_txt"):
+                # Stream series to plain text while measuring.
+                # See https://docs.python.org/3/library/csv.html#csv.DictWriter
+                sync_interval = self.context.config.get("serialize_sync_interval", 5.0)
+                txt_writer = stack.enter_context(TxtSeriesWriter(txt_filename, sync_interval=sync_interval))
+                measurement.series_writers.append(txt_writer)
             state = ""
+            t = Timer()
             try:
                 measurement.run(self.context.station)
             except ResourceError as e:
@@ -405,24 +592,51 @@ class MeasurementStrategy:
                     state = measurement_item.StoppedState
                 else:
                     state = measurement_item.SuccessState
+                    self.record_timing(measurement_item, t.delta())
             finally:
                 self.context.set_item_state(measurement_item, state)
+                self.context.complete_step(measurement_item)
                 self.context.save_to_image.emit(measurement_item, plot_filename)
-                self.context.measurement_finished.emit({
-                    "timestamp": measurement.timestamp,
-                    "sample_name": sample_name,
-                    "sample_type": sample_type,
-                    "contact_name": measurement_item.contact.name(),
-                    "measurement_name": measurement_item.name(),
-                    "measurement_state": state,
-                })
-                if self.context.config.get("serialize_json"):
-                    with open(self.create_filename(measurement_item, suffix=".json"), "w") as fp:
-                        serialize_json(measurement.data, fp)
-                if self.context.config.get("serialize_txt"):
-                    # See https://docs.python.org/3/library/csv.html#csv.DictWriter
-                    with open(self.create_filename(measurement_item, suffix=".txt"), "w", newline="") as fp:
-                        serialize_txt(measurement.data, fp)
+                files = []
+                try:
+                    if self.context.config.get("serialize_json"):
+                        filename = self.create_filename(measurement_item, suffix=".json")
+                        t = Timer()
+                        with open(filename, "w") as fp:
+                            serialize_json(measurement.data, fp)
+                        log_export_rate(filename, t.delta())
+                        files.append(filename)
+                    if self.context.config.get("serialize_npz"):
+                        filename = self.create_filename(measurement_item, suffix=".npz")
+                        t = Timer()
+                        with open(filename, "wb") as fp:
+                            serialize_npz(measurement.data, fp)
+                        log_export_rate(filename, t.delta())
+                        files.append(filename)
+                    if txt_writer is not None:
+                        txt_writer.close(measurement.data)
+                        files.append(txt_filename)
+                finally:
+                    # Pass only files written successfully
+                    self.context.measurement_finished.emit({
+                        "timestamp": measurement.timestamp,
+                        "sample_name": sample_name,
+                        "sample_type": sample_type,
+                        "contact_name": measurement_item.contact.name(),
+                        "contact_id": measurement_item.contact.id,
+                        "measurement_name": measurement_item.name(),
+                        "measurement_id": measurement_item.id,
+                        "measurement_type": measurement.type,
+                        "measurement_state": state,
+                        "files": files,
+                        "analysis": measurement.data.get("analysis", {}),
+                    })
+
+    def record_timing(self, measurement_item, duration: float) -> None:
+        """Record duration of successful measurement to timing history."""
+        points, waiting = plan_measurement(measurement_item.item_type, measurement_item.parameters)
+        self.context.record_timing(measurement_item.item_type, duration, points, waiting)
+        logger.info("Measurement duration: %.1f s (%d points, %.1f s waiting time)", duration, points, waiting)
 
     def apply_before_measurement_delay(self) -> None:
         before_measurement_delay = self.context.config.get("before_measurement_delay", 0)
@@ -1,10 +1,12 @@
 import math
 import os
-from typing import Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
+import numpy as np
 from comet import ui
-from PyQt5 import QtCore, QtGui, QtWidgets
+from PyQt5 import QtChart, QtCore, QtGui, QtWidgets
 
+from ..core.coalesce import Bounds
 from ..core.position import Position
 from ..core.utils import make_path, user_home
 from ..settings import settings
@@ -26,6 +28,13 @@ __all__ = [
 ]
 
 
+def append_points(series, xs, ys) -> None:
+    """Append points to plot series in a single operation."""
+    xs = xs.tolist() if hasattr(xs, "tolist") else list(xs)
+    ys = ys.tolist() if hasattr(ys, "tolist") else list(ys)
+    series.qt.append([QtCore.QPointF(x, y) for x, y in zip(xs, ys)])
+
+
 def create_icon(size: int, color: str) -> QtGui.QIcon:
     """Return circular colored icon."""
     pixmap = QtGui.QPixmap(size, size)
@@ -407,12 +416,20 @@ class PositionsComboBox(QtWidgets.QComboBox):
 
 
 class PlotWidget(QtWidgets.QWidget):
-    """Transitional wrapper for plots."""
+    """Transitional wrapper for plots.
+
+    Fitting uses running bounds per series, scanning only points appended
+    since the previous fit.
+    """
+
+    defaultDecimationColumns: int = 1024
 
     def __init__(self, parent: Optional[QtWidgets.QWidget] = None) -> None:
         super().__init__(parent)
 
         self._plot = ui.Plot(height=300, legend="right")
+        self._series_axes: Dict[str, Tuple[str, str]] = {}
+        self._bounds: Dict[str, Bounds] = {}
 
         layout = QtWidgets.QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -423,6 +440,7 @@ class PlotWidget(QtWidgets.QWidget):
 
     def addSeries(self, name: str, xaxis: str, yaxis: str, *, text: str, color=None) -> None:
         self._plot.add_series(name, xaxis, yaxis, text=text, color=color)
+        self._series_axes[name] = xaxis, yaxis
         return self._plot.series.get(name)
 
     def axes(self) -> dict:
@@ -431,16 +449,64 @@ class PlotWidget(QtWidgets.QWidget):
     def series(self) -> dict:
         return self._plot.series
 
+    def seriesBounds(self, name: str) -> Bounds:
+        """Return running bounds of series, updated by points appended since
+        last call (reset if the series was cleared)."""
+        qt = self._plot.series.get(name).qt
+        bounds = self._bounds.setdefault(name, Bounds())
+        count = qt.count()
+        if count < bounds.count:
+            bounds.reset()
+        if count > bounds.count:
+            points = [qt.at(index) for index in range(bounds.count, count)]
+            bounds.update([point.x() for point in points], [point.y() for point in points])
+        return bounds
+
+    def decimationColumns(self) -> int:
+        """Return number of pixel columns of the plot area."""
+        width = int(self.chart().plotArea().width())
+        return width if width > 1 else self.defaultDecimationColumns
+
+    def replacePoints(self, name: str, xs, ys) -> None:
+        """Replace all points of series in a single operation."""
+        qt = self._plot.series.get(name).qt
+        qt.replace([QtCore.QPointF(x, y) for x, y in zip(np.asarray(xs).tolist(), np.asarray(ys).tolist())])
+        bounds = self._bounds.setdefault(name, Bounds())
+        bounds.reset()
+        bounds.update(xs, ys)
+
     def smartFit(self, hack=False) -> None:
         if self._plot.zoomed:
             self._plot.update("x")
         else:
             if hack:
                 self._plot.qt.chart().zoomOut() # HACK
-            self._plot.fit()
+            self.fit()
 
     def fit(self) -> None:
-        self._plot.fit()
+        axes = self._plot.axes
+        if not all(isinstance(axis.qt, QtChart.QValueAxis) for axis in axes.values()):
+            self._plot.fit()
+            return
+        ranges: Dict[str, Tuple[float, float]] = {}
+        for name, (xaxis, yaxis) in self._series_axes.items():
+            if not self._plot.series.get(name).qt.isVisible():
+                continue
+            bounds = self.seriesBounds(name)
+            if bounds.is_empty():
+                continue
+            for axis, (minimum, maximum) in ((xaxis, bounds.x), (yaxis, bounds.y)):
+                if axis in ranges:
+                    minimum, maximum = min(ranges[axis][0], minimum), max(ranges[axis][1], maximum)
+                ranges[axis] = minimum, maximum
+        if not ranges:
+            self._plot.fit()
+            return
+        for axis, (minimum, maximum) in ranges.items():
+            if minimum == maximum:
+                margin = abs(minimum) * 0.05 or 1.0
+                minimum, maximum = minimum - margin, maximum + margin
+            axes.get(axis).qt.setRange(minimum, maximum)
 
     def update(self, *args) -> None:
         self._plot.update(*args)
@@ -448,6 +514,8 @@ class PlotWidget(QtWidgets.QWidget):
     def clear(self) -> None:
         for series in self._plot.series.values():
             series.clear()
+        for bounds in self._bounds.values():
+            bounds.reset()
 
     def chart(self):
         return self._plot.qt.chart()
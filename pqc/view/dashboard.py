@@ -5,12 +5,14 @@ import os
 import time
 import threading
 import webbrowser
+from datetime import datetime, timedelta
 from typing import Optional
 
 from PyQt5 import QtCore, QtGui, QtWidgets
 
 import comet
 from comet.process import ProcessMixin
+from ..strategy import estimate_route_travel
 from ..workers.measure import MeasureWorker
 from .components import (
     CalibrationWidget,
@@ -20,6 +22,7 @@ from .components import (
     WorkingDirectoryWidget,
 )
 from ..core import config
+from ..core.planner import TimingHistory
 from ..core.position import Position
 from ..core.utils import make_path
 from .sequence import (
@@ -81,6 +84,10 @@ class SequenceWidget(QtWidgets.QGroupBox):
         self.collapseAllSamplesButton = QtWidgets.QToolButton(self)
         self.collapseAllSamplesButton.triggered.connect(self.collapseAllSamples)
 
+        self.estimateLabel = QtWidgets.QLabel(self)
+        self.estimateLabel.setToolTip("Estimated remaining sequence duration and time of completion.")
+        self.estimateLabel.hide()
+
         self.buttonLayout = QtWidgets.QHBoxLayout()
         self.buttonLayout.addWidget(self.startButton)
         self.buttonLayout.addWidget(self.stopButton)
@@ -94,6 +101,7 @@ class SequenceWidget(QtWidgets.QGroupBox):
 
         layout = QtWidgets.QVBoxLayout(self)
         layout.addWidget(self.sequenceTreeWidget)
+        layout.addWidget(self.estimateLabel)
         layout.addLayout(self.buttonLayout)
 
     def readSettings(self):
@@ -132,6 +140,17 @@ class SequenceWidget(QtWidgets.QGroupBox):
     def stop(self):
         self.stopButton.setEnabled(False)
 
+    def setEstimate(self, estimate: dict) -> None:
+        """Show remaining duration and ETA, hide if estimate is empty."""
+        if estimate:
+            remaining = timedelta(seconds=round(estimate.get("remaining", 0)))
+            eta = datetime.fromtimestamp(estimate.get("eta", 0)).strftime("%a %H:%M")
+            self.estimateLabel.setText(f"Remaining {remaining} | ETA {eta}")
+            self.estimateLabel.show()
+        else:
+            self.estimateLabel.clear()
+            self.estimateLabel.hide()
+
     def reloadConfig(self) -> None:
         result = QtWidgets.QMessageBox.question(self, "Reload Configuration", "Do you want to reload sequence configurations from file?")
         if result == QtWidgets.QMessageBox.Yes:
@@ -372,6 +391,7 @@ class Dashboard(QtWidgets.QWidget, ProcessMixin):
         self.plugins = plugins
 
         self.measure_thread = None
+        self.timing_history: Optional[TimingHistory] = None
 
         self.noticeLabel = AnimatedLabel(self)
         self.noticeLabel.setText("Temporary Probecard Z-Limit applied. Revert after finishing current measurements.")
@@ -673,6 +693,7 @@ class Dashboard(QtWidgets.QWidget, ProcessMixin):
         dialog = StartSequenceDialog(self)
         dialog.setMessage("<b>Are you sure to start all enabled sequences for all enabled samples/groups?</b>")
         dialog.setTableEnabled(self.isTableEnabled())
+        dialog.setRouteEstimate(*estimate_route_travel(sample_items, self.table_position()))
         self.operatorWidget.writeSettings()
         self.outputWidget.writeSettings()
         dialog.readSettings()
@@ -683,7 +704,8 @@ class Dashboard(QtWidgets.QWidget, ProcessMixin):
             self._on_start(
                 sample_items,
                 move_to_contact=dialog.isMoveToContact(),
-                move_to_after_position=dialog.isMoveToPosition()
+                move_to_after_position=dialog.isMoveToPosition(),
+                optimize_route=dialog.isOptimizeRoute()
             )
 
     def startMeasurement(self, item: MeasurementTreeItem) -> None:
@@ -715,6 +737,7 @@ class Dashboard(QtWidgets.QWidget, ProcessMixin):
         dialog = StartSequenceDialog(self)
         dialog.setMessage(f"<b>Are you sure to start all enabled sequences for {item.name()!r}?</b>")
         dialog.setTableEnabled(self.isTableEnabled())
+        dialog.setRouteEstimate(*estimate_route_travel(item, self.table_position()))
         # TODO
         self.operatorWidget.writeSettings()
         self.outputWidget.writeSettings()
@@ -726,7 +749,8 @@ class Dashboard(QtWidgets.QWidget, ProcessMixin):
             self._on_start(
                 item,
                 move_to_contact=dialog.isMoveToContact(),
-                move_to_after_position=dialog.isMoveToPosition()
+                move_to_after_position=dialog.isMoveToPosition(),
+                optimize_route=dialog.isOptimizeRoute()
             )
 
     def on_start(self) -> None:
@@ -742,7 +766,7 @@ class Dashboard(QtWidgets.QWidget, ProcessMixin):
         elif isinstance(item, GroupTreeItem):
             self.startSample(item)
 
-    def _on_start(self, item, move_to_contact=False, move_to_after_position=None):
+    def _on_start(self, item, move_to_contact=False, move_to_after_position=None, optimize_route=False):
         self.started.emit()
         # Create output directory
         self.panels.store()
@@ -755,6 +779,12 @@ class Dashboard(QtWidgets.QWidget, ProcessMixin):
         config = {
             "table_position": self.table_position(),  # TODO state
             "table_contact_delay": settings.table_contact_delay,
+            "table_pipelined_moves": settings.table_pipelined_moves,
+            "table_dodge_moves": settings.table_dodge_moves,
+            "table_dodge_height": settings.table_control_dodge_height,
+            "table_dodge_distance": settings.table_dodge_distance,
+            "matrix_delta_switching": settings.matrix_delta_switching,
+            "environ_max_age": settings.environ_max_age,
             "retry_contact_radius": settings.retry_contact_radius,
             "retry_contact_distance": settings.retry_contact_distance,
             "retry_contact_overdrive": settings.retry_contact_overdrive,
@@ -763,51 +793,55 @@ class Dashboard(QtWidgets.QWidget, ProcessMixin):
             "write_logfiles": self.write_logfiles(),
             "serialize_json": settings.export_json,
             "serialize_txt": settings.export_txt,
+            "serialize_npz": settings.export_npz,
+            "serialize_sync_interval": settings.export_sync_interval,
             "use_environ": self.isEnvironmentEnabled(),
             "use_table": self.isTableEnabled(),
             "move_to_contact": move_to_contact,
             "move_to_after_position": move_to_after_position,
+            "optimize_route": optimize_route,
             "operator": self.currentOperator(),
             "output_dir": self.outputDir(),
         }
 
-        worker = MeasureWorker(self.station, config, item)
+        self.timing_history = TimingHistory.from_dict(settings.timing_history)
+
+        worker = MeasureWorker(self.station, config, item, timing_history=self.timing_history)
         worker.failed.connect(lambda exc: self.failed.emit(exc, None))
         worker.finished.connect(self.on_finished)
         worker.finished.connect(self.sequenceFinished)
-        worker.message_changed.connect(self.messageChanged.emit)
-        worker.progress_changed.connect(self.progressChanged.emit)
         worker.item_state_changed.connect(self.setItemState)
         worker.item_reset.connect(self.resetItem)
         worker.item_visible.connect(self.showItem)
         worker.item_hidden.connect(self.hideItem)
         worker.save_to_image.connect(self.safeToImage)
         worker.measurement_finished.connect(self.measurementFinished)
-        worker.reading_appended.connect(self.appendReading)
-        worker.readings_updated.connect(self.updateReadings)
+        worker.updates_available.connect(self.applyUpdates)
         worker.analysis_appended.connect(self.appendAnalysis)
-        worker.state_changed.connect(self.updateState)
+        worker.estimate_changed.connect(self.sequenceControlWidget.setEstimate)
         self.aborting.connect(worker.abort)
 
         self.measure_thread = threading.Thread(target=worker)
         self.measure_thread.start()
 
-    def appendReading(self, name, x, y):
-        if self._panel:
-            self._panel.appendReading(name, x, y)
-
-    def updateReadings(self):
+    def applyUpdates(self, updates: dict) -> None:
+        """Apply coalesced measurement updates to status and active panel."""
+        if "message" in updates:
+            self.messageChanged.emit(updates.get("message"))
+        if "progress" in updates:
+            self.progressChanged.emit(*updates.get("progress"))
         if self._panel:
-            self._panel.updateReadings()
+            for name, (xs, ys) in updates.get("readings", {}).items():
+                self._panel.appendReadings(name, xs, ys)
+            if "state" in updates:
+                self._panel.updateState(updates.get("state"))
+            if updates.get("update"):
+                self._panel.updateReadings()
 
     def appendAnalysis(self, key, value):
         if self._panel:
             self._panel.appendAnalysis(key, value)
 
-    def updateState(self, *args):
-        if self._panel:
-            self._panel.updateState(*args)
-
     def setItemState(self, item, state) -> None:
         item.setState(state)
         item.setExpanded(True)
@@ -845,6 +879,8 @@ class Dashboard(QtWidgets.QWidget, ProcessMixin):
         self.aborting.emit()
 
     def on_finished(self):
+        if self.timing_history is not None:
+            settings.timing_history = self.timing_history.to_dict()
         self.sync_environment_controls()
         self.finished.emit()
         self.measure_thread = None
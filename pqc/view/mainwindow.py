@@ -14,6 +14,7 @@ from ..plugins.logger import LoggerPlugin
 from ..plugins.webapi import WebAPIPlugin
 from ..plugins.notification import NotificationPlugin
 from ..plugins.summary import SummaryPlugin
+from ..plugins.index import IndexPlugin
 from ..workers.contactquality import ContactQualityWorker
 from ..utils import make_path
 from ..settings import settings as config  # TODO
@@ -203,6 +204,7 @@ class MainWindow(QtWidgets.QMainWindow, ProcessMixin):
         self.plugins.register_plugin(LoggerPlugin(self))
         self.plugins.register_plugin(WebAPIPlugin(self))
         self.plugins.register_plugin(SummaryPlugin(self))
+        self.plugins.register_plugin(IndexPlugin(self))
         self.plugins.register_plugin(NotificationPlugin(self))
 
         self.dashboard = Dashboard(self.station, self.plugins, self)
@@ -1,10 +1,11 @@
 from typing import Optional
 
+import numpy as np
 from PyQt5 import QtWidgets
 
 import comet
 
-from ..components import PlotWidget
+from ..components import PlotWidget, append_points
 from .matrix import MatrixPanel
 from .mixins import EnvironmentMixin, LCRMixin
 
@@ -111,30 +112,27 @@ class CVRampAltPanel(MatrixPanel):
         self.plotWidget.clear()
         self.plotWidget2.clear()
         for name, points in measurement.series.items():
-            tr = self.series_transform.get(name, self.series_transform_default)
             if name == "lcr":
-                for x, y in points:
-                    self.lcrSeries.append(*tr(x, y))
+                self.loadSeries(self.plotWidget, name, points)
             elif name == "lcr2":
-                for x, y in points:
-                    self.lcr2Series.append(*tr(x, y))
+                self.loadSeries(self.plotWidget2, name, points)
         self.plotWidget.fit()
         self.plotWidget2.fit()
 
-    def appendReading(self, name: str, x: float, y: float) -> None:
+    def appendReadings(self, name: str, xs: np.ndarray, ys: np.ndarray) -> None:
         if self.measurement:
             tr = self.series_transform.get(name, self.series_transform_default)
             if name == "lcr":
                 if name not in self.measurement.series:
                     self.measurement.series[name] = []
-                self.measurement.series[name].append((x, y))
-                self.lcrSeries.append(*tr(x, y))
+                self.measurement.series[name].extend(zip(xs.tolist(), ys.tolist()))
+                append_points(self.lcrSeries, *tr(xs, ys))
                 self.plotWidget.smartFit()
             elif name == "lcr2":
                 if name not in self.measurement.series:
                     self.measurement.series[name] = []
-                self.measurement.series[name].append((x, y))
-                self.lcr2Series.append(*tr(x, y))
+                self.measurement.series[name].extend(zip(xs.tolist(), ys.tolist()))
+                append_points(self.lcr2Series, *tr(xs, ys))
                 self.plotWidget2.smartFit()
 
     def clearReadings(self) -> None:
@@ -1,10 +1,11 @@
 from typing import Optional
 
+import numpy as np
 from PyQt5 import QtCore, QtWidgets, QtChart
 
 import comet
 
-from ..components import PlotWidget
+from ..components import PlotWidget, append_points
 from .matrix import MatrixPanel
 from .mixins import EnvironmentMixin, VSourceMixin
 
@@ -104,22 +105,20 @@ class IVRamp4WirePanel(MatrixPanel):
         self.plotWidget.series().get("xfit").qt.setVisible(False)
         self.plotWidget.clear()
         for name, points in measurement.series.items():
-            tr = self.series_transform.get(name, self.series_transform_default)
             series = self.plotWidget.series().get(name)
-            for x, y in points:
-                series.append(*tr(x, y))
+            self.loadSeries(self.plotWidget, name, points)
             series.qt.setVisible(True)
         self.updateReadings()
 
-    def appendReading(self, name: str, x: float, y: float) -> None:
+    def appendReadings(self, name: str, xs: np.ndarray, ys: np.ndarray) -> None:
         if self.measurement:
             if name in self.plotWidget.series():
                 if name not in self.measurement.series:
                     self.measurement.series[name] = []
-                self.measurement.series[name].append((x, y))
+                self.measurement.series[name].extend(zip(xs.tolist(), ys.tolist()))
                 tr = self.series_transform.get(name, self.series_transform_default)
                 series = self.plotWidget.series().get(name)
-                series.append(*tr(x, y))
+                append_points(series, *tr(xs, ys))
                 series.qt.setVisible(True)
 
     def updateReadings(self) -> None:
@@ -1,10 +1,11 @@
 from typing import Optional
 
+import numpy as np
 from PyQt5 import QtWidgets
 
 import comet
 
-from ..components import PlotWidget
+from ..components import PlotWidget, append_points
 from ..components import Metric
 from .matrix import MatrixPanel
 from .mixins import EnvironmentMixin, HVSourceMixin, VSourceMixin
@@ -141,20 +142,18 @@ class IVRamp4WireBiasPanel(MatrixPanel):
         self.plotWidget.series().get("xfit").qt.setVisible(False)
         self.plotWidget.clear()
         for name, points in measurement.series.items():
-            tr = self.series_transform.get(name, self.series_transform_default)
-            for x, y in points:
-                self.plotWidget.series().get(name).append(*tr(x, y))
+            self.loadSeries(self.plotWidget, name, points)
             self.plotWidget.series().get(name).qt.setVisible(True)
         self.updateReadings()
 
-    def appendReading(self, name: str, x: float, y: float) -> None:
+    def appendReadings(self, name: str, xs: np.ndarray, ys: np.ndarray) -> None:
         if self.measurement:
             if name in self.plotWidget.series():
                 if name not in self.measurement.series:
                     self.measurement.series[name] = []
-                self.measurement.series[name].append((x, y))
+                self.measurement.series[name].extend(zip(xs.tolist(), ys.tolist()))
                 tr = self.series_transform.get(name, self.series_transform_default)
-                self.plotWidget.series().get(name).append(*tr(x, y))
+                append_points(self.plotWidget.series().get(name), *tr(xs, ys))
                 self.plotWidget.series().get(name).qt.setVisible(True)
 
     def updateReadings(self) -> None:
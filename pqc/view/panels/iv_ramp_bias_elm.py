@@ -1,10 +1,11 @@
 from typing import Optional
 
+import numpy as np
 from PyQt5 import QtWidgets
 
 import comet
 
-from ..components import PlotWidget
+from ..components import PlotWidget, append_points
 from .matrix import MatrixPanel
 from .mixins import (
     ElectrometerMixin,
@@ -142,27 +143,25 @@ class IVRampBiasElmPanel(MatrixPanel):
         self.plotWidget.clear()
         for name, points in measurement.series.items():
             if name in self.plotWidget.series():
-                tr = self.series_transform.get(name, self.series_transform_default)
                 if points[0][0] > points[-1][0]:
                     self.plotWidget.axes().get("x").qt.setReverse(True)
                 else:
                     self.plotWidget.axes().get("x").qt.setReverse(False)
-                for x, y in points:
-                    self.plotWidget.series().get(name).append(*tr(x, y))
+                self.loadSeries(self.plotWidget, name, points)
         self.updateReadings()
 
-    def appendReading(self, name: str, x: float, y: float) -> None:
+    def appendReadings(self, name: str, xs: np.ndarray, ys: np.ndarray) -> None:
         if self.measurement:
             if name in self.plotWidget.series():
                 if name not in self.measurement.series:
                     self.measurement.series[name] = []
-                self.measurement.series[name].append((x, y))
+                self.measurement.series[name].extend(zip(xs.tolist(), ys.tolist()))
                 if self.voltageStartSpinBox.value() > self.voltageStopSpinBox.value():
                     self.plotWidget.axes().get("x").qt.setReverse(True)
                 else:
                     self.plotWidget.axes().get("x").qt.setReverse(False)
                 tr = self.series_transform.get(name, self.series_transform_default)
-                self.plotWidget.series().get(name).append(*tr(x, y))
+                append_points(self.plotWidget.series().get(name), *tr(xs, ys))
                 self.plotWidget.series().get(name).qt.setVisible(True)
 
     def updateReadings(self) -> None:
@@ -1,11 +1,13 @@
 from typing import Callable, Dict, Optional
 
+import numpy as np
 from PyQt5 import QtCore, QtWidgets
 from QCharted import ChartView
 
 import comet
 
 from pqc.settings import settings
+from ...core.decimate import minmax_decimate
 from ..components import PlotWidget
 from ..components import Metric, stitch_pixmaps
 
@@ -258,7 +260,20 @@ class Panel(BasicPanel):
         for handler in self.state_handlers:
             handler(data)
 
+    def loadSeries(self, plotWidget: PlotWidget, name: str, points) -> None:
+        """Load stored points to plot series in a single operation, applying
+        the series transform to whole arrays and reducing the points to the
+        plot resolution."""
+        data = np.asarray(points, dtype=float).reshape(-1, 2)
+        tr = self.series_transform.get(name, self.series_transform_default)
+        xs, ys = tr(data[:, 0], data[:, 1])
+        xs, ys = minmax_decimate(xs, ys, plotWidget.decimationColumns())
+        plotWidget.replacePoints(name, xs, ys)
+
     def appendReading(self, name: str, x: float, y: float) -> None:
+        self.appendReadings(name, np.array([x], dtype=float), np.array([y], dtype=float))
+
+    def appendReadings(self, name: str, xs: np.ndarray, ys: np.ndarray) -> None:
         ...
 
     def updateReadings(self) -> None:
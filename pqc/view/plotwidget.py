@@ -1,7 +1,9 @@
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from PyQt5 import QtCore, QtGui, QtWidgets, QtChart
 
+from ..core.coalesce import Bounds
+
 __all__ = [
     "IVPlotWidget",
     "VIPlotWidget",
@@ -81,10 +83,13 @@ class PlotWidget(QtWidgets.QWidget):
 
 
 class XYPlotWidget(PlotWidget):
+    """XY plot keeping running bounds per series for axis scaling."""
 
     def __init__(self, parent: Optional[QtWidgets.QWidget] = None) -> None:
         super().__init__(parent)
 
+        self._bounds: Dict[QtChart.QXYSeries, Bounds] = {}
+
         self.xAxisUnit: str = ""
         self.yAxisUnit: str = ""
 
@@ -131,22 +136,38 @@ class XYPlotWidget(PlotWidget):
     def clear(self) -> None:
         for series in self.series():
             series.clear()
+        for bounds in self._bounds.values():
+            bounds.reset()
+
+    def seriesBounds(self, series: QtChart.QXYSeries) -> Bounds:
+        """Return running bounds of series, updated by points appended since
+        last call (reset if the series was cleared)."""
+        bounds = self._bounds.setdefault(series, Bounds())
+        count = series.count()
+        if count < bounds.count:
+            bounds.reset()
+        if count > bounds.count:
+            points = [series.at(index) for index in range(bounds.count, count)]
+            bounds.update([point.x() for point in points], [point.y() for point in points])
+        return bounds
 
     def resizeAxes(self) -> None:
-        x = []
-        y = []
+        x: Optional[Tuple[float, float]] = None
+        y: Optional[Tuple[float, float]] = None
         for series in self.series():
-            for p in series.pointsVector():
-                x.append(p.x())
-                y.append(p.y())
-        if x:
-            a, b  = min(x), max(x)
+            bounds = self.seriesBounds(series)
+            if bounds.x is not None:
+                x = bounds.x if x is None else (min(x[0], bounds.x[0]), max(x[1], bounds.x[1]))
+            if bounds.y is not None:
+                y = bounds.y if y is None else (min(y[0], bounds.y[0]), max(y[1], bounds.y[1]))
+        if x is not None:
+            a, b = x
             self.xAxis.setRange(a, b)
         else:
             a, b = self.xAxisDefaultRange
             self.xAxis.setRange(a, b)
-        if y:
-            a, b = min(y), max(y)
+        if y is not None:
+            a, b = y
             with QtCore.QSignalBlocker(self.yAxis):
                 self.yAxis.setRange(a, b)
             self.yAxis.applyNiceNumbers()
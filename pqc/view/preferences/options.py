@@ -28,6 +28,15 @@ class OptionsWidget(QtWidgets.QWidget):
         self.exportTxtCheckBox = QtWidgets.QCheckBox(self)
         self.exportTxtCheckBox.setText("Write plain text data (*.txt)")
 
+        self.exportNpzCheckBox = QtWidgets.QCheckBox(self)
+        self.exportNpzCheckBox.setText("Write binary NumPy data (*.npz)")
+
+        self.exportSyncIntervalSpinBox = QtWidgets.QDoubleSpinBox(self)
+        self.exportSyncIntervalSpinBox.setRange(0.1, 3600.0)
+        self.exportSyncIntervalSpinBox.setDecimals(1)
+        self.exportSyncIntervalSpinBox.setSuffix(" s")
+        self.exportSyncIntervalSpinBox.setToolTip("Interval for syncing plain text data to disk while measuring.")
+
         self.writeLogfilesCheckBox = QtWidgets.QCheckBox(self)
         self.writeLogfilesCheckBox.setText("Write measurement log files (*.log)")
 
@@ -37,6 +46,16 @@ class OptionsWidget(QtWidgets.QWidget):
         self.hvsrcComboBox = QtWidgets.QComboBox(self)
         self.hvsrcComboBox.addItems(["K2410", "K2470", "K2657A"])
 
+        self.matrixDeltaSwitchingCheckBox = QtWidgets.QCheckBox(self)
+        self.matrixDeltaSwitchingCheckBox.setText("Matrix delta switching")
+        self.matrixDeltaSwitchingCheckBox.setToolTip("Keep matrix channels closed between measurements of a contact and only switch changed channels.")
+
+        self.environMaxAgeSpinBox = QtWidgets.QDoubleSpinBox(self)
+        self.environMaxAgeSpinBox.setRange(0.0, 3600.0)
+        self.environMaxAgeSpinBox.setDecimals(1)
+        self.environMaxAgeSpinBox.setSuffix(" s")
+        self.environMaxAgeSpinBox.setToolTip("Maximum age of monitored environment data used by measurements, older data is read from the environment box.")
+
         self.retryMeasurementSpinBox = QtWidgets.QSpinBox(self)
         self.retryMeasurementSpinBox.setRange(0, 1000)
         self.retryMeasurementSpinBox.setSuffix("x")
@@ -74,6 +93,9 @@ class OptionsWidget(QtWidgets.QWidget):
         formatsGroupBoxLayout = QtWidgets.QGridLayout(self.formatsGroupBox)
         formatsGroupBoxLayout.addWidget(self.exportJsonCheckBox, 0, 0)
         formatsGroupBoxLayout.addWidget(self.exportTxtCheckBox, 1, 0)
+        formatsGroupBoxLayout.addWidget(self.exportNpzCheckBox, 2, 0)
+        formatsGroupBoxLayout.addWidget(QtWidgets.QLabel("Sync Interval"), 3, 0)
+        formatsGroupBoxLayout.addWidget(self.exportSyncIntervalSpinBox, 3, 1)
 
         # Logfiles
 
@@ -95,6 +117,9 @@ class OptionsWidget(QtWidgets.QWidget):
         instrumentsGroupBoxLayout.addWidget(self.vsrcComboBox, 0, 1)
         instrumentsGroupBoxLayout.addWidget(QtWidgets.QLabel("HV Source"), 1, 0)
         instrumentsGroupBoxLayout.addWidget(self.hvsrcComboBox, 1, 1)
+        instrumentsGroupBoxLayout.addWidget(self.matrixDeltaSwitchingCheckBox, 2, 0, 1, 2)
+        instrumentsGroupBoxLayout.addWidget(QtWidgets.QLabel("Environment Max. Age"), 3, 0)
+        instrumentsGroupBoxLayout.addWidget(self.environMaxAgeSpinBox, 3, 1)
         instrumentsGroupBoxLayout.setColumnStretch(2, 1)
 
         # Auto Retry
@@ -134,6 +159,8 @@ class OptionsWidget(QtWidgets.QWidget):
         self.pngAnalysisCheckBox.setChecked(settings.png_analysis)
         self.exportJsonCheckBox.setChecked(settings.export_json)
         self.exportTxtCheckBox.setChecked(settings.export_txt)
+        self.exportNpzCheckBox.setChecked(settings.export_npz)
+        self.exportSyncIntervalSpinBox.setValue(settings.export_sync_interval)
         write_logfiles = bool(settings.settings.get("write_logfiles", True))
         self.writeLogfilesCheckBox.setChecked(write_logfiles)
         vsrc_instrument = str(settings.settings.get("vsrc_instrument", "K2657A"))
@@ -142,6 +169,8 @@ class OptionsWidget(QtWidgets.QWidget):
         hvsrc_instrument = str(settings.settings.get("hvsrc_instrument", "K2410"))
         index = self.hvsrcComboBox.findText(hvsrc_instrument)
         self.hvsrcComboBox.setCurrentIndex(index)
+        self.matrixDeltaSwitchingCheckBox.setChecked(settings.matrix_delta_switching)
+        self.environMaxAgeSpinBox.setValue(settings.environ_max_age)
         self.retryMeasurementSpinBox.setValue(int(settings.retry_measurement_count))
         self.retryContactSpinBox.setValue(int(settings.retry_contact_count))
 
@@ -151,8 +180,12 @@ class OptionsWidget(QtWidgets.QWidget):
         settings.png_analysis = self.pngAnalysisCheckBox.isChecked()
         settings.export_json = self.exportJsonCheckBox.isChecked()
         settings.export_txt = self.exportTxtCheckBox.isChecked()
+        settings.export_npz = self.exportNpzCheckBox.isChecked()
+        settings.export_sync_interval = self.exportSyncIntervalSpinBox.value()
         settings.settings["write_logfiles"] = self.writeLogfilesCheckBox.isChecked()
         settings.settings["vsrc_instrument"] = self.vsrcComboBox.currentText()
         settings.settings["hvsrc_instrument"] = self.hvsrcComboBox.currentText()
+        settings.matrix_delta_switching = self.matrixDeltaSwitchingCheckBox.isChecked()
+        settings.environ_max_age = self.environMaxAgeSpinBox.value()
         settings.retry_measurement_count = self.retryMeasurementSpinBox.value()
         settings.retry_contact_count = self.retryContactSpinBox.value()
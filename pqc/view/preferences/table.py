@@ -185,6 +185,21 @@ class TableWidget(QtWidgets.QWidget):
         self.probecardContactDelaySpinBox.setSingleStep(0.1)
         self.probecardContactDelaySpinBox.setSuffix(" s")
 
+        self.pipelinedMovesCheckBox = QtWidgets.QCheckBox(self)
+        self.pipelinedMovesCheckBox.setText("Pre-position")
+        self.pipelinedMovesCheckBox.setToolTip("Move table to X/Y of next contact while previous measurement is analyzed and saved.")
+
+        self.dodgeMovesCheckBox = QtWidgets.QCheckBox(self)
+        self.dodgeMovesCheckBox.setText("Dodge")
+        self.dodgeMovesCheckBox.setToolTip("Only lower Z by X/Y dodge height for short moves between contacts of the same sample.")
+
+        self.dodgeDistanceSpinBox = QtWidgets.QDoubleSpinBox(self)
+        self.dodgeDistanceSpinBox.setDecimals(3)
+        self.dodgeDistanceSpinBox.setRange(0, 100)
+        self.dodgeDistanceSpinBox.setSingleStep(1)
+        self.dodgeDistanceSpinBox.setSuffix(" mm")
+        self.dodgeDistanceSpinBox.setToolTip("Maximum X/Y distance for dodge moves.")
+
         self.recontactOverdriveSpinBox = QtWidgets.QDoubleSpinBox(self)
         self.recontactOverdriveSpinBox.setDecimals(3)
         self.recontactOverdriveSpinBox.setRange(0, 0.025)
@@ -266,6 +281,9 @@ class TableWidget(QtWidgets.QWidget):
         probecardGroupBoxLayout = QtWidgets.QGridLayout(self.probecardGroupBox)
         probecardGroupBoxLayout.addWidget(QtWidgets.QLabel("Contact Delay"), 0, 0)
         probecardGroupBoxLayout.addWidget(self.probecardContactDelaySpinBox, 1, 0)
+        probecardGroupBoxLayout.addWidget(self.pipelinedMovesCheckBox, 2, 0)
+        probecardGroupBoxLayout.addWidget(self.dodgeMovesCheckBox, 3, 0)
+        probecardGroupBoxLayout.addWidget(self.dodgeDistanceSpinBox, 3, 1)
 
         # Re-Contact Z-Overdrive
 
@@ -356,6 +374,9 @@ class TableWidget(QtWidgets.QWidget):
         self.yLimitJoystickSpinBox.setValue(y)
         self.zLimitJoystickSpinBox.setValue(z)
         self.probecardContactDelaySpinBox.setValue(settings.table_contact_delay)
+        self.pipelinedMovesCheckBox.setChecked(settings.table_pipelined_moves)
+        self.dodgeMovesCheckBox.setChecked(settings.table_dodge_moves)
+        self.dodgeDistanceSpinBox.setValue(settings.table_dodge_distance)
         self.recontactOverdriveSpinBox.setValue(settings.retry_contact_overdrive)
         self.recontactRadiusSpinBox.setValue(settings.retry_contact_radius)
         self.recontactDistanceSpinBox.setValue(settings.retry_contact_distance)
@@ -385,6 +406,9 @@ class TableWidget(QtWidgets.QWidget):
             self.zLimitJoystickSpinBox.value(),
         ]
         settings.table_contact_delay = self.probecardContactDelaySpinBox.value()
+        settings.table_pipelined_moves = self.pipelinedMovesCheckBox.isChecked()
+        settings.table_dodge_moves = self.dodgeMovesCheckBox.isChecked()
+        settings.table_dodge_distance = self.dodgeDistanceSpinBox.value()
         settings.retry_contact_overdrive = self.recontactOverdriveSpinBox.value()
         settings.retry_contact_radius = self.recontactRadiusSpinBox.value()
         settings.retry_contact_distance = self.recontactDistanceSpinBox.value()
@@ -44,6 +44,14 @@ class StartSequenceDialog(QtWidgets.QDialog):
         self.positionsComboBox = PositionsComboBox(self)
         self.positionsComboBox.setEnabled(False)
 
+        self.routeCheckBox = QtWidgets.QCheckBox(self)
+        self.routeCheckBox.setText("Optimize contact order for minimal table travel")
+        self.routeCheckBox.setChecked(False)
+        self.routeCheckBox.setVisible(False)
+
+        self.routeLabel = QtWidgets.QLabel(self)
+        self.routeLabel.setVisible(False)
+
         self.operatorWidget: OperatorWidget = OperatorWidget(self)
 
         self.outputWidget = WorkingDirectoryWidget(self)
@@ -64,6 +72,8 @@ class StartSequenceDialog(QtWidgets.QDialog):
         tableGroupBoxLayout.addWidget(self.contactCheckBox, 0, 0, 1, 2)
         tableGroupBoxLayout.addWidget(self.positionCheckBox, 1, 0)
         tableGroupBoxLayout.addWidget(self.positionsComboBox, 1, 1)
+        tableGroupBoxLayout.addWidget(self.routeCheckBox, 2, 0, 1, 2)
+        tableGroupBoxLayout.addWidget(self.routeLabel, 3, 0, 1, 2)
         layout = QtWidgets.QGridLayout(self)
         layout.addWidget(self.messageLabel, 0, 0, 1, 2)
         layout.addWidget(self.tableGroupBox, 1, 0, 1, 2)
@@ -80,10 +90,21 @@ class StartSequenceDialog(QtWidgets.QDialog):
     def setTableEnabled(self, enabled: bool) -> None:
         self.contactCheckBox.setEnabled(enabled)
         self.positionCheckBox.setEnabled(enabled)
+        self.routeCheckBox.setEnabled(enabled)
+
+    def setRouteEstimate(self, original: float, optimized: float) -> None:
+        """Show option to optimize contact order with estimated table travel
+        in millimeters."""
+        saving = original - optimized
+        percent = saving / original * 100 if original > 0 else 0.
+        self.routeLabel.setText(f"Estimated table travel {optimized:.1f} mm instead of {original:.1f} mm (saves {saving:.1f} mm, {percent:.0f} %)")
+        self.routeCheckBox.setVisible(True)
+        self.routeLabel.setVisible(True)
 
     def readSettings(self) -> None:
         self.contactCheckBox.setChecked(bool(config.settings.get("move_to_contact") or False))
         self.positionCheckBox.setChecked(bool(config.settings.get("move_on_success") or False))
+        self.routeCheckBox.setChecked(bool(config.settings.get("optimize_route") or False))
         self.positionsComboBox.readSettings()
         self.operatorWidget.readSettings()
         self.outputWidget.readSettings()
@@ -91,6 +112,8 @@ class StartSequenceDialog(QtWidgets.QDialog):
     def writeSettings(self) -> None:
         config.settings["move_to_contact"] = self.contactCheckBox.isChecked()
         config.settings["move_on_success"] = self.positionCheckBox.isChecked()
+        if self.routeCheckBox.isVisibleTo(self):
+            config.settings["optimize_route"] = self.routeCheckBox.isChecked()
         self.positionsComboBox.writeSettings()
         self.operatorWidget.writeSettings()
         self.outputWidget.writeSettings()
@@ -101,6 +124,9 @@ class StartSequenceDialog(QtWidgets.QDialog):
     def isMoveToContact(self) -> bool:
         return self.contactCheckBox.isChecked()
 
+    def isOptimizeRoute(self) -> bool:
+        return self.isMoveToContact() and self.routeCheckBox.isVisibleTo(self) and self.routeCheckBox.isChecked()
+
     def isMoveToPosition(self) -> Optional[tuple]:
         if self.isMoveToContact() and self.positionCheckBox.isChecked():
             index = self.positionsComboBox.currentIndex()
@@ -542,6 +568,7 @@ class ContactTreeItem(SequenceTreeItem):
         self.setEnabledDefault(contact.enabled)
         self._is_enabled_default = contact.enabled
         self.contact_id = contact.contact_id
+        self.after = list(contact.after)
         self.setDescription(contact.description)
         self.reset_position()
         for measurement in contact.measurements:
@@ -19,7 +19,7 @@ class ContactQualityWorker(comet.Process):
         self.reading = reading
 
     def measure(self):
-        with self.station.lcr_resource:  # TODO
+        with self.station.lease("lcr"):
             lcr = self.station.lcr
             lcr.reset()
             lcr.quick_setup_cp_rp()
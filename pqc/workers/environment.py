@@ -1,7 +1,10 @@
 import logging
+from typing import Optional
 
 from comet.driver.hephy import EnvironmentBox
 
+from ..core.request import PRIORITY_CRITICAL, PRIORITY_MONITORING, PRIORITY_NORMAL
+from ..core.snapshot import Snapshot, SnapshotSlot
 from .resource import ResourceWorker
 
 __all__ = ["EnvironmentWorker"]
@@ -19,18 +22,33 @@ class EnvironmentWorker(ResourceWorker):
         super().__init__(resource=resource, name=name)
         self.pc_data_updated = pc_data_updated
         self._cached_pc_data = None
+        self.pc_data_snapshots: SnapshotSlot = SnapshotSlot()
 
     def pc_data(self, cached=True):
         if not self._cached_pc_data or not cached:
             self.request_pc_data().get()
         return self._cached_pc_data
 
-    def request_pc_data(self):
+    def pc_data_snapshot(self, max_age: Optional[float] = None) -> Snapshot:
+        """Return latest PC data snapshot published by monitoring, requests
+        PC data only if there is no snapshot younger than `max_age` seconds.
+        """
+        snapshot = None
+        if max_age is not None:
+            snapshot = self.pc_data_snapshots.get(max_age)
+        if snapshot is None:
+            # Preempts monitoring, coalesced with pending PC data requests
+            self.request_pc_data(PRIORITY_CRITICAL).get()
+            snapshot = self.pc_data_snapshots.latest()
+        return snapshot
+
+    def request_pc_data(self, priority: int = PRIORITY_NORMAL):
         def request(context):
             self._cached_pc_data = context.pc_data
+            self.pc_data_snapshots.publish(self._cached_pc_data)
             self.emit("pc_data_updated", self._cached_pc_data)
             return self._cached_pc_data
-        return self.async_request(request)
+        return self.async_request(request, priority, key="pc_data")
 
     def has_lights(self):
         """Return True if any light source is enabled."""
@@ -39,18 +57,25 @@ class EnvironmentWorker(ResourceWorker):
                 context.box_light or \
                 context.microscope_light or \
                 context.probecard_light
-        return self.async_request(request).get()
+        return self.async_request(request, key="has_lights").get()
 
     def dim_lights(self):
-        """Switch off all light sources."""
-        self.set_box_light(False)
-        self.set_microscope_light(False)
-        self.set_probecard_light(False)
+        """Switch off all light sources (enqueued at once)."""
+        logger.info("Box Light: OFF")
+        logger.info("Microscope Light: OFF")
+        logger.info("Probecard Light: OFF")
+        requests = []
+        for key in ("box_light", "microscope_light", "probecard_light"):
+            def request(context, key=key):
+                setattr(context, key, False)
+            requests.append(self.async_request(request))
+        for request in requests:
+            request.get()
 
     def identification(self):
         def request(context):
             return context.identification
-        return self.async_request(request).get()
+        return self.async_request(request, key="identification").get()
 
     def discharge(self):
         logger.info("Discharge Decoupling Box...")
@@ -114,4 +139,4 @@ class EnvironmentWorker(ResourceWorker):
         return self.async_request(request).get()
 
     def update_monitoring(self):
-        self.request_pc_data()
+        self.request_pc_data(PRIORITY_MONITORING)
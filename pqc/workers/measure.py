@@ -1,12 +1,17 @@
 import logging
 import os
 import time
-from typing import Tuple
+from datetime import timedelta
+from typing import Optional, Tuple
 
+import numpy as np
 from PyQt5 import QtCore
 
+from ..core.coalesce import UpdateBuffer
 from ..core.functions import LinearRange
+from ..core.planner import SequenceEstimate, SequencePlanner, TimingHistory
 from ..core.request import RequestTimeout
+from ..measurements.mixins import analysis_registry
 from ..core.utils import points_in_circle
 from ..settings import settings
 from ..strategy import InitializeStrategy, FinalizeStrategy, SequenceStrategy, GroupStrategy, SampleStrategy, ContactStrategy, MeasurementStrategy
@@ -24,15 +29,29 @@ __all__ = ["MeasureWorker"]
 logger = logging.getLogger(__name__)
 
 
+def iter_measurement_items(item):
+    """Yield enabled measurement items of a sequence tree item."""
+    if isinstance(item, MeasurementTreeItem):
+        yield item
+        return
+    for child in item.children():
+        if child.isEnabled():
+            yield from iter_measurement_items(child)
+
+
 class MeasureWorker(QtCore.QObject):
-    """Measure process executing a samples, contacts and measurements."""
+    """Measure process executing a samples, contacts and measurements.
+
+    Readings, state, message and progress updates are coalesced and emitted
+    by `updates_available` at most every `update_interval` seconds, updates
+    held back by the interval are emitted by a trailing flush.
+    """
+
+    update_interval: float = 0.05
 
     failed = QtCore.pyqtSignal(Exception)
     finished = QtCore.pyqtSignal()
 
-    message_changed = QtCore.pyqtSignal(str)
-    progress_changed = QtCore.pyqtSignal(int, int)
-
     item_state_changed = QtCore.pyqtSignal(object, object)
     item_reset = QtCore.pyqtSignal(object)
     item_visible = QtCore.pyqtSignal(object)
@@ -40,18 +59,22 @@ class MeasureWorker(QtCore.QObject):
     save_to_image = QtCore.pyqtSignal(object, str)
     measurement_finished = QtCore.pyqtSignal(dict)
 
-    reading_appended = QtCore.pyqtSignal(str, float, float)
-    readings_updated = QtCore.pyqtSignal()
+    updates_available = QtCore.pyqtSignal(dict)
     analysis_appended = QtCore.pyqtSignal(str, dict)
-    state_changed = QtCore.pyqtSignal(dict)
+    estimate_changed = QtCore.pyqtSignal(dict)
 
-    def __init__(self, station, config, item):
+    def __init__(self, station, config, item, timing_history: Optional[TimingHistory] = None):
         super().__init__()
         self.stop_requested: bool = False
         self.station = station
         self.config: dict = {}
         self.sequence_item = item
         self.retry_offset_generators: dict = {}
+        self.pending_table_move = None
+        self.table_sample_item = None
+        self.timing_history: TimingHistory = timing_history or TimingHistory()
+        self.sequence_estimate: Optional[SequenceEstimate] = None
+        self.update_buffer: UpdateBuffer = UpdateBuffer(self.update_interval)
         # Set default configuration
         self.config.update({
             "before_measurement_delay": 0.0,
@@ -60,8 +83,16 @@ class MeasureWorker(QtCore.QObject):
             "retry_contact_overdrive": 0.0,
             "table_contact_delay": 0.0,
             "table_move_timeout": 120.0,
+            "table_pipelined_moves": False,
+            "table_dodge_moves": False,
+            "table_dodge_height": 0.5,
+            "table_dodge_distance": 10.0,
+            "matrix_delta_switching": False,
+            "environ_max_age": 5.0,
             "serialize_json": True,
             "serialize_txt": False,
+            "serialize_npz": False,
+            "serialize_sync_interval": 5.0,
         })
         # Update custom configuration
         self.config.update(config)
@@ -70,38 +101,57 @@ class MeasureWorker(QtCore.QObject):
         """Stop running measurements."""
         self.stop_requested = True
 
+    def flush_updates(self, force: bool = True) -> None:
+        """Emit pending updates, unless not forced and the update interval
+        has not yet elapsed (emitted by a trailing flush then)."""
+        self.update_buffer.flush(self.updates_available.emit, force)
+
     def set_message(self, message: str) -> None:
-        self.message_changed.emit(message)
+        self.update_buffer.set_message(message)
+        self.flush_updates(force=False)
 
     def set_progress(self, value: int, maximum: int) -> None:
-        self.progress_changed.emit(value, maximum)
+        self.update_buffer.set_progress(value, maximum)
+        self.flush_updates(force=False)
 
     def set_item_state(self, item, state) -> None:
+        self.flush_updates()
         self.item_state_changed.emit(item, state)
 
     def reset_measurement_item(self, item) -> None:
+        self.flush_updates()
         self.item_reset.emit(item)
 
     def show_measurement_item(self, item) -> None:
+        self.flush_updates()
         self.item_visible.emit(item)
 
     def hide_measurement_item(self, item) -> None:
+        self.flush_updates()
         self.item_hidden.emit(item)
 
     def append_reading(self, name, x, y) -> None:
-        self.reading_appended.emit(name, x, y)
+        self.append_readings(name, [x], [y])
+
+    def append_readings(self, name, xs, ys) -> None:
+        """Append readings as NumPy arrays."""
+        self.update_buffer.append_readings(name, xs, ys)
+        self.flush_updates(force=False)
 
     def update_readings(self) -> None:
-        self.readings_updated.emit()
+        self.update_buffer.update_readings()
+        self.flush_updates(force=False)
 
     def append_analysis(self, key: str, values: dict) -> None:
+        self.flush_updates()
         self.analysis_appended.emit(key, values)
 
     def update_state(self, data: dict) -> None:
-        self.state_changed.emit(data)
+        self.update_buffer.update_state(data)
+        self.flush_updates(force=False)
 
     def safe_recover_hvsrc(self) -> None:
-        with self.station.hvsrc_resource as hvsrc_resource:
+        with self.station.lease("hvsrc") as hvsrc_resource:
             hvsrc = settings.hvsrc_instrument(hvsrc_resource)
             if hvsrc.get_output() == hvsrc.OUTPUT_ON:
                 self.set_message("Ramping down HV Source...")
@@ -115,7 +165,7 @@ class MeasureWorker(QtCore.QObject):
         self.set_message("Initialized HVSource.")
 
     def safe_recover_vsrc(self) -> None:
-        with self.station.vsrc_resource as vsrc_resource:
+        with self.station.lease("vsrc") as vsrc_resource:
             vsrc = settings.vsrc_instrument(vsrc_resource)
             if vsrc.get_output() == vsrc.OUTPUT_ON:
                 self.set_message("Ramping down V Source...")
@@ -144,6 +194,11 @@ class MeasureWorker(QtCore.QObject):
             raise RuntimeError("Unable to open matrix channels: %s", channels)
         self.set_message("Opened all matrix channels.")
 
+    def release_matrix(self) -> None:
+        """Open matrix channels left closed by delta switching."""
+        self.station.matrix.release_channels()
+        logger.debug("matrix switch operations: %d", self.station.matrix.controller.operations)
+
     def add_retry_offset(self, x: float, y: float) -> Tuple[float, float]:
         """Add a random offset to point (x, y) within specified radius and
         minimum distance between all other points before."""
@@ -166,21 +221,89 @@ class MeasureWorker(QtCore.QObject):
         logger.info(" => applying re-contact overdrive: %g mm", overdrive)
         return z
 
-    def safe_move_table(self, position) -> None:
+    def prepare_move_table(self, position) -> None:
+        """Start moving table to X/Y of position with Z axis retreated,
+        without waiting for the movement to finish."""
+        table_worker = self.station.table_worker
+        if table_worker.running and table_worker.enabled:
+            x, y, z = position
+            logger.info("Pre-position table to %s, %s", x, y)
+            self.pending_table_move = table_worker.safe_absolute_move(x, y, 0)
+
+    def wait_pending_table_move(self) -> None:
+        """Wait for pending pre-positioning of table to finish."""
+        request, self.pending_table_move = self.pending_table_move, None
+        if request is not None:
+            timeout = self.config.get("table_move_timeout")
+            try:
+                request.get(timeout=timeout)
+            except Exception as exc:
+                logger.warning("Pre-position table failed: %s", exc)
+                self.table_sample_item = None
+
+    def safe_move_table(self, position, sample_item=None) -> None:
+        """Safely move table to position.
+
+        If dodge moves are enabled and the table is already positioned at a
+        contact of the same sample item, Z is only lowered by the dodge height
+        for short hops instead of retreating completely.
+        """
+        self.wait_pending_table_move()
         table_worker = self.station.table_worker
         if table_worker.running and table_worker.enabled:
             logger.info("Safe move table to %s", position)
             self.set_message("Moving table...")
             timeout = self.config.get("table_move_timeout")
+            dodge_height = None
+            if self.config.get("table_dodge_moves"):
+                if sample_item is not None and sample_item is self.table_sample_item:
+                    dodge_height = self.config.get("table_dodge_height")
             x, y, z = position
+            self.table_sample_item = None
             try:
-                table_worker.safe_absolute_move(x, y, z).get(timeout=timeout)
+                dodge_distance = self.config.get("table_dodge_distance")
+                table_worker.safe_absolute_move(x, y, z, dodge_height=dodge_height, dodge_distance=dodge_distance).get(timeout=timeout)
                 self.config.update({"table_position": table_worker.get_cached_position()})
                 self.set_message("Moving table... done.")
             except RequestTimeout as exc:
                 raise TimeoutError(f"Table move timeout after {timeout} s...") from exc
+            self.table_sample_item = sample_item
             logger.info("Safe move table to %s... done.", position)
 
+    def plan_sequence(self) -> None:
+        """Estimate duration of sequence item from parameters and timing
+        history."""
+        planner = SequencePlanner(self.timing_history)
+        steps = planner.plan(self.sequence_item, bool(self.config.get("move_to_contact")))
+        self.sequence_estimate = SequenceEstimate(steps)
+        logger.info("Estimated sequence duration: %s", timedelta(seconds=round(self.sequence_estimate.total)))
+        self.update_estimate()
+
+    def validate_analysis_functions(self) -> None:
+        """Resolve analysis functions of all enabled measurements, raises
+        `KeyError` on unknown analysis functions before anything moves."""
+        for item in iter_measurement_items(self.sequence_item):
+            try:
+                analysis_registry.validate(item.parameters.get("analysis_functions"))
+            except KeyError as exc:
+                raise KeyError(f"{item.contact.name()} / {item.name()}: {exc.args[0]}") from exc
+
+    def update_estimate(self) -> None:
+        if self.sequence_estimate is not None:
+            data = self.sequence_estimate.asdict()
+            self.station.state.update({"sequence_estimate": data})
+            self.estimate_changed.emit(data)
+
+    def complete_step(self, item) -> None:
+        """Mark contact (table move) or measurement item as done."""
+        if self.sequence_estimate is not None:
+            self.sequence_estimate.complete(item)
+            self.update_estimate()
+
+    def record_timing(self, key: str, duration: float, points: int = 0, waiting: float = 0.) -> None:
+        """Record measured duration to timing history."""
+        self.timing_history.record(key, duration, points, waiting)
+
     def apply_contact_delay(self) -> None:
         contact_delay = abs(self.config.get("table_contact_delay"))
         if contact_delay > 0:
@@ -195,6 +318,8 @@ class MeasureWorker(QtCore.QObject):
     def initialize(self) -> None:
         self.set_message("Initialize...")
         self.stop_requested = False
+        self.validate_analysis_functions()
+        self.plan_sequence()
         try:
             InitializeStrategy(self)()
         except Exception:
@@ -221,6 +346,7 @@ class MeasureWorker(QtCore.QObject):
     def finalize(self) -> None:
         self.set_message("Finalize...")
         try:
+            self.wait_pending_table_move()
             FinalizeStrategy(self)()
         except Exception:
             self.set_message("Finalize... failed.")
@@ -232,11 +358,12 @@ class MeasureWorker(QtCore.QObject):
 
     def __call__(self) -> None:
         try:
-            try:
-                self.initialize()
-                self.process()
-            finally:
-                self.finalize()
+            with self.station.sessions.persistent():
+                try:
+                    self.initialize()
+                    self.process()
+                finally:
+                    self.finalize()
         except Exception as exc:
             logger.exception(exc)
             self.failed.emit(exc)
@@ -244,4 +371,9 @@ class MeasureWorker(QtCore.QObject):
         else:
             self.set_message("Measurement done.")
         finally:
+            self.sequence_estimate = None
+            self.station.state.pop("sequence_estimate", None)
+            self.estimate_changed.emit({})
+            self.flush_updates()
+            self.update_buffer.cancel()
             self.finished.emit()
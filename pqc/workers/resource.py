@@ -1,13 +1,13 @@
 import logging
-import queue
 import threading
 import time
+from typing import Any, Dict, Hashable, Optional
 # import traceback
 
 from comet.driver import Driver as DefaultDriver
 from comet.process import Process
 
-from ..core.request import Request
+from ..core.request import PRIORITY_NORMAL, Request, RequestQueue
 from ..core.timer import Timer
 
 __all__ = ["ResourceWorker", "async_request"]
@@ -35,7 +35,7 @@ class ResourceWorker(Process):
         self.name: str = name
         self.enabled: bool = enabled
         self._failed_retries: int = 0
-        self._queue: queue.Queue = queue.Queue()
+        self._queue: RequestQueue = RequestQueue()
         self._lock = threading.RLock()
         self._context_lock = threading.RLock()
 
@@ -47,13 +47,17 @@ class ResourceWorker(Process):
         self._context_lock.release()
         return False
 
-    def async_request(self, callback):
+    def async_request(self, callback, priority: int = PRIORITY_NORMAL, key: Optional[Hashable] = None):
+        """Enqueue request, requests with the same key are coalesced with a
+        pending request (latest callback wins)."""
         with self._lock:
             if not self.enabled:
                 raise RuntimeError("service not enabled")
-            request = Request(callback)
-            self._queue.put_nowait(request)
-            return request
+            return self._queue.put(Request(callback, priority, key))
+
+    def metrics(self) -> Dict[str, Any]:
+        """Return request queue depth and latency metrics."""
+        return self._queue.metrics()
 
     def update_monitoring(self):
         ...
@@ -69,15 +73,9 @@ class ResourceWorker(Process):
                         break
                     if not self.enabled:
                         break
-                    try:
-                        request = self._queue.get(timeout=self.throttle_time)
-                    except queue.Empty:
-                        ...
-                    else:
-                        try:
-                            request(driver)
-                        finally:
-                            self._queue.task_done()
+                    request = self._queue.get(timeout=self.throttle_time)
+                    if request is not None:
+                        request(driver)
                     # Update monitoring in periodic intervals
                     if t.delta() >= type(self).update_monitoring_interval:
                         self.update_monitoring()
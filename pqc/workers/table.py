@@ -5,6 +5,7 @@ import threading
 import time
 import traceback
 import queue
+from typing import Callable, Optional
 
 from PyQt5 import QtCore
 
@@ -13,6 +14,7 @@ import comet
 from pqc.utils import from_table_unit, to_table_unit
 from pqc.core.timer import Timer
 
+from ..core.motion import Deadline, move_distance, move_duration, plan_dodge_move, poll_intervals
 from ..core.request import Request
 from ..core.position import Position
 from ..settings import settings
@@ -27,8 +29,6 @@ AXIS_NAMES: dict = {
     2: "Z"
 }
 
-RETRIES: int = 180
-
 logger = logging.getLogger(__name__)
 
 
@@ -89,6 +89,11 @@ class AlternateTableWorker(TableWorker):
 
     maximum_z = 23.800
 
+    motion_velocity = 10.0  # mm/s, to estimate movement durations
+    motion_timeout = 180.0  # s, for all phases of a movement request
+    calibration_timeout = 600.0  # s, for all steps of a calibration
+    calibration_distance = 100.0  # mm, expected axis range for calibration
+
     def __init__(self, message_changed=None, progress_changed=None,
                  position_changed=None, caldone_changed=None, joystick_changed=None,
                  relative_move_finished=None, absolute_move_finished=None,
@@ -143,6 +148,37 @@ class AlternateTableWorker(TableWorker):
         self._cached_position = x, y, z
         return Position(x, y, z)
 
+    def _is_short_hop(self, current_pos: tuple, position: Position, maximum_distance: float) -> bool:
+        """Return True if X/Y distance between positions (table units) is
+        within maximum distance (mm)."""
+        distance = from_table_unit(move_distance(current_pos[:2], (position.x, position.y)))
+        return distance <= maximum_distance
+
+    def _wait_motion(self, table, deadline: Deadline, distance: float,
+                     handle_abort: Callable, update_status: Callable,
+                     reached: Optional[Callable] = None) -> tuple:
+        """Wait for table movement to finish, returns final position in table
+        units.
+
+        Polls the moving status bit with intervals adapted to the expected
+        duration of the movement (distance in millimeters). If given,
+        movement is only finished if `reached(position)` is true. Raises
+        `TimeoutError` if deadline expires before.
+        """
+        duration = move_duration(distance, self.motion_velocity)
+        for interval in poll_intervals(duration):
+            time.sleep(deadline.clamp(interval))
+            handle_abort()
+            is_moving = table.is_moving
+            current_pos = table.position
+            update_status(*current_pos)
+            if not is_moving:
+                if reached is None or reached(current_pos):
+                    return current_pos
+            if deadline.expired():
+                raise TimeoutError(f"table movement timeout after {deadline.timeout:.0f} s, current pos: {current_pos}")
+        return table.position
+
     def _get_caldone(self, table) -> Position:
         x, y, z = table.caldone
         self._cached_caldone = x, y, z
@@ -239,12 +275,18 @@ class AlternateTableWorker(TableWorker):
             self.set_message("Ready")
         return self.async_request(request)
 
-    def safe_absolute_move(self, x, y, z) -> Request:
+    def safe_absolute_move(self, x, y, z, dodge_height: Optional[float] = None,
+                           dodge_distance: float = 10.0) -> Request:
         """Safely move to absolute position while moving X/Y axis at zero Z.
          - move Z down to zero
          - move X and Y
          - move Z up
 
+        If dodge height (mm) is given and the X/Y distance does not exceed
+        dodge distance (mm), Z is only lowered by dodge height below the
+        current and target position while moving X and Y (short hops between
+        contacts of a sample).
+
         Emits following events:
         - position_changed
         - caldone_changed
@@ -256,8 +298,7 @@ class AlternateTableWorker(TableWorker):
             self._stop_event.clear()
             self.set_message("Moving...")
 
-            retries = RETRIES
-            delay = 1.0
+            deadline = Deadline(self.motion_timeout)
 
             table.handle_machine_error()
             table.handle_error()
@@ -278,60 +319,75 @@ class AlternateTableWorker(TableWorker):
                 x, y, z = table.caldone
                 self.set_caldone(Position(x, y, z))
 
-            handle_abort()
-            update_caldone()
-
-            self.set_progress(1, 4)
-            self.set_message("Retreating Z axis...")
+            def retreat_move():
+                self.set_progress(1, 4)
+                self.set_message("Retreating Z axis...")
+
+                # Moving into limit switch generates error 1004
+                start_pos = table.position
+                table.move_relative((0, 0, -AXIS_OFFSET))
+                current_pos = self._wait_motion(
+                    table, deadline, from_table_unit(start_pos[2]), handle_abort, update_status,
+                    reached=lambda pos: pos[2] == 0
+                )
+                if current_pos[2] != 0:
+                    raise RuntimeError(f"failed to relative move, current pos: {current_pos}")
+                # Clear error 1004
+                table.handle_error(ignore=[1004])
 
-            # Moving into limit switch generates error 1004
-            table.move_relative((0, 0, -AXIS_OFFSET))
-            for i in range(retries):
                 handle_abort()
-                current_pos = table.position
-                update_status(*current_pos)
-                if current_pos[2] == 0:
-                    break
-                time.sleep(delay)
-            current_pos = table.position
-            if current_pos[2] != 0:
-                raise RuntimeError(f"failed to relative move, current pos: {current_pos}")
-            # Clear error 1004
-            table.handle_error(ignore=[1004])
+                update_caldone()
 
-            handle_abort()
-            update_caldone()
+                table.handle_machine_error()
+                table.handle_error()
 
-            table.handle_machine_error()
-            table.handle_error()
+                self.set_progress(2, 4)
+                self.set_message("Move X Y axes...")
+                table.move_absolute((position.x, position.y, 0))
+                current_pos = self._wait_motion(
+                    table, deadline, from_table_unit(move_distance(current_pos[:2], (position.x, position.y))),
+                    handle_abort, update_status,
+                    reached=lambda pos: pos[:2] == (position.x, position.y)
+                )
+                if current_pos[:2] != (position.x, position.y):
+                    raise RuntimeError(f"failed to absolute move, current pos: {current_pos}")
+
+                self.set_progress(3, 4)
+                self.set_message("Move up Z axis...")
+                table.move_relative((0, 0, position.z))
+                current_pos = self._wait_motion(
+                    table, deadline, from_table_unit(position.z), handle_abort, update_status,
+                    reached=lambda pos: pos[2] >= position.z
+                )
+                if current_pos != (position.x, position.y, position.z):
+                    raise RuntimeError(f"failed to relative move, current pos: {current_pos}")
+
+            def dodge_move(current_pos):
+                waypoints = plan_dodge_move(current_pos, position, to_table_unit(dodge_height))
+                for index, waypoint in enumerate(waypoints):
+                    self.set_progress(index + 1, len(waypoints) + 1)
+                    self.set_message("Move X Y Z axes (dodge)...")
+                    table.move_absolute(waypoint)
+                    current_pos = self._wait_motion(
+                        table, deadline, from_table_unit(move_distance(current_pos, waypoint)),
+                        handle_abort, update_status,
+                        reached=lambda pos, waypoint=waypoint: pos == waypoint
+                    )
+                    if current_pos != waypoint:
+                        raise RuntimeError(f"failed to absolute move, current pos: {current_pos}")
+
+                    table.handle_machine_error()
+                    table.handle_error()
+                    table.handle_calibration_error()
 
-            self.set_progress(2, 4)
-            self.set_message("Move X Y axes...")
-            table.move_absolute((position.x, position.y, 0))
-            for i in range(retries):
-                handle_abort()
-                current_pos = table.position
-                update_status(*current_pos)
-                if current_pos[:2] == (position.x, position.y):
-                    break
-                time.sleep(delay)
-            current_pos = table.position
-            if current_pos[:2] != (position.x, position.y):
-                raise RuntimeError(f"failed to absolute move, current pos: {current_pos}")
+            handle_abort()
+            update_caldone()
 
-            self.set_progress(3, 4)
-            self.set_message("Move up Z axis...")
-            table.move_relative((0, 0, position.z))
-            for i in range(retries):
-                handle_abort()
-                current_pos = table.position
-                update_status(*current_pos)
-                if current_pos[2] >= position.z:
-                    break
-                time.sleep(delay)
             current_pos = table.position
-            if current_pos != (position.x, position.y, position.z):
-                raise RuntimeError(f"failed to relative move, current pos: {current_pos}")
+            if dodge_height is not None and self._is_short_hop(current_pos, position, dodge_distance):
+                dodge_move(current_pos)
+            else:
+                retreat_move()
 
             handle_abort()
             update_caldone()
@@ -351,8 +407,7 @@ class AlternateTableWorker(TableWorker):
         def request(table):
             self._stop_event.clear()
             self.set_message("Calibrating...")
-            timeout: float = 60.0  # movement timeout in seconds
-            retries = RETRIES
+            deadline = Deadline(self.calibration_timeout)
             delay: float = 1.0  # operaion delay in seconds
             axes = table.axes
 
@@ -375,17 +430,7 @@ class AlternateTableWorker(TableWorker):
                 index = axes.index(axis)
                 logger.info("ncal %s...", AXIS_NAMES.get(index))
                 axis.ncal()
-                t_start = time.monotonic()
-                time.sleep(delay)
-                while table.is_moving:
-                    handle_abort()
-                    if time.monotonic() - t_start > timeout:
-                        raise TimeoutError()
-                    current_pos = table.position
-                    update_status(*current_pos)
-                    time.sleep(delay)
-                current_pos = table.position
-                update_status(*current_pos)
+                self._wait_motion(table, deadline, self.calibration_distance, handle_abort, update_status)
                 logger.info("ncal %s... done.", AXIS_NAMES.get(index))
                 return True
 
@@ -393,17 +438,7 @@ class AlternateTableWorker(TableWorker):
                 index = axes.index(axis)
                 logger.info("nrm %s...", AXIS_NAMES.get(index))
                 axis.nrm()
-                t_start = time.monotonic()
-                time.sleep(delay)
-                while table.is_moving:
-                    handle_abort()
-                    if time.monotonic() - t_start > timeout:
-                        raise TimeoutError()
-                    current_pos = table.position
-                    update_status(*current_pos)
-                    time.sleep(delay)
-                current_pos = table.position
-                update_status(*current_pos)
+                self._wait_motion(table, deadline, self.calibration_distance, handle_abort, update_status)
                 logger.info("nrm %s... done.", AXIS_NAMES.get(index))
                 return True
 
@@ -479,15 +514,13 @@ class AlternateTableWorker(TableWorker):
             table.handle_error()
 
             # Moving into limit switches generates error 1004
+            start_pos = table.position
             table.move_relative((-AXIS_OFFSET, -AXIS_OFFSET, 0))
-            for i in range(retries):
-                time.sleep(delay)
-                if not table.is_moving:
-                    break
-                handle_abort()
-                update_status(*table.position)
+            current_pos = self._wait_motion(
+                table, deadline, from_table_unit(move_distance(start_pos[:2], (0, 0))),
+                handle_abort, update_status
+            )
             # Verify table position
-            current_pos = table.position
             if current_pos[:2] != (0, 0):
                 raise RuntimeError(f"failed to relative move, current pos: {current_pos}")
             # Clear error 1004
@@ -497,14 +530,11 @@ class AlternateTableWorker(TableWorker):
             x_offset = 52000  # TODO
             y_offset = 0
             table.move_relative((x_offset, y_offset, 0))
-            for i in range(retries):
-                time.sleep(delay)
-                if not table.is_moving:
-                    break
-                handle_abort()
-                update_status(*table.position)
+            current_pos = self._wait_motion(
+                table, deadline, from_table_unit(max(x_offset, y_offset)),
+                handle_abort, update_status
+            )
             # Verify table position
-            current_pos = table.position
             if current_pos[:2] != (x_offset, y_offset):
                 raise RuntimeError(f"failed to relative move, current pos: {current_pos}")
 
@@ -543,15 +573,13 @@ class AlternateTableWorker(TableWorker):
             # Move Z axis down
             x_offset = 52000  # TODO
             y_offset = 0
+            start_pos = table.position
             table.move_absolute((x_offset, y_offset, 0))
-            for i in range(retries):
-                time.sleep(delay)
-                if not table.is_moving:
-                    break
-                handle_abort()
-                update_status(*table.position)
+            current_pos = self._wait_motion(
+                table, deadline, from_table_unit(move_distance(start_pos, (x_offset, y_offset, 0))),
+                handle_abort, update_status
+            )
             # Verify table position
-            current_pos = table.position
             if current_pos[2] != 0:
                 raise RuntimeError(f"failed to relative move, current pos: {current_pos}")
 
@@ -562,15 +590,13 @@ class AlternateTableWorker(TableWorker):
             table.handle_error()
 
             # Move to default position
+            start_pos = table.position
             table.move_absolute((0, 0, 0))
-            for i in range(retries):
-                time.sleep(delay)
-                if not table.is_moving:
-                    break
-                handle_abort()
-                update_status(*table.position)
+            current_pos = self._wait_motion(
+                table, deadline, from_table_unit(move_distance(start_pos, (0, 0, 0))),
+                handle_abort, update_status
+            )
             # Verify table position
-            current_pos = table.position
             if current_pos != (0, 0, 0):
                 raise RuntimeError(f"failed to absolute move, current pos: {current_pos}")
 
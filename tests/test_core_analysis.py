@@ -0,0 +1,97 @@
+import os
+
+import numpy as np
+import pytest
+
+from pqc.core.analysis import AnalysisCache, AnalysisResultCache, analysis_key, config_digest, file_digest, find_measurement_files
+
+
+def test_find_measurement_files(tmp_path):
+    (tmp_path / "sample").mkdir()
+    (tmp_path / "sample" / "b.json").write_text("{}")
+    (tmp_path / "sample" / "a.json").write_text("{}")
+    (tmp_path / "sample" / "a.txt").write_text("")
+    (tmp_path / "analysis_cache.json").write_text("{}")
+    filenames = list(find_measurement_files([str(tmp_path)]))
+    assert filenames == [
+        os.path.join(str(tmp_path), "sample", "a.json"),
+        os.path.join(str(tmp_path), "sample", "b.json"),
+    ]
+    assert list(find_measurement_files(["c.npz"])) == ["c.npz"]
+    with pytest.raises(ValueError):
+        list(find_measurement_files(["c.txt"]))
+
+
+def test_find_measurement_files_npz(tmp_path):
+    (tmp_path / "a.npz").write_bytes(b"")
+    (tmp_path / "b.json").write_text("{}")
+    (tmp_path / "b.npz").write_bytes(b"")
+    (tmp_path / "b.txt").write_text("")
+    (tmp_path / "c.npz").write_bytes(b"")
+    filenames = list(find_measurement_files([str(tmp_path)]))
+    assert filenames == [
+        os.path.join(str(tmp_path), "a.npz"),
+        os.path.join(str(tmp_path), "b.json"),
+        os.path.join(str(tmp_path), "c.npz"),
+    ]
+    filenames = list(find_measurement_files([str(tmp_path)], suffixes=(".npz", ".json")))
+    assert os.path.join(str(tmp_path), "b.npz") in filenames
+    assert len(filenames) == 3
+
+
+def test_digests(tmp_path):
+    filename = tmp_path / "a.json"
+    filename.write_text("{}")
+    digest = file_digest(str(filename))
+    assert digest == file_digest(str(filename))
+    filename.write_text("[]")
+    assert digest != file_digest(str(filename))
+    assert config_digest({"a": 1, "b": 2}) == config_digest({"b": 2, "a": 1})
+    assert config_digest(["iv"], "0.3.1") != config_digest(["iv"], "0.3.2")
+
+
+def test_analysis_cache(tmp_path):
+    filename = tmp_path / "a.json"
+    filename.write_text("{}")
+    cache_filename = str(tmp_path / "analysis_cache.json")
+    cache = AnalysisCache.load(cache_filename)
+    assert len(cache) == 0
+    assert cache.digest(str(filename)) is None
+    cache.set(str(filename), "abc", "cfg", [{"state": "Success"}])
+    cache.save()
+    cache = AnalysisCache.load(cache_filename)
+    assert len(cache) == 1
+    assert cache.digest(str(filename)) == "abc"
+    assert cache.known_digest(str(filename), "cfg") == "abc"
+    assert cache.known_digest(str(filename), "other") is None
+    assert cache.get(str(filename), "abc", "cfg") == [{"state": "Success"}]
+    assert cache.get(str(filename), "abc", "other") is None
+    assert cache.get(str(filename), "def", "cfg") is None
+    filename.write_text("{\n}")
+    assert cache.digest(str(filename)) is None
+
+
+def test_analysis_key():
+    i = np.array([1e-9, 2e-9])
+    v = np.array([0., 1.])
+    key = analysis_key("iv", {}, {"i": i, "v": v})
+    assert key == analysis_key("iv", {}, {"v": v.copy(), "i": i.copy()})
+    assert key != analysis_key("cv", {}, {"i": i, "v": v})
+    assert key != analysis_key("iv", {"a": 1}, {"i": i, "v": v})
+    assert key != analysis_key("iv", {}, {"i": i, "v": v[::-1]})
+    assert key != analysis_key("iv", {}, {"i": i.astype(np.float32), "v": v})
+
+
+def test_analysis_result_cache():
+    cache = AnalysisResultCache(maxsize=2)
+    assert cache.get("a") is None
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)  # evicts least recently used b
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+    assert (cache.hits, cache.misses) == (2, 2)
+    cache.clear()
+    assert len(cache) == 0
@@ -0,0 +1,80 @@
+import math
+import time
+
+import numpy as np
+
+from pqc.core.coalesce import Bounds, UpdateBuffer
+
+
+def test_bounds():
+    bounds = Bounds()
+    assert bounds.is_empty()
+    bounds.update([1, 2], [3, 4])
+    bounds.update(np.array([-1, math.nan]), np.array([5, math.inf]))
+    assert bounds.count == 4
+    assert bounds.x == (-1.0, 2.0)
+    assert bounds.y == (3.0, 5.0)
+    bounds.update([], [])
+    assert bounds.count == 4
+    bounds.reset()
+    assert bounds.is_empty()
+    assert bounds.count == 0
+
+
+def test_update_buffer():
+    buffer = UpdateBuffer(interval=60.)
+    assert buffer.due()
+    assert buffer.take() == {}
+    assert not buffer.due()
+    buffer.append_readings("hvsrc", [1.0], [2.0])
+    buffer.append_readings("hvsrc", np.array([3.0, 4.0]), np.array([5.0, 6.0]))
+    buffer.append_readings("xfit", [0.0], [0.0])
+    buffer.update_readings()
+    buffer.update_state({"a": 1, "b": 2})
+    buffer.update_state({"a": 3})
+    buffer.set_message("first")
+    buffer.set_message("second")
+    buffer.set_progress(1, 10)
+    buffer.set_progress(2, 10)
+    updates = buffer.take()
+    xs, ys = updates["readings"]["hvsrc"]
+    assert xs.tolist() == [1.0, 3.0, 4.0]
+    assert ys.tolist() == [2.0, 5.0, 6.0]
+    assert set(updates["readings"]) == {"hvsrc", "xfit"}
+    assert updates["update"] is True
+    assert updates["state"] == {"a": 3, "b": 2}
+    assert updates["message"] == "second"
+    assert updates["progress"] == (2, 10)
+    assert buffer.take() == {}
+
+
+def test_update_buffer_trailing_flush():
+    buffer = UpdateBuffer(interval=0.05)
+    emitted = []
+    buffer.set_message("first")
+    buffer.flush(emitted.append, force=False)
+    assert emitted == [{"message": "first"}]
+    # Burst within interval, last update must arrive without a later call
+    buffer.update_state({"hvsrc_voltage": 1.0})
+    buffer.flush(emitted.append, force=False)
+    buffer.set_message("Ramping down HV Source...")
+    buffer.flush(emitted.append, force=False)
+    assert len(emitted) == 1
+    deadline = time.monotonic() + 5.0
+    while len(emitted) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert emitted[1] == {"state": {"hvsrc_voltage": 1.0}, "message": "Ramping down HV Source..."}
+    time.sleep(0.1)
+    assert len(emitted) == 2
+
+
+def test_update_buffer_cancel():
+    buffer = UpdateBuffer(interval=60.)
+    emitted = []
+    buffer.flush(emitted.append)
+    buffer.set_progress(1, 2)
+    buffer.flush(emitted.append, force=False)
+    buffer.cancel()
+    assert emitted == []
+    buffer.flush(emitted.append)
+    assert emitted == [{"progress": (1, 2)}]
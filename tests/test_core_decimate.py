@@ -0,0 +1,43 @@
+import math
+
+import numpy as np
+import pytest
+
+from pqc.core.decimate import minmax_decimate
+
+
+def test_minmax_decimate_small():
+    xs, ys = minmax_decimate([0, 1, 2], [3, 4, 5], columns=10)
+    assert xs.tolist() == [0, 1, 2]
+    assert ys.tolist() == [3, 4, 5]
+
+
+def test_minmax_decimate_envelope():
+    xs = np.linspace(0, 10, 10001)
+    ys = np.sin(xs * 20)
+    ys[5000] = 42.0  # spike must survive
+    dx, dy = minmax_decimate(xs, ys, columns=100)
+    assert len(dx) <= 200
+    assert dy.max() == 42.0
+    assert dy.min() == ys.min()
+    assert np.all(np.diff(dx) >= 0)  # original order
+
+
+def test_minmax_decimate_non_finite():
+    xs = np.arange(10.)
+    ys = np.arange(10.)
+    ys[3] = math.nan
+    dx, dy = minmax_decimate(xs, ys, columns=2)
+    assert np.all(np.isfinite(dy))
+    assert dy.tolist() == [0., 4., 5., 9.]
+
+
+def test_minmax_decimate_constant_x():
+    dx, dy = minmax_decimate([1, 1, 1, 1], [3, 1, 4, 2], columns=1)
+    assert dx.tolist() == [1, 1]
+    assert dy.tolist() == [1, 4]
+
+
+def test_minmax_decimate_size():
+    with pytest.raises(ValueError):
+        minmax_decimate([1, 2], [1], columns=1)
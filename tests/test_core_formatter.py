@@ -34,3 +34,36 @@ def test_pqc_formatter():
         "key\tvalue",
         "spam\t+4.200000E+01",
     ]
+
+
+def test_csv_formatter_write_columns():
+    fp = StringIO()
+    fmt = CSVFormatter(fp)
+    fmt.add_column("key")
+    fmt.add_column("value", "+E")
+    fmt.write_header()
+    fmt.write_columns({"key": ["spam", "eggs"], "value": [42.0, -1.0]})
+    fmt.write_columns({"key": [], "value": []})
+    fp.seek(0)
+    assert [line.strip() for line in fp] == [
+        "key,value",
+        "spam,+4.200000E+01",
+        "eggs,-1.000000E+00",
+    ]
+
+
+def test_pqc_formatter_write_columns():
+    fp = StringIO()
+    fmt = PQCFormatter(fp)
+    fmt.add_column("x", "E")
+    fmt.add_column("y", "E")
+    fmt.write_header()
+    fmt.write_row({"x": 1.0, "y": 2.0})
+    fmt.write_columns({"x": [3.0, float("nan")], "y": [4.0, 5.0]})
+    fp.seek(0)
+    assert [line.strip() for line in fp] == [
+        "x\ty",
+        "1.000000E+00\t2.000000E+00",
+        "3.000000E+00\t4.000000E+00",
+        "NAN\t5.000000E+00",
+    ]
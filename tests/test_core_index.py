@@ -0,0 +1,38 @@
+from pqc.core.index import MeasurementIndex
+
+
+def test_measurement_index(tmp_path):
+    filename = str(tmp_path / "index.sqlite")
+    with MeasurementIndex(filename) as index:
+        index.add({
+            "timestamp": 100.0,
+            "sample_name": "HPK_VPX1_001",
+            "contact_name": "Flute 1",
+            "measurement_name": "Diode IV",
+            "measurement_type": "iv_ramp",
+            "measurement_state": "Success",
+            "files": ["HPK_VPX1_001/a.json"],
+            "analysis": {"i_max": 1e-9},
+        })
+        index.add({
+            "timestamp": 200.0,
+            "sample_name": "HPK_VPX1_002",
+            "measurement_type": "iv_ramp",
+            "measurement_state": "Compliance",
+        })
+        index.add({
+            "timestamp": 300.0,
+            "sample_name": "HPK_VPX1_002",
+            "measurement_type": "cv_ramp",
+            "measurement_state": "Success",
+        })
+    with MeasurementIndex(filename) as index:
+        records = index.query(measurement_type="iv_ramp")
+        assert [record["timestamp"] for record in records] == [100.0, 200.0]
+        assert records[0]["files"] == ["HPK_VPX1_001/a.json"]
+        assert records[0]["analysis"] == {"i_max": 1e-9}
+        assert records[1]["files"] == []
+        assert len(index.query(sample_name="HPK_VPX1_%")) == 3
+        assert len(index.query(sample_name="HPK_VPX1_002", measurement_state="Success")) == 1
+        assert [record["timestamp"] for record in index.query(since=150.0, until=300.0)] == [200.0]
+        assert len(index.query(limit=1)) == 1
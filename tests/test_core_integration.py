@@ -0,0 +1,15 @@
+from pqc.core.integration import integration_time, poll_interval
+
+
+def test_integration_time():
+    assert integration_time(1.0) == 0.02
+    assert integration_time(5.0, count=10) == 1.0
+    assert integration_time(5.0, count=0) == 0.1
+    assert integration_time(6.0, line_frequency=60.0) == 0.1
+
+
+def test_poll_interval():
+    assert poll_interval(0.1) == 0.025
+    assert poll_interval(0.0) == 0.010
+    assert poll_interval(10.0) == 0.250
+    assert poll_interval(1.0, maximum=0.1) == 0.1
@@ -0,0 +1,41 @@
+import itertools
+
+from pqc.core.motion import Deadline, move_distance, move_duration, plan_dodge_move, poll_intervals
+
+
+def test_move_distance():
+    assert move_distance((0, 0, 0), (0, 0, 0)) == 0
+    assert move_distance((0, 0, 0), (4.0, -10.0, 0)) == 10.0
+    assert move_distance((1.0, 2.0), (1.5, 2.0)) == 0.5
+
+
+def test_move_duration():
+    assert move_duration(0, velocity=10.0) == 0.1
+    assert move_duration(-10.0, velocity=5.0) == 2.1
+    assert move_duration(10.0, velocity=5.0, overhead=0) == 2.0
+
+
+def test_poll_intervals():
+    assert [round(value, 4) for value in itertools.islice(poll_intervals(0.5), 3)] == [0.05, 0.075, 0.1125]
+    assert next(poll_intervals(0.0)) == 0.025
+    assert next(poll_intervals(100.0)) == 1.0
+    assert list(itertools.islice(poll_intervals(8.0, maximum=1.0), 3)) == [0.8, 1.0, 1.0]
+
+
+def test_plan_dodge_move():
+    assert plan_dodge_move((1.0, 1.0, 5.0), (1.0, 1.0, 5.0), 0.5) == []
+    assert plan_dodge_move((1.0, 1.0, 0.0), (1.0, 1.0, 5.0), 0.5) == [(1.0, 1.0, 5.0)]
+    assert plan_dodge_move((1.0, 1.0, 5.0), (2.0, 1.0, 5.0), 0.5) == [(1.0, 1.0, 4.5), (2.0, 1.0, 4.5), (2.0, 1.0, 5.0)]
+    assert plan_dodge_move((1.0, 1.0, 5.0), (2.0, 1.0, 4.0), 0.5) == [(1.0, 1.0, 3.5), (2.0, 1.0, 3.5), (2.0, 1.0, 4.0)]
+    assert plan_dodge_move((1.0, 1.0, 0.2), (2.0, 1.0, 5.0), 0.5) == [(1.0, 1.0, 0), (2.0, 1.0, 0), (2.0, 1.0, 5.0)]
+    assert plan_dodge_move((1.0, 1.0, 0.0), (2.0, 1.0, 0.0), 0.5) == [(2.0, 1.0, 0)]
+
+
+def test_deadline():
+    deadline = Deadline(60.0)
+    assert not deadline.expired()
+    assert 0 < deadline.remaining() <= 60.0
+    assert deadline.clamp(1.0) == 1.0
+    deadline = Deadline(0)
+    assert deadline.expired()
+    assert deadline.clamp(1.0) == 0
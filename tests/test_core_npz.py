@@ -0,0 +1,29 @@
+import numpy as np
+
+from pqc.core.npz import load_npz, write_npz
+
+
+def test_npz(tmp_path):
+    filename = str(tmp_path / "data.npz")
+    columns = {
+        "voltage": np.array([0.0, -10.0, -20.0]),
+        "current": [1e-9, 2e-9, float("nan")],
+        "empty": np.empty(0),
+    }
+    header = {"meta": {"sample_name": "spam", "tags": ["a", "b"]}, "series_units": {"voltage": "V"}, "analysis": {}}
+    with open(filename, "wb") as fp:
+        write_npz(fp, columns, header)
+    data = load_npz(filename)
+    assert data["meta"] == header["meta"]
+    assert data["series_units"] == header["series_units"]
+    assert data["analysis"] == {}
+    assert list(data["series"]) == ["voltage", "current", "empty"]
+    assert data["series"]["voltage"].tolist() == [0.0, -10.0, -20.0]
+    assert data["series"]["current"][:2].tolist() == [1e-9, 2e-9]
+    assert np.isnan(data["series"]["current"][2])
+    assert data["series"]["voltage"].dtype == np.float64
+    assert not data["series"]["voltage"].flags.writeable
+    assert len(data["series"]["empty"]) == 0
+    # Readable by NumPy
+    with np.load(filename) as npz:
+        assert npz["voltage"].tolist() == [0.0, -10.0, -20.0]
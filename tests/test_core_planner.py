@@ -0,0 +1,74 @@
+import pytest
+
+from pqc.core.planner import (
+    TABLE_MOVE_KEY,
+    SequenceEstimate,
+    SequencePlanner,
+    TimingHistory,
+    plan_measurement,
+)
+
+
+class Item:
+
+    def __init__(self, item_type, children=None, parameters=None, position=True):
+        self.item_type = item_type
+        self._children = children or []
+        self.parameters = parameters or {}
+        self._position = position
+
+    def children(self):
+        return list(self._children)
+
+    def isEnabled(self):
+        return True
+
+    def hasPosition(self):
+        return self._position
+
+
+def test_plan_measurement():
+    parameters = {"voltage_start": 0, "voltage_stop": 10, "voltage_step": 1, "waiting_time": 1}
+    assert plan_measurement("iv_ramp", parameters) == (11, 12.0)
+    parameters.update({"voltage_start": -5, "waiting_time_before": 0.5, "waiting_time_after": 0.1})
+    points, waiting = plan_measurement("iv_ramp", parameters)
+    assert points == 16
+    assert waiting == pytest.approx(16 + 5 * 0.5 + 10 * 0.1)
+    parameters.update({"elm_integration_rate": 50, "elm_filter_enable": True, "elm_filter_count": 10})
+    points, waiting = plan_measurement("iv_ramp_elm", parameters)
+    assert waiting == pytest.approx(16 + 5 * 0.5 + 10 * 0.1 + 16 * 1.0)
+    # Default integration rate of electrometer measurements
+    parameters = {"voltage_start": 0, "voltage_stop": 10, "voltage_step": 1, "waiting_time": 1}
+    points, waiting = plan_measurement("iv_ramp_elm", parameters)
+    assert waiting == pytest.approx(12 + 11 * 6.0 / 50)
+    assert plan_measurement("frequency_scan", {}) == (0, 0.0)
+
+
+def test_timing_history():
+    history = TimingHistory()
+    assert history.overhead(TABLE_MOVE_KEY) == 20.0
+    assert history.overhead("iv_ramp", 10) == 12.5
+    history.record("iv_ramp", 30.0, points=10, waiting=10.0)
+    history.record("iv_ramp", 50.0, points=20, waiting=20.0)
+    assert history.overhead("iv_ramp", 10) == pytest.approx(20.0)
+    assert history.overhead("iv_ramp", 30) == pytest.approx(40.0)
+    restored = TimingHistory.from_dict(history.to_dict())
+    assert restored.overhead("iv_ramp", 30) == pytest.approx(40.0)
+
+
+def test_sequence_estimate():
+    history = TimingHistory()
+    history.record(TABLE_MOVE_KEY, 5.0)
+    history.record("iv_ramp", 21.0, points=11, waiting=12.0)
+    measurement = Item("iv_ramp", parameters={"voltage_start": 0, "voltage_stop": 10, "voltage_step": 1})
+    contact = Item("contact", [measurement])
+    sample = Item("sample", [contact])
+    steps = SequencePlanner(history).plan(sample, move_to_contact=True)
+    assert steps == [(contact, 5.0), (measurement, pytest.approx(21.0))]
+    assert SequencePlanner(history).plan(sample) == [(measurement, pytest.approx(21.0))]
+    estimate = SequenceEstimate(steps)
+    assert estimate.total == pytest.approx(26.0)
+    estimate.complete(contact)
+    assert estimate.remaining() == pytest.approx(21.0)
+    estimate.complete(measurement)
+    assert estimate.remaining() == 0
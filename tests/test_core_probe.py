@@ -0,0 +1,43 @@
+import threading
+import time
+
+from pqc.core.probe import ProbeResult, run_probes
+
+
+def test_run_probes():
+    event = threading.Event()
+    received = []
+
+    def fail():
+        raise OSError("no route to host")
+
+    def hang():
+        event.wait(5.0)
+
+    probes = {"slow": lambda: time.sleep(0.05) or "slow", "fast": lambda: "fast", "fail": fail, "hang": hang}
+    try:
+        start = time.monotonic()
+        results = run_probes(probes, {"hang": 0.2}, received.append, default_timeout=2.0)
+        elapsed = time.monotonic() - start
+    finally:
+        event.set()
+    assert elapsed < 1.0
+    assert [result.name for result in received][-1] == "hang"
+    assert received.index(results["fast"]) < received.index(results["slow"])
+    assert set(results) == set(probes)
+    assert results["fast"].ok and results["fast"].value == "fast"
+    assert results["slow"].value == "slow"
+    assert results["slow"].latency >= 0.05
+    assert isinstance(results["fail"].error, OSError)
+    assert isinstance(results["hang"].error, TimeoutError)
+    assert not results["hang"].ok
+
+
+def test_run_probes_empty():
+    assert run_probes({}, {}, lambda result: None) == {}
+
+
+def test_probe_result():
+    result = ProbeResult("matrix", "7072", latency=0.5)
+    assert result.ok
+    assert result.latency == 0.5
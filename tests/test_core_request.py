@@ -1,6 +1,9 @@
+import threading
+import time
+
 import pytest
 
-from pqc.core.request import Request, RequestTimeout
+from pqc.core.request import PRIORITY_CRITICAL, PRIORITY_MONITORING, PRIORITY_NORMAL, Request, RequestQueue, RequestTimeout
 
 
 def test_request():
@@ -21,3 +24,54 @@ def test_request_timeout():
     req = Request(lambda: None)
     with pytest.raises(RequestTimeout):
         req.get(timeout=.001)
+
+
+def test_request_queue_priority():
+    queue = RequestQueue()
+    monitoring = queue.put(Request(lambda: "monitoring", PRIORITY_MONITORING))
+    normal = queue.put(Request(lambda: "normal"))
+    critical = queue.put(Request(lambda: "critical", PRIORITY_CRITICAL))
+    assert len(queue) == 3
+    assert queue.get(timeout=.001) is critical
+    assert queue.get(timeout=.001) is normal
+    assert queue.get(timeout=.001) is monitoring
+    assert queue.get(timeout=.001) is None
+    assert len(queue) == 0
+
+
+def test_request_queue_coalesce():
+    queue = RequestQueue()
+    other = queue.put(Request(lambda: "other"))
+    a = queue.put(Request(lambda: 1, PRIORITY_MONITORING, key="pc_data"))
+    b = queue.put(Request(lambda: 2, PRIORITY_CRITICAL, key="pc_data"))
+    assert a is b
+    assert a.priority == PRIORITY_CRITICAL
+    assert len(queue) == 2
+    request = queue.get(timeout=.001)
+    assert request is a
+    request()
+    assert a.get(timeout=.001) == 2
+    assert queue.get(timeout=.001) is other
+    assert queue.get(timeout=.001) is None
+    # Served requests are no longer coalesced
+    c = queue.put(Request(lambda: 3, key="pc_data"))
+    assert c is not a
+    metrics = queue.metrics()
+    assert metrics["depth"] == 1
+    assert metrics["enqueued"] == 4
+    assert metrics["coalesced"] == 1
+    assert metrics["served"] == 2
+    assert metrics["max_depth"] == 2
+    assert set(metrics["latency"]) == {PRIORITY_CRITICAL, PRIORITY_NORMAL}
+    assert metrics["latency"][PRIORITY_NORMAL]["count"] == 1
+    queue.reset_metrics()
+    assert queue.metrics()["served"] == 0
+
+
+def test_request_queue_wait():
+    queue = RequestQueue()
+    request = Request(lambda: 42)
+    thread = threading.Thread(target=lambda: (time.sleep(.01), queue.put(request)))
+    thread.start()
+    assert queue.get(timeout=5.0) is request
+    thread.join()
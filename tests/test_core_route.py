@@ -0,0 +1,48 @@
+import pytest
+
+from pqc.core.route import (
+    nearest_neighbour_route,
+    optimize_route,
+    route_length,
+    travel_distance,
+    two_opt_route,
+)
+
+
+def test_travel_distance():
+    assert travel_distance((0, 0), (0, 0)) == 0
+    assert travel_distance((0, 0, 1), (3, -4, 2)) == 4
+
+
+def test_route_length():
+    points = [(0, 0), (10, 0), (1, 0)]
+    assert route_length([]) == 0
+    assert route_length(points) == 19
+    assert route_length(points, [0, 2, 1]) == 10
+    assert route_length(points, [2, 1], start=(0, 0)) == 10
+
+
+def test_nearest_neighbour_route():
+    points = [(0, 0), (10, 0), (1, 0), (9, 0)]
+    assert nearest_neighbour_route(points) == [0, 2, 3, 1]
+    assert nearest_neighbour_route(points, start=(10, 0)) == [1, 3, 2, 0]
+    assert nearest_neighbour_route(points, start=(10, 0), precedence=[(0, 3)]) == [1, 2, 0, 3]
+    with pytest.raises(ValueError):
+        nearest_neighbour_route(points, precedence=[(0, 1), (1, 0)])
+
+
+def test_two_opt_route():
+    points = [(0, 0), (1, 0), (2, 0), (3, 0)]
+    assert two_opt_route(points, [0, 2, 1, 3]) == [0, 1, 2, 3]
+    assert two_opt_route(points, [0, 2, 1, 3], precedence=[(2, 1)]) == [0, 2, 1, 3]
+
+
+def test_optimize_route():
+    assert optimize_route([]) == []
+    assert optimize_route([(0, 0), (10, 0), (1, 0)], start=(0, 0)) == [0, 2, 1]
+    # Keep original order if not longer
+    assert optimize_route([(0, 0), (1, 0), (2, 0)]) == [0, 1, 2]
+    grid = [(x, y) for x in range(5) for y in (0, 4, 2, 1, 3)]
+    route = optimize_route(grid, start=(0, 0))
+    assert sorted(route) == list(range(len(grid)))
+    assert route_length(grid, route, start=(0, 0)) < route_length(grid, start=(0, 0))
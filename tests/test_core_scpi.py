@@ -0,0 +1,58 @@
+import pytest
+
+from pqc.core.scpi import batch_commands, group_commands, normalize_command, write_batch
+
+
+def test_normalize_command():
+    assert normalize_command("*RST") == "*RST"
+    assert normalize_command(":SENS:NPLC 1") == ":SENS:NPLC 1"
+    assert normalize_command("TRIG:IMM") == ":TRIG:IMM"
+    assert normalize_command("  ") == ""
+
+
+def test_batch_commands():
+    assert batch_commands([]) == []
+    assert batch_commands(["*RST", "", "*CLS"]) == ["*RST;*CLS"]
+    assert batch_commands(["*CLS", ":SENS:NPLC 1", "TRIG:SOUR BUS"]) == ["*CLS;:SENS:NPLC 1;:TRIG:SOUR BUS"]
+    assert batch_commands([":A 1", ":B 2", ":C 3"], max_length=9) == [":A 1;:B 2", ":C 3"]
+    assert batch_commands([":LONG:COMMAND 1", ":B 2"], max_length=8) == [":LONG:COMMAND 1", ":B 2"]
+
+
+def test_group_commands():
+    assert group_commands([]) == []
+    assert group_commands([":A 1", ":B 2", "C 3"], max_length=9) == [[":A 1", ":B 2"], [":C 3"]]
+
+
+class FakeResource:
+
+    def __init__(self, failing):
+        self.failing = failing
+        self.messages = []
+        self.error = False
+
+    def write(self, message):
+        self.messages.append(message)
+        if self.failing in message.split(";"):
+            self.error = True
+
+    def query(self, message):
+        return "1"
+
+    def check_error(self):
+        if self.error:
+            self.error = False
+            raise RuntimeError("Error -113: Undefined header")
+
+
+def test_write_batch():
+    resource = FakeResource(failing=None)
+    write_batch(resource, [":A 1", ":B 2", ":C 3"], resource.check_error, max_length=9)
+    assert resource.messages == [":A 1;:B 2", ":C 3"]
+
+
+def test_write_batch_error():
+    resource = FakeResource(failing=":D 4")
+    with pytest.raises(RuntimeError, match="':D 4'"):
+        write_batch(resource, [":A 1", ":B 2", ":C 3", ":D 4", ":E 5"], resource.check_error, max_length=9)
+    # Only the failing batch is repeated, up to the failing command
+    assert resource.messages == [":A 1;:B 2", ":C 3;:D 4", "*CLS", ":C 3", ":D 4"]
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from pqc.core.series import SeriesStore
+
+
+def test_series_store():
+    series = SeriesStore()
+    series.register("x")
+    series.register("y")
+    with pytest.raises(KeyError):
+        series.register("x")
+    assert list(series) == ["x", "y"]
+    assert series.size == 0
+    assert series["x"].tolist() == []
+    for i in range(100):
+        series.append({"y": i * 2, "x": i})
+    assert series.size == 100
+    assert series.capacity >= 100
+    assert series["x"].tolist() == list(range(100))
+    assert series["y"].tolist() == list(range(0, 200, 2))
+    assert series["x"].dtype == np.float64
+    with pytest.raises(ValueError):
+        series["x"][0] = 42
+    with pytest.raises(KeyError):
+        series.register("z")
+
+
+def test_series_store_reserve():
+    series = SeriesStore()
+    series.register("x")
+    series.reserve(4)
+    assert series.capacity == 4
+    for i in range(4):
+        series.append({"x": i})
+    assert series.capacity == 4
+    series.append({"x": 4})
+    assert series.capacity == 64
+    series.reserve(8)
+    assert series.capacity == 64
+    assert series["x"].tolist() == [0, 1, 2, 3, 4]
+
+
+def test_series_store_inconsistent_keys():
+    series = SeriesStore()
+    series.register("x")
+    series.register("y")
+    with pytest.raises(KeyError):
+        series.append({"x": 1})
+    with pytest.raises(KeyError):
+        series.append({"x": 1, "z": 2})
+    with pytest.raises(KeyError):
+        series.append({"x": 1, "y": 2, "z": 3})
+    assert series.size == 0
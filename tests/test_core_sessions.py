@@ -0,0 +1,129 @@
+import threading
+
+import pytest
+
+from pqc.core.sessions import SessionPool
+
+
+class FakeResource:
+
+    def __init__(self):
+        self.opened = 0
+        self.closed = 0
+        self.healthy = True
+
+    def __enter__(self):
+        self.opened += 1
+        return self
+
+    def __exit__(self, *exc):
+        self.closed += 1
+        return False
+
+    def query(self, message):
+        if not self.healthy:
+            raise OSError("connection reset")
+        return "FAKE,MODEL"
+
+
+def test_session_pool_transient():
+    resource = FakeResource()
+    pool = SessionPool()
+    pool.add("hvsrc", resource)
+    with pool.lease("hvsrc") as res:
+        assert res is resource
+        with pool.lease("hvsrc"):
+            assert resource.opened == 1
+    assert resource.closed == 1
+    with pool.lease("hvsrc"):
+        ...
+    assert resource.opened == 2
+    assert pool.stats() == {"hvsrc": {"opened": 2, "leases": 3}}
+
+
+def test_session_pool_persistent():
+    resource = FakeResource()
+    pool = SessionPool()
+    pool.add("hvsrc", resource)
+    with pool.persistent():
+        assert pool.is_persistent()
+        for _ in range(4):
+            with pool.lease("hvsrc") as res:
+                res.query("*IDN?")
+        assert resource.opened == 1
+        assert resource.closed == 0
+    assert not pool.is_persistent()
+    assert resource.closed == 1
+
+
+def test_session_pool_reconnect():
+    resource = FakeResource()
+    pool = SessionPool(errors=(OSError,))
+    pool.add("hvsrc", resource)
+    with pool.persistent():
+        resource.healthy = False
+        with pytest.raises(OSError):
+            with pool.lease("hvsrc") as res:
+                res.query("*IDN?")
+        assert resource.closed == 1
+        # Other errors keep the session
+        with pytest.raises(RuntimeError):
+            with pool.lease("hvsrc"):
+                raise RuntimeError()
+        assert resource.opened == 2
+        assert resource.closed == 1
+
+
+def test_session_pool_health_check():
+    resource = FakeResource()
+    pool = SessionPool(health_interval=0., errors=(OSError,))
+    pool.add("hvsrc", resource, health_check=lambda res: res.query("*IDN?"))
+    with pool.persistent():
+        with pool.lease("hvsrc"):
+            ...
+        resource.healthy = False
+        with pool.lease("hvsrc"):
+            ...
+        assert resource.opened == 2
+        assert resource.closed == 1
+
+
+def test_session_pool_idle_timeout():
+    lcr, elm = FakeResource(), FakeResource()
+    pool = SessionPool(idle_timeout=0.)
+    pool.add("lcr", lcr)
+    pool.add("elm", elm)
+    with pool.persistent():
+        with pool.lease("lcr"):
+            ...
+        with pool.lease("elm"):
+            assert lcr.closed == 1
+        pool.close_idle()
+        assert elm.closed == 1
+
+
+def test_session_pool_serialized():
+    resource = FakeResource()
+    pool = SessionPool()
+    pool.add("matrix", resource)
+    leased = threading.Event()
+    release = threading.Event()
+
+    def hold():
+        with pool.lease("matrix"):
+            leased.set()
+            release.wait(5.0)
+
+    thread = threading.Thread(target=hold)
+    thread.start()
+    leased.wait(5.0)
+    assert not pool.session("matrix").lock.acquire(blocking=False)
+    with pytest.raises(TimeoutError):
+        with pool.lease("matrix", timeout=.01):
+            ...
+    release.set()
+    thread.join()
+    with pool.lease("matrix"):
+        ...
+    with pytest.raises(KeyError):
+        pool.session("lcr")
@@ -0,0 +1,24 @@
+import time
+
+from pqc.core.snapshot import Snapshot, SnapshotSlot
+
+
+def test_snapshot():
+    snapshot = Snapshot(42, timestamp=1e9, monotonic=time.monotonic() - 3.0)
+    assert snapshot.value == 42
+    assert snapshot.timestamp == 1e9
+    assert 3.0 <= snapshot.age() < 4.0
+
+
+def test_snapshot_slot():
+    slot = SnapshotSlot()
+    assert slot.latest() is None
+    assert slot.get(max_age=60.) is None
+    snapshot = slot.publish({"box_temperature": 21.5})
+    assert slot.latest() is snapshot
+    assert slot.get(max_age=60.) is snapshot
+    snapshot.monotonic -= 10.0
+    assert slot.get(max_age=5.) is None
+    assert slot.latest() is snapshot
+    slot.clear()
+    assert slot.latest() is None
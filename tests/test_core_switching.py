@@ -0,0 +1,94 @@
+import pytest
+
+from pqc.core.switching import SwitchController, SwitchError, channel_delta
+
+
+class FakeChannel:
+
+    def __init__(self):
+        self.closed = set()
+        self.calls = []
+        self.stuck = set()
+
+    def open(self, channels=None):
+        self.calls.append(("open", channels))
+        if channels is None:
+            self.closed.clear()
+        else:
+            self.closed.difference_update(set(channels) - self.stuck)
+
+    def close(self, channels):
+        self.calls.append(("close", channels))
+        self.closed.update(channels)
+
+    def getclose(self):
+        self.calls.append(("getclose", None))
+        return sorted(self.closed)
+
+
+def test_channel_delta():
+    assert channel_delta([], ["1A01"]) == ([], ["1A01"])
+    assert channel_delta(["1A01"], []) == (["1A01"], [])
+    assert channel_delta(["1A01", "1B02"], ["1B02", "1A01"]) == ([], [])
+    assert channel_delta(["1A01", "1B02"], ["1B02", "1C03"]) == (["1A01"], ["1C03"])
+
+
+def test_switch_controller_safe_close():
+    channel = FakeChannel()
+    controller = SwitchController(channel)
+    assert controller.state is None
+    controller.safe_close(["1A01"])
+    assert controller.state == {"1A01"}
+    with pytest.raises(SwitchError):
+        controller.safe_close(["1B02"])
+    assert controller.state is None
+    controller.open_all()
+    assert controller.state == frozenset()
+    assert controller.closed_channels() == []
+
+
+def test_switch_controller_switch():
+    channel = FakeChannel()
+    controller = SwitchController(channel)
+    # Unknown state, full open and verify
+    controller.switch(["1A01", "1B02"])
+    assert channel.calls == [("open", None), ("getclose", None), ("close", ["1A01", "1B02"]), ("getclose", None)]
+    assert controller.state == {"1A01", "1B02"}
+    # Delta with single read back
+    channel.calls.clear()
+    controller.switch(["1B02", "1C03"])
+    assert channel.calls == [("open", ["1A01"]), ("close", ["1C03"]), ("getclose", None)]
+    assert channel.closed == {"1B02", "1C03"}
+    # Unchanged
+    channel.calls.clear()
+    controller.switch(["1C03", "1B02"])
+    assert channel.calls == [("getclose", None)]
+    assert controller.operations == 8
+
+
+def test_switch_controller_fallback():
+    channel = FakeChannel()
+    controller = SwitchController(channel)
+    controller.switch(["1A01"])
+    # Relay changed behind the controller's back
+    channel.closed.add("1D04")
+    channel.calls.clear()
+    controller.switch(["1B02"])
+    assert channel.calls[:3] == [("open", ["1A01"]), ("close", ["1B02"]), ("getclose", None)]
+    assert channel.calls[3] == ("open", None)
+    assert channel.closed == {"1B02"}
+    assert controller.state == {"1B02"}
+
+
+def test_switch_controller_error():
+    channel = FakeChannel()
+    controller = SwitchController(channel)
+    controller.open_all()
+
+    def fail(channels):
+        raise OSError()
+
+    channel.close = fail
+    with pytest.raises(OSError):
+        controller.switch(["1A01"])
+    assert controller.state is None